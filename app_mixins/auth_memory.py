@@ -0,0 +1,39 @@
+"""Per-host memory of which browser's cookies a site last needed.
+
+Stored in settings (see :func:`settings.load_host_auth`) so a host that
+demanded sign-in is fetched with the browser that satisfied it, instead of
+failing unauthenticated first and prompting again.  Once the demand is older
+than ``HOST_AUTH_RECHECK_INTERVAL`` one fetch goes without cookies; if that
+succeeds the host is forgotten.
+"""
+
+import time
+
+from constants import HOST_AUTH_RECHECK_INTERVAL
+from downloader import host_key
+from settings import forget_host_auth, load_host_auth, save_host_auth
+
+
+def remembered_browser(url, now=None):
+    """Return the browser that last authenticated *url*'s host, or None if unknown or due a recheck."""
+    entry = load_host_auth(host_key(url))
+    if entry is None or not entry['browser']:
+        return None
+    now = time.time() if now is None else now
+    return entry['browser'] if now - entry['auth_at'] < HOST_AUTH_RECHECK_INTERVAL else None
+
+
+def note_auth_demand(url, now=None):
+    """Record that *url*'s host just asked for authentication."""
+    save_host_auth(host_key(url), auth_at=time.time() if now is None else now)
+
+
+def note_fetch_succeeded(url, browser):
+    """Record a successful fetch of *url* made with *browser*'s cookies (None for none)."""
+    host = host_key(url)
+    if load_host_auth(host) is None:
+        return
+    if browser:
+        save_host_auth(host, browser=browser)
+    else:
+        forget_host_auth(host)
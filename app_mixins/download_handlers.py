@@ -1,14 +1,19 @@
 """Download start/progress/error handlers."""
 
-import os
-
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QMessageBox
 
+from downloader import BatchProgress, describe_progress
 from threads import DownloadThread
 
 from .download_settings import collect_download_settings, resolve_output_path, validate_output_path
 
+_STAGE_LABELS = {
+    'extract': "metadata ready",
+    'transfer': "downloaded",
+    'postprocess': "finished",
+}
+
 
 def _plain_message(parent, icon, title, message):
     """Show a QMessageBox with *message* forced to PlainText rendering.
@@ -28,11 +33,7 @@ class DownloadHandlersMixin:
     """Start downloads and handle progress callbacks."""
 
     def start_download(self):
-        selected_urls = [
-            self.videos_list[i]['url']
-            for i, checkbox in enumerate(self.checkboxes)
-            if checkbox.isChecked()
-        ]
+        selected_urls = [video['url'] for video in self.video_model.checked_videos()]
         if not selected_urls:
             QMessageBox.warning(self, "Error", "Please select at least one video to download")
             return
@@ -42,16 +43,23 @@ class DownloadHandlersMixin:
 
         self.status_label.setText(f"Starting download of {len(selected_urls)} item(s)...")
         self.download_btn.setEnabled(False)
-        self.fetch_btn.setEnabled(False)
+        self.set_fetch_enabled(False)
         self.progress_bar.setValue(0)
 
         output_path = resolve_output_path(self.output_path)
         if not validate_output_path(self, output_path):
             self.download_btn.setEnabled(True)
-            self.fetch_btn.setEnabled(True)
+            self.set_fetch_enabled(True)
             self.status_label.setText("Invalid output directory")
             return
 
+        pending_sync = getattr(self, '_pending_sync', None)
+        sync_state = getattr(self, 'sync_state', None)
+        if pending_sync and sync_state is not None:
+            # The new entries are queued now; the next sync starts after them.
+            sync_state.record(*pending_sync)
+            self._pending_sync = None
+
         resolved_browser = getattr(self, '_fetch_cookies_used', None)
         self.download_thread = DownloadThread(
             selected_urls,
@@ -75,28 +83,109 @@ class DownloadHandlersMixin:
             denoise_video_audio=settings['denoise_video_audio'],
             fetch_lyrics_flag=settings['fetch_lyrics'],
             save_lrc=settings['save_lrc'],
+            max_workers=self.max_parallel_downloads,
+            per_host_limit=self.per_host_limit,
+            job_store=getattr(self, 'job_store', None),
+            archive=self.active_download_archive(),
+            lyrics_cache=getattr(self, 'lyrics_cache', None),
+            governor=getattr(self, 'bandwidth_governor', None),
+            fragment_tuner=getattr(self, 'fragment_tuner', None),
         )
+        self._start_download_thread()
+
+    def active_download_archive(self):
+        """Return the download archive if the user has it enabled, else None."""
+        if not getattr(self, 'use_download_archive', False):
+            return None
+        return getattr(self, 'download_archive', None)
+
+    def _start_download_thread(self):
+        self._batch_progress = BatchProgress(len(self.download_thread.urls))
         self.download_thread.progress.connect(self.on_download_progress)
+        self.download_thread.job_progress.connect(self.on_download_job_progress)
+        self.download_thread.stage_done.connect(self.on_download_stage_done)
         self.download_thread.finished.connect(self.on_download_finished)
         self.download_thread.error.connect(self.on_download_error)
         self.download_thread.start()
 
-    def on_download_progress(self, filename, percent):
-        self.progress_bar.setValue(percent)
-        self.status_label.setText(f"Downloading: {os.path.basename(filename)}")
+    def offer_resume_downloads(self):
+        """Offer to resume batches an earlier session left unfinished."""
+        store = getattr(self, 'job_store', None)
+        batches = store.unfinished_batches() if store else []
+        if not batches:
+            return
+        count = sum(len(batch['jobs']) for batch in batches)
+        reply = QMessageBox.question(
+            self, "Resume Downloads",
+            f"{count} download(s) from a previous session did not finish.\n\n"
+            "Resume them now? Partially downloaded files will be continued.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes,
+        )
+        if reply != QMessageBox.Yes:
+            for batch in batches:
+                store.discard_batch(batch['batch_id'])
+            return
+        self._resume_queue = batches
+        self._resume_next_batch()
+
+    def _resume_next_batch(self):
+        """Start the next queued interrupted batch; return False when none remain."""
+        queue = getattr(self, '_resume_queue', None)
+        if not queue:
+            return False
+        batch = queue.pop(0)
+        urls = [job['url'] for job in batch['jobs']]
+        self.status_label.setText(f"Resuming download of {len(urls)} item(s)...")
+        self.download_btn.setEnabled(False)
+        self.set_fetch_enabled(False)
+        self.progress_bar.setValue(0)
+        self.download_thread = DownloadThread(
+            urls,
+            **batch['settings'],
+            max_workers=self.max_parallel_downloads,
+            per_host_limit=self.per_host_limit,
+            job_store=self.job_store,
+            batch_id=batch['batch_id'],
+            archive=self.active_download_archive(),
+            lyrics_cache=getattr(self, 'lyrics_cache', None),
+            governor=getattr(self, 'bandwidth_governor', None),
+            fragment_tuner=getattr(self, 'fragment_tuner', None),
+        )
+        self._start_download_thread()
+        return True
+
+    def on_download_progress(self, message, percent):
+        # Per-item messages carry that item's percent; the bar shows the
+        # whole batch (see on_download_job_progress).
+        self.status_label.setText(message)
+
+    def on_download_job_progress(self, progress):
+        self.progress_bar.setValue(self._batch_progress.update(progress))
+        self.status_label.setText(f"Item {progress['index']}: {describe_progress(progress)}")
+
+    def on_download_stage_done(self, stage, index):
+        if stage == 'postprocess':
+            self.progress_bar.setValue(self._batch_progress.complete(index))
+        self.statusBar().showMessage(f"Item {index}: {_STAGE_LABELS.get(stage, stage)}")
 
     def on_download_finished(self, message):
+        if self._resume_next_batch():
+            return
         self.download_btn.setEnabled(True)
-        self.fetch_btn.setEnabled(True)
+        self.set_fetch_enabled(True)
         self.progress_bar.setValue(100)
         self.status_label.setText(message)
         self.statusBar().showMessage("All downloads completed!")
         _plain_message(self, QMessageBox.Information, "Success", message)
 
     def on_download_error(self, error):
-        self.download_btn.setEnabled(True)
-        self.fetch_btn.setEnabled(True)
         self.progress_bar.setValue(0)
         self.status_label.setText("Download failed")
         self.statusBar().showMessage("Download failed - check error message")
         _plain_message(self, QMessageBox.Critical, "Error", error)
+        # A failed batch stays journalled; the batches queued after it still run.
+        if self._resume_next_batch():
+            return
+        self.download_btn.setEnabled(True)
+        self.set_fetch_enabled(True)
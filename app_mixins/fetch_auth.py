@@ -7,9 +7,10 @@ from PyQt5.QtWidgets import QMessageBox
 
 from browser_utils import detect_available_browsers, get_browsers_with_youtube_cookies
 from constants import drm_display_name, is_drm_host
-from extractors import is_youtube_url, platform_name_for_url
+from extractors import is_auth_error, is_youtube_url, platform_name_for_url, shared_cookie_jars
 from threads import URLScraperThread
 
+from .auth_memory import note_auth_demand, note_fetch_succeeded, remembered_browser
 from .cookie_errors import parse_cookie_error
 
 
@@ -32,7 +33,7 @@ def _critical_plain(parent, title, message):
 class FetchAuthMixin:
     """Fetch videos and handle authentication retries."""
 
-    def fetch_videos(self, *, _auth_retry=False):
+    def fetch_videos(self, *, refresh=False, _auth_retry=False, _resume=None):
         url = self.url_input.text().strip()
         if not url:
             QMessageBox.warning(self, "Error", "Please enter a URL")
@@ -70,34 +71,87 @@ class FetchAuthMixin:
         is_youtube = is_youtube_url(url)
 
         resolved_browser = None
+        note = ""
         if self.browser_preference not in ('auto', 'none'):
             resolved_browser = self.browser_preference
+        elif self.browser_preference == 'auto' and not _auth_retry:
+            # Skip the failing unauthenticated attempt on hosts known to need a login.
+            resolved_browser = remembered_browser(url)
+            note = " (worked last time)" if resolved_browser else ""
 
         platform = platform_name_for_url(url)
 
         if is_youtube:
-            if self.browser_preference not in ('auto', 'none') and resolved_browser:
+            if resolved_browser:
                 cookies_from_browser = resolved_browser
-                self.status_label.setText(f"Fetching with {resolved_browser.title()} authentication...")
+                self.status_label.setText(f"Fetching with {resolved_browser.title()} authentication{note}...")
             else:
                 self.status_label.setText("Fetching video information (no authentication)...")
-        elif self.browser_preference not in ('auto', 'none') and resolved_browser:
+        elif resolved_browser:
             cookies_from_browser = resolved_browser
-            self.status_label.setText(f"Fetching from {platform} with {resolved_browser.title()} authentication...")
+            self.status_label.setText(
+                f"Fetching from {platform} with {resolved_browser.title()} authentication{note}..."
+            )
         else:
             self.status_label.setText(f"Fetching from {platform}...")
 
         self.statusBar().showMessage(f"Connecting to {platform}...")
-        self.fetch_btn.setEnabled(False)
+        self.set_fetch_enabled(False)
         self.download_btn.setEnabled(False)
-        self.clear_videos_list()
-
-        self.scraper_thread = URLScraperThread(url, cookies_from_browser=cookies_from_browser)
+        if not _resume:
+            self.clear_videos_list()
+
+        sync_box = getattr(self, 'sync_checkbox', None)
+        sync = sync_box is not None and sync_box.isChecked()
+        self._pending_sync = None
+        self.scraper_thread = URLScraperThread(
+            url,
+            cookies_from_browser=cookies_from_browser,
+            cache=getattr(self, 'fetch_cache', None),
+            refresh=refresh,
+            sync_state=getattr(self, 'sync_state', None) if sync else None,
+            resume=_resume,
+        )
         self._fetch_cookies_used = cookies_from_browser
+        self.scraper_thread.batch.connect(self.on_videos_batch)
         self.scraper_thread.finished.connect(self.on_videos_fetched)
         self.scraper_thread.error.connect(self.on_fetch_error)
         self.scraper_thread.start()
 
+    def set_fetch_enabled(self, enabled):
+        """Enable or disable the Fetch and Refresh buttons together."""
+        self.fetch_btn.setEnabled(enabled)
+        refresh_btn = getattr(self, 'refresh_btn', None)
+        if refresh_btn is not None:
+            refresh_btn.setEnabled(enabled)
+
+    def refresh_videos(self):
+        """Fetch the current URL again, bypassing the fetch cache."""
+        self.fetch_videos(refresh=True)
+
+    def remember_fetch_auth(self):
+        """Update the host's auth memory after a successful fetch."""
+        scraper = getattr(self, 'scraper_thread', None)
+        if scraper is None or getattr(scraper, 'from_cache', False):
+            return
+        note_fetch_succeeded(scraper.url, getattr(self, '_fetch_cookies_used', None))
+
+    def _retry_fetch_with_browser(self, browser):
+        """Fetch the current URL again with *browser*'s freshly loaded cookies.
+
+        Entries the failed fetch already listed stay in the list and the
+        retry continues after them.
+        """
+        shared_cookie_jars.invalidate(browser)
+        scraper = getattr(self, 'scraper_thread', None)
+        listed = getattr(scraper, 'videos', None)
+        resume = list(listed) if listed and scraper.url == self.url_input.text().strip() else None
+        original_preference = self.browser_preference
+        self.browser_preference = browser
+        self.status_label.setText(f"Retrying with {browser} authentication...")
+        self.fetch_videos(refresh=True, _auth_retry=True, _resume=resume)
+        self.browser_preference = original_preference
+
     def parse_cookie_error(self, error):
         return parse_cookie_error(error)
 
@@ -109,10 +163,26 @@ class FetchAuthMixin:
             or ('bot' in error_lower and 'youtube' in error_lower)
         )
 
-        is_youtube = is_youtube_url(self.url_input.text().strip())
+        url = self.url_input.text().strip()
+        is_youtube = is_youtube_url(url)
+
+        used_cookies = getattr(self, '_fetch_cookies_used', None)
+        if is_bot_error or is_auth_error(error):
+            note_auth_demand(url)
+            # Cookies that were sent may be stale (signed out, rotated): reload
+            # them from the browser on next use.
+            if used_cookies:
+                shared_cookie_jars.invalidate(used_cookies)
 
         if is_youtube and is_bot_error and not self._youtube_auth_handled:
             self._youtube_auth_handled = True
+            # An unauthenticated recheck failed: the host still needs the
+            # login the user already agreed to, so retry without asking.
+            remembered = remembered_browser(url) if not used_cookies and self.browser_preference == 'auto' else None
+            if remembered:
+                self._retry_fetch_with_browser(remembered)
+                return
+
             browsers_with_youtube = get_browsers_with_youtube_cookies()
 
             if browsers_with_youtube:
@@ -128,15 +198,11 @@ class FetchAuthMixin:
                 )
 
                 if reply == QMessageBox.Yes:
-                    original_preference = self.browser_preference
-                    self.browser_preference = browser
-                    self.status_label.setText(f"Retrying with {browser} authentication...")
-                    self.fetch_videos(_auth_retry=True)
-                    self.browser_preference = original_preference
+                    self._retry_fetch_with_browser(browser)
                     return
 
                 self._youtube_auth_handled = False
-                self.fetch_btn.setEnabled(True)
+                self.set_fetch_enabled(True)
                 self.status_label.setText("Authentication declined")
                 self.statusBar().showMessage("YouTube authentication required")
                 return
@@ -162,7 +228,7 @@ class FetchAuthMixin:
                     f"Technical details: {error[:200]}"
                 )
 
-            self.fetch_btn.setEnabled(True)
+            self.set_fetch_enabled(True)
             self.status_label.setText("Authentication required")
             self.statusBar().showMessage("YouTube authentication required")
             box = QMessageBox(self)
@@ -174,7 +240,7 @@ class FetchAuthMixin:
             return
 
         self._youtube_auth_handled = False
-        self.fetch_btn.setEnabled(True)
+        self.set_fetch_enabled(True)
         self.status_label.setText("Error fetching videos")
         self.statusBar().showMessage("Failed to fetch videos")
 
@@ -5,12 +5,13 @@ import os
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QIcon, QPixmap
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
@@ -19,8 +20,10 @@ from constants import (
     APP_NAME,
     APP_SUBTITLE,
     BTN_FETCH,
+    BTN_REFRESH,
     BTN_SELECT_ALL,
     BTN_SELECT_NONE,
+    CHECK_SYNC_NEW_ONLY,
     GROUP_AVAILABLE_VIDEOS,
     GROUP_ENTER_URL,
     GROUP_FILENAME_TEMPLATE,
@@ -37,7 +40,7 @@ from constants import (
     SHORTCUT_PREFERENCES,
     STATUS_READY,
 )
-from ui_widgets import FlowLayout, make_circular_pixmap
+from ui_widgets import FlowLayout, VideoItemDelegate, VideoListModel, make_circular_pixmap
 
 
 class UILayoutMixin:
@@ -113,6 +116,17 @@ class UILayoutMixin:
         self.fetch_btn = QPushButton(BTN_FETCH)
         self.fetch_btn.clicked.connect(self.fetch_videos)
         url_input_layout.addWidget(self.fetch_btn)
+
+        self.refresh_btn = QPushButton(BTN_REFRESH)
+        self.refresh_btn.setToolTip("Fetch again, ignoring the results cached from a recent fetch")
+        self.refresh_btn.clicked.connect(self.refresh_videos)
+        url_input_layout.addWidget(self.refresh_btn)
+
+        self.sync_checkbox = QCheckBox(CHECK_SYNC_NEW_ONLY)
+        self.sync_checkbox.setToolTip(
+            "List only entries added since this channel or playlist was last downloaded in this mode"
+        )
+        url_input_layout.addWidget(self.sync_checkbox)
         url_layout.addLayout(url_input_layout)
         url_group.setLayout(url_layout)
         main_layout.addWidget(url_group)
@@ -122,16 +136,18 @@ class UILayoutMixin:
         videos_group = QGroupBox(GROUP_AVAILABLE_VIDEOS)
         videos_layout = QVBoxLayout()
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMinimumHeight(120)
-        scroll.setMaximumHeight(180)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        self.videos_container = QWidget()
-        self.videos_container_layout = QVBoxLayout(self.videos_container)
-        scroll.setWidget(self.videos_container)
-        videos_layout.addWidget(scroll)
+        # Model/view list: rows are painted on demand, so tens of thousands
+        # of entries cost no widgets.
+        self.video_model = VideoListModel(self)
+        self.videos_view = QListView()
+        self.videos_view.setModel(self.video_model)
+        self.videos_view.setItemDelegate(VideoItemDelegate(self.videos_view))
+        self.videos_view.setUniformItemSizes(True)
+        self.videos_view.setTextElideMode(Qt.ElideRight)
+        self.videos_view.setMinimumHeight(120)
+        self.videos_view.setMaximumHeight(180)
+        self.videos_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        videos_layout.addWidget(self.videos_view)
 
         select_layout = QHBoxLayout()
         self.select_all_btn = QPushButton(BTN_SELECT_ALL)
@@ -5,8 +5,8 @@ from PyQt5.QtWidgets import (
     QFileDialog,
 )
 
+from extractors import shared_info_cache
 from settings import save_output_path
-from ui_widgets import VideoCheckbox
 
 
 class VideosListMixin:
@@ -22,52 +22,74 @@ class VideosListMixin:
 
     def clear_videos_list(self):
         """Clear the videos list"""
-        for checkbox in self.checkboxes:
-            self.videos_container_layout.removeWidget(checkbox)
-            checkbox.deleteLater()
-        self.checkboxes = []
-        self.videos_list = []
+        self.video_model.clear()
+
+    def on_videos_batch(self, videos):
+        """Show entries as they arrive while a playlist or channel is still paging."""
+        self._append_videos(videos)
+        self.select_all_btn.setEnabled(True)
+        self.select_none_btn.setEnabled(True)
+        if not self._download_running():
+            self.download_btn.setEnabled(True)
+        self.status_label.setText(f"Found {self.video_model.rowCount()} video(s) so far...")
 
     def on_videos_fetched(self, videos):
         """Handle fetched videos"""
         self._youtube_auth_handled = False
-        self.videos_list = videos
-        self.fetch_btn.setEnabled(True)
+        self.remember_fetch_auth()
+        # Entries already shown by on_videos_batch arrive again here, in order.
+        self._append_videos(videos[self.video_model.rowCount():])
+        if not self._download_running():
+            self.set_fetch_enabled(True)
 
+        scraper = getattr(self, 'scraper_thread', None)
+        syncing = getattr(scraper, 'sync_state', None) is not None
+        if syncing:
+            # Recorded when these entries are queued for download (start_download).
+            self._pending_sync = (scraper.url, scraper.sync_ids) if videos else None
+
+        if not videos and syncing:
+            self.status_label.setText("No new uploads since the last sync")
+            self.statusBar().showMessage("Nothing new to download")
+            return
         if not videos:
             self.status_label.setText("No videos found")
             self.statusBar().showMessage("No videos found at the provided URL")
             return
 
-        # Create checkboxes for each video
-        for video in videos:
-            duration = video.get('duration', 0)
-            if duration:
-                hours = duration // 3600
-                minutes = (duration % 3600) // 60
-                seconds = duration % 60
-                duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            else:
-                duration_str = "N/A"
-
-            checkbox_text = f"{video['title']}\nUploader: {video.get('uploader', 'Unknown')} | Duration: {duration_str}"
-            checkbox = VideoCheckbox(checkbox_text)
-            checkbox.setChecked(True)
-            self.videos_container_layout.addWidget(checkbox)
-            self.checkboxes.append(checkbox)
-
         self.select_all_btn.setEnabled(True)
         self.select_none_btn.setEnabled(True)
-        self.download_btn.setEnabled(True)
-        self.status_label.setText(f"Found {len(videos)} video(s)")
-        self.statusBar().showMessage(f"Successfully loaded {len(videos)} video(s)")
+        if not self._download_running():
+            self.download_btn.setEnabled(True)
+        found = f"Found {len(videos)} new video(s) since the last sync" if syncing else f"Found {len(videos)} video(s)"
+        archived_count = self.video_model.selection.archived_count
+        if archived_count:
+            found += f" ({archived_count} already downloaded)"
+        self.status_label.setText(found)
+        if getattr(scraper, 'from_cache', False):
+            self.statusBar().showMessage(f"Loaded {len(videos)} video(s) from a recent fetch (Refresh to fetch again)")
+        else:
+            self.statusBar().showMessage(f"Successfully loaded {len(videos)} video(s)")
+
+    def _download_running(self):
+        thread = getattr(self, 'download_thread', None)
+        return thread is not None and thread.isRunning()
+
+    def _append_videos(self, videos):
+        """Add rows for *videos*; already-downloaded ones start unchecked."""
+        if not videos:
+            return
+        archive = self.active_download_archive()
+        archived = [
+            archive is not None and archive.contains(*shared_info_cache.handle(video['url']))
+            for video in videos
+        ]
+        self.video_model.append_videos(videos, archived)
 
     def select_all(self):
-        """Select all checkboxes"""
-        for checkbox in self.checkboxes:
-            checkbox.setChecked(True)
+        """Select all videos"""
+        self.video_model.set_all_checked(True)
 
     def select_none(self):
-        """Deselect all checkboxes"""
-        for checkbox in self.checkboxes:
-            checkbox.setChecked(False)
+        """Deselect all videos"""
+        self.video_model.set_all_checked(False)
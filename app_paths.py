@@ -0,0 +1,33 @@
+"""Per-user data and cache directories (XDG base directories on Linux)."""
+
+import os
+
+APP_DIR_NAME = "av-morning-star"
+
+
+def _xdg_dir(env_var, fallback):
+    base = os.environ.get(env_var) or os.path.expanduser(fallback)
+    path = os.path.join(base, APP_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_dir():
+    """Return (creating if needed) the directory for durable app state."""
+    return _xdg_dir('XDG_DATA_HOME', '~/.local/share')
+
+
+def cache_dir():
+    """Return (creating if needed) the directory for disposable caches."""
+    return _xdg_dir('XDG_CACHE_HOME', '~/.cache')
+
+
+def add_deno_to_path():
+    """Put ``~/.deno/bin`` on PATH if Deno is installed there.
+
+    yt-dlp needs a JavaScript runtime to generate YouTube PO tokens.
+    """
+    deno_path = os.path.expanduser('~/.deno/bin')
+    if os.path.exists(deno_path) and deno_path not in os.environ.get('PATH', ''):
+        os.environ['PATH'] = f"{deno_path}:{os.environ.get('PATH', '')}"
+        os.environ['DENO_INSTALL'] = os.path.expanduser('~/.deno')
@@ -0,0 +1,7 @@
+"""Headless entry point for AV Morning Star (``python -m avmorningstar``).
+
+Drives the same extractors and :class:`downloader.DownloadEngine` as the GUI
+without importing PyQt5.  Heavy modules (yt-dlp, the extractors, the engine)
+are imported only once a download actually starts, so ``--help`` and argument
+errors return immediately.
+"""
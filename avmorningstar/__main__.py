@@ -0,0 +1,11 @@
+"""Run the headless downloader: ``python -m avmorningstar --help``."""
+
+import os
+import sys
+
+# The app's modules live at the repository root, next to this package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from avmorningstar.cli import main  # noqa: E402
+
+sys.exit(main())
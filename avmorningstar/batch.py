@@ -0,0 +1,115 @@
+"""Unattended batch runs: URL lists in, JSON-lines events out.
+
+Every event is one JSON object per line on the output stream, flushed
+immediately, with an ``event`` key:
+
+* ``fetched`` / ``fetch_error``: an input URL was expanded into entries
+  (``url``, ``entries``) or could not be (``url``, ``error``);
+* ``message``: a batch status line from the engine (``message``, ``percent``);
+* ``progress``: a per-job :func:`downloader.progress_snapshot` plus ``url``;
+* ``stage``: a job finished ``extract``, ``transfer`` or ``postprocess``;
+* ``done``: totals (``successful``, ``skipped``, ``failed`` list,
+  ``lyrics_errors``, ``fetch_errors``, ``cancelled``).
+"""
+
+import json
+import sys
+import threading
+
+
+def read_url_lists(urls=(), files=(), stdin=None):
+    """Return input URLs from *urls* and URL-list *files*, de-duplicated, in order.
+
+    List files hold one URL per line; blank lines and lines starting with
+    ``#`` or ``;`` are ignored, as in yt-dlp batch files.  ``-`` reads *stdin*.
+    """
+    collected = [url.strip() for url in urls if url.strip()]
+    for path in files:
+        if path == '-':
+            lines = (stdin or sys.stdin).read().splitlines()
+        else:
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        collected.extend(
+            line.strip() for line in lines
+            if line.strip() and not line.lstrip().startswith(('#', ';'))
+        )
+    return list(dict.fromkeys(collected))
+
+
+class JsonLinesReporter:
+    """Thread-safe writer of one JSON event per line."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        line = json.dumps({'event': event, **fields}, ensure_ascii=False, default=str)
+        with self._lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+
+
+def expand_inputs(inputs, reporter, cookies_from_browser=None, sync_state=None, batch_size=100):
+    """Resolve each input URL to its entries, as the GUI's Fetch does.
+
+    Returns ``(targets, synced, failed_inputs)``: entry URLs to download (in
+    order, without duplicates), ``{input_url: [(entry_url, entry_id), ...]}``
+    for sync mode, and the input URLs that could not be expanded.
+    """
+    from extractors import get_extractor, video_id
+
+    targets, synced, failed_inputs = [], {}, []
+    for url in inputs:
+        stop_at = sync_state.known_ids(url) if sync_state is not None else None
+        try:
+            extractor = get_extractor(url, cookies_from_browser=cookies_from_browser)
+            videos = [video for batch in extractor.iter_video_batches(batch_size, stop_at=stop_at) for video in batch]
+        except Exception as e:  # noqa: BLE001 — one bad input must not end an unattended run
+            reporter.emit('fetch_error', url=url, error=str(e))
+            failed_inputs.append(url)
+            continue
+        reporter.emit('fetched', url=url, entries=len(videos))
+        targets.extend(video['url'] for video in videos)
+        if sync_state is not None:
+            synced[url] = [(video['url'], video_id(video)) for video in videos]
+    return list(dict.fromkeys(targets)), synced, failed_inputs
+
+
+def record_synced(sync_state, synced, failed_urls):
+    """Advance each input's sync point, but never past an entry that failed.
+
+    Listings are newest first and a sync stops at the first known ID, so
+    only the entries older than the oldest failure are recorded; the next
+    sync lists every failed entry again, along with the newer ones that
+    succeeded (which the download archive then skips).
+    """
+    failed = set(failed_urls)
+    for url, entries in synced.items():
+        last_failure = max((i for i, (entry_url, _) in enumerate(entries) if entry_url in failed), default=-1)
+        sync_state.record(url, [entry_id for _, entry_id in entries[last_failure + 1:]])
+
+
+def run_batch(targets, reporter, should_stop, **engine_kwargs):
+    """Download *targets* with a :class:`downloader.DownloadEngine`; return the ``done`` event fields."""
+    if not targets:
+        return {'successful': 0, 'skipped': 0, 'failed': [], 'lyrics_errors': [], 'cancelled': should_stop()}
+    from downloader import DownloadEngine
+
+    engine = DownloadEngine(
+        targets,
+        on_progress=lambda message, percent: reporter.emit('message', message=message, percent=percent),
+        on_job_progress=lambda p: reporter.emit('progress', url=targets[p['index'] - 1], **p),
+        on_stage_done=lambda stage, index, url: reporter.emit('stage', stage=stage, index=index, url=url),
+        should_stop=should_stop,
+        **engine_kwargs,
+    )
+    successful, failed_urls = engine.run()
+    return {
+        'successful': successful,
+        'skipped': engine.skipped,
+        'failed': [{'url': url, 'error': error} for url, error in failed_urls],
+        'lyrics_errors': [{'path': path, 'error': error} for path, error in engine.lyrics_errors],
+        'cancelled': should_stop(),
+    }
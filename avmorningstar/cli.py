@@ -0,0 +1,158 @@
+"""Command-line interface for unattended downloads (cron, systemd timers, scripts).
+
+Only the standard library and :mod:`constants` are imported at module level;
+the extractors, yt-dlp and the download engine load once the run starts.
+
+Exit status: 0 when every item downloaded (or was already archived), 1 when
+any input or item failed, 2 on usage errors, 130 when interrupted.
+"""
+
+import argparse
+import os
+import signal
+import threading
+
+from constants import (
+    APP_FULL_TITLE,
+    DEFAULT_AUDIO_QUALITY,
+    DEFAULT_MAX_PARALLEL_DOWNLOADS,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_PER_HOST_DOWNLOADS,
+    DEFAULT_PROGRESS_RATE_HZ,
+    FETCH_BATCH_SIZE,
+)
+
+from .batch import JsonLinesReporter, expand_inputs, read_url_lists, record_synced, run_batch
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_CANCELLED = 130
+
+AUDIO_CODEC_CHOICES = ('mp3', 'aac', 'flac', 'opus', 'm4a', 'wav', 'alac', 'vorbis')
+VIDEO_CONTAINER_CHOICES = ('mp4', 'mkv', 'webm', 'avi', 'mov', 'flv')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m avmorningstar',
+        description=f'{APP_FULL_TITLE}: download without the GUI, reporting progress as JSON lines on stdout.',
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help='video, playlist, channel or feed URLs')
+    parser.add_argument('-a', '--batch-file', action='append', default=[], metavar='FILE',
+                        help="file with one URL per line ('#' comments allowed); '-' reads stdin; repeatable")
+    parser.add_argument('-o', '--output', default=os.path.expanduser(DEFAULT_OUTPUT_DIR),
+                        help='output directory (default: %(default)s)')
+    parser.add_argument('-f', '--format', choices=('video', 'audio'), default='video', dest='format_type')
+    parser.add_argument('--quality', default='best', help='video quality, e.g. best, 1080p, 720p')
+    parser.add_argument('--container', choices=VIDEO_CONTAINER_CHOICES, default='mp4')
+    parser.add_argument('--audio-codec', choices=AUDIO_CODEC_CHOICES, default='mp3')
+    parser.add_argument('--audio-quality', default=DEFAULT_AUDIO_QUALITY,
+                        help="audio bitrate in kbps, or 0 for lossless (default: %(default)s)")
+    parser.add_argument('-t', '--template', default='%(title)s.%(ext)s',
+                        help='yt-dlp output filename template (default: %(default)s)')
+    parser.add_argument('--cookies-from-browser', metavar='BROWSER',
+                        help='read login cookies from this browser (e.g. firefox, chrome)')
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=DEFAULT_MAX_PARALLEL_DOWNLOADS,
+                        help='parallel downloads (default: %(default)s)')
+    parser.add_argument('--per-host', type=_positive_int, default=DEFAULT_PER_HOST_DOWNLOADS,
+                        help='parallel downloads per host (default: %(default)s)')
+    parser.add_argument('--limit-rate', type=_positive_int, metavar='KIB',
+                        help='total bandwidth cap in KiB/s')
+    parser.add_argument('--no-archive', action='store_true',
+                        help='download items again even if the download archive has them')
+    parser.add_argument('--sync', action='store_true',
+                        help='only download entries newer than the last --sync run of each URL')
+    parser.add_argument('--lyrics', action='store_true', help='embed lyrics in music tracks')
+    parser.add_argument('--progress-rate', type=float, default=DEFAULT_PROGRESS_RATE_HZ, metavar='HZ',
+                        help='maximum progress events per second per item (default: %(default)s)')
+    return parser
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'expected a positive integer, got {value}')
+    return number
+
+
+def _install_stop_handlers(stop):
+    """Turn SIGINT/SIGTERM into a cooperative stop; a second signal exits at once.
+
+    Returns the previous handlers, for :func:`signal.signal` to restore.
+    """
+    def handler(signum, frame):
+        if stop.is_set():
+            os._exit(EXIT_CANCELLED)
+        stop.set()
+
+    return {signum: signal.signal(signum, handler) for signum in (signal.SIGINT, signal.SIGTERM)}
+
+
+def main(argv=None, stdout=None, stdin=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        inputs = read_url_lists(args.urls, args.batch_file, stdin=stdin)
+    except OSError as e:
+        parser.error(f'cannot read batch file: {e}')
+    if not inputs:
+        parser.error('no URLs given')
+
+    stop = threading.Event()
+    previous = {}
+    if threading.current_thread() is threading.main_thread():
+        previous = _install_stop_handlers(stop)
+    try:
+        return _run(args, inputs, JsonLinesReporter(stdout), stop)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def _run(args, inputs, reporter, stop):
+    from app_paths import add_deno_to_path
+    from downloader import BandwidthGovernor, open_download_archive, open_fragment_tuner
+    from extractors import open_sync_state
+
+    add_deno_to_path()
+    sync_state = open_sync_state() if args.sync else None
+    reporter.emit('start', inputs=len(inputs))
+    targets, synced, failed_inputs = expand_inputs(
+        inputs, reporter, args.cookies_from_browser, sync_state=sync_state, batch_size=FETCH_BATCH_SIZE,
+    )
+
+    lyrics_cache = None
+    if args.lyrics:
+        from lyrics import open_lyrics_cache
+        lyrics_cache = open_lyrics_cache()
+
+    is_video = args.format_type == 'video'
+    summary = run_batch(
+        targets, reporter, stop.is_set,
+        output_path=args.output,
+        format_type=args.format_type,
+        video_quality=args.quality if is_video else None,
+        video_container=args.container if is_video else None,
+        audio_codec=args.audio_codec,
+        audio_quality=args.audio_quality,
+        embed_thumbnail=not is_video,
+        filename_template=args.template,
+        cookies_from_browser=args.cookies_from_browser,
+        fetch_lyrics_flag=args.lyrics,
+        max_workers=args.jobs,
+        per_host_limit=args.per_host,
+        progress_rate_hz=args.progress_rate,
+        governor=BandwidthGovernor(args.limit_rate * 1024) if args.limit_rate else None,
+        fragment_tuner=open_fragment_tuner(),
+        archive=None if args.no_archive else open_download_archive(),
+        lyrics_cache=lyrics_cache,
+    )
+
+    if sync_state is not None and not summary['cancelled']:
+        record_synced(sync_state, synced, [item['url'] for item in summary['failed']])
+    reporter.emit('done', fetch_errors=len(failed_inputs), **summary)
+
+    if summary['cancelled']:
+        return EXIT_CANCELLED
+    return EXIT_FAILED if summary['failed'] or failed_inputs else EXIT_OK
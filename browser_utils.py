@@ -5,6 +5,10 @@ Browser detection and cookie utilities
 import glob
 import logging
 import os
+import pathlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -41,47 +45,54 @@ _FIREFOX_ROOTS = [
     '~/Library/Application Support/Firefox/Profiles',
 ]
 
+# Cookie names (substrings, upper-cased) that mean a signed-in YouTube session.
+_YOUTUBE_AUTH_COOKIES = ('SAPISID', 'SSID', 'SID', 'HSID', 'APISID')
+_CHROMIUM_YOUTUBE_QUERY = "SELECT name FROM cookies WHERE host_key LIKE '%youtube.com'"
+_FIREFOX_YOUTUBE_QUERY = "SELECT name FROM moz_cookies WHERE host LIKE '%youtube.com'"
 
-def _has_chromium_cookies(config_root):
-    """Return True if any Chromium profile under *config_root* has a Cookies DB."""
+
+def _chromium_cookie_dbs(config_root):
+    """Yield the Cookies DB of every Chromium profile under *config_root*."""
     root = os.path.expanduser(config_root)
     if not os.path.isdir(root):
-        return False
+        return
 
     # Opera stores cookies at the config root (not under Default/).
-    if os.path.isfile(os.path.join(root, 'Cookies')):
-        return True
-
-    profile_dirs = [os.path.join(root, 'Default')]
+    profile_dirs = [root, os.path.join(root, 'Default')]
     profile_dirs.extend(glob.glob(os.path.join(root, 'Profile *')))
     profile_dirs.extend(glob.glob(os.path.join(root, '* Profile')))
 
     for profile_dir in profile_dirs:
-        if os.path.isfile(os.path.join(profile_dir, 'Cookies')):
-            return True
-    return False
+        # Chromium 96+ keeps the DB under Network/.
+        for db_path in (os.path.join(profile_dir, 'Cookies'), os.path.join(profile_dir, 'Network', 'Cookies')):
+            if os.path.isfile(db_path):
+                yield db_path
 
 
-def _has_firefox_cookies():
-    """Return True if any Firefox profile contains cookies.sqlite."""
+def _firefox_cookie_dbs():
+    """Yield the cookies.sqlite of every Firefox profile."""
     for root_pattern in _FIREFOX_ROOTS:
         root = os.path.expanduser(root_pattern)
         if not os.path.isdir(root):
             continue
         for entry in os.listdir(root):
-            profile_dir = os.path.join(root, entry)
-            if os.path.isfile(os.path.join(profile_dir, 'cookies.sqlite')):
-                return True
-    return False
+            db_path = os.path.join(root, entry, 'cookies.sqlite')
+            if os.path.isfile(db_path):
+                yield db_path
 
 
-def detect_available_browsers():
-    """
-    Detect which browsers are installed and have accessible cookie databases.
+def _has_chromium_cookies(config_root):
+    """Return True if any Chromium profile under *config_root* has a Cookies DB."""
+    return any(True for _ in _chromium_cookie_dbs(config_root))
 
-    Returns:
-        list: Browser names that are available (e.g., ['brave', 'firefox'])
-    """
+
+def _has_firefox_cookies():
+    """Return True if any Firefox profile contains cookies.sqlite."""
+    return any(True for _ in _firefox_cookie_dbs())
+
+
+def _scan_browsers():
+    """Return the browsers whose cookie databases exist, by scanning every profile root."""
     available = []
 
     if _has_firefox_cookies():
@@ -94,39 +105,131 @@ def detect_available_browsers():
     return available
 
 
+def _roots_signature():
+    """Return the mtime of every browser profile root (None if missing).
+
+    Adding or removing a profile changes its root's mtime, so an unchanged
+    signature means a rescan would find the same browsers.
+    """
+    roots = list(_FIREFOX_ROOTS)
+    for browser_roots in _CHROMIUM_ROOTS.values():
+        roots.extend(browser_roots)
+    signature = []
+    for root in roots:
+        try:
+            signature.append((root, os.stat(os.path.expanduser(root)).st_mtime_ns))
+        except OSError:
+            signature.append((root, None))
+    return tuple(signature)
+
+
+# (roots signature, browsers) from the last scan; guarded by _detect_lock,
+# which is held during a scan so concurrent callers wait for its result.
+_detected = None
+_detect_lock = threading.Lock()
+
+
+def detect_available_browsers(refresh=False):
+    """
+    Detect which browsers are installed and have accessible cookie databases.
+
+    The result is cached in-process and rescanned only when a profile root's
+    mtime changes (or *refresh* is set), so repeated calls on the auth retry
+    paths cost a few ``stat`` calls.
+
+    Returns:
+        list: Browser names that are available (e.g., ['brave', 'firefox'])
+    """
+    global _detected
+    signature = _roots_signature()
+    with _detect_lock:
+        if refresh or _detected is None or _detected[0] != signature:
+            _detected = (signature, _scan_browsers())
+        return list(_detected[1])
+
+
+def warm_browser_detection():
+    """Run :func:`detect_available_browsers` on a daemon thread and return the thread.
+
+    Called at startup so the first auth fallback finds the result cached.
+    """
+    thread = threading.Thread(target=detect_available_browsers, name='browser-detection', daemon=True)
+    thread.start()
+    return thread
+
+
+def _query_cookie_store(db_path, query, immutable=False):
+    uri = f"{pathlib.Path(db_path).as_uri()}?mode=ro{'&immutable=1' if immutable else ''}"
+    # No busy wait: a store the browser holds locked is read immutable instead.
+    conn = sqlite3.connect(uri, uri=True, timeout=0)
+    try:
+        return [name for (name,) in conn.execute(query)]
+    finally:
+        conn.close()
+
+
+def _youtube_cookie_names(db_path, query):
+    """Return the names of the YouTube cookies in the SQLite store at *db_path*.
+
+    The store is opened read-only, which also reads the browser's
+    write-ahead log, so a login made moments ago is seen.  Only if the
+    browser holds it locked is it reopened immutable, without the lock and
+    without the log; no copy is written either way.
+    """
+    try:
+        return _query_cookie_store(db_path, query)
+    except sqlite3.OperationalError as exc:
+        if 'locked' not in str(exc) and 'busy' not in str(exc):
+            raise
+    return _query_cookie_store(db_path, query, immutable=True)
+
+
+def _has_youtube_login(browser):
+    """Return True if any of *browser*'s profiles holds a YouTube auth cookie.
+
+    Only cookie names are read, never values, so nothing is decrypted and the
+    keyring is not touched.
+    """
+    if browser == 'firefox':
+        db_paths, query = _firefox_cookie_dbs(), _FIREFOX_YOUTUBE_QUERY
+    else:
+        db_paths = (db for root in _CHROMIUM_ROOTS[browser] for db in _chromium_cookie_dbs(root))
+        query = _CHROMIUM_YOUTUBE_QUERY
+
+    for db_path in db_paths:
+        try:
+            names = _youtube_cookie_names(db_path, query)
+        except sqlite3.Error as exc:
+            logger.warning("Cannot read %s cookie store %s: %s", browser, db_path, exc)
+            continue
+        if any(auth in name.upper() for name in names for auth in _YOUTUBE_AUTH_COOKIES):
+            return True
+    return False
+
+
+def _probe_browser(browser):
+    try:
+        return _has_youtube_login(browser)
+    except OSError as exc:
+        logger.warning("Cannot read %s cookie store: %s", browser, exc)
+        return False
+
+
 def get_browsers_with_youtube_cookies():
     """
     Check which browsers have YouTube cookies (indicating user is logged in).
 
     Only call this after the user has consented to cookie use (e.g. bot-detection retry).
+    Browsers are probed concurrently, so the check takes as long as the
+    slowest single browser.
 
     Returns:
         list: Browser names with YouTube authentication cookies
     """
-    try:
-        import yt_dlp.cookies
-    except ImportError:
-        return []
-
     available_browsers = detect_available_browsers()
-    browsers_with_youtube = []
+    if not available_browsers:
+        return []
 
-    for browser in available_browsers:
-        try:
-            jar = yt_dlp.cookies.extract_cookies_from_browser(browser)
-
-            youtube_cookies = [c for c in jar if 'youtube.com' in c.domain]
-            auth_cookies = [c for c in youtube_cookies if any(
-                x in c.name.upper() for x in ['SAPISID', 'SSID', 'SID', 'HSID', 'APISID']
-            )]
-
-            if auth_cookies:
-                browsers_with_youtube.append(browser)
-        except PermissionError as exc:
-            logger.warning("Cannot read %s cookie store (permission denied): %s", browser, exc)
-        except OSError as exc:
-            logger.warning("Cannot read %s cookie store: %s", browser, exc)
-        except Exception as exc:  # noqa: BLE001 — yt-dlp raises miscellaneous internal errors
-            logger.debug("Skipping %s during YouTube cookie check: %s", browser, exc)
-
-    return browsers_with_youtube
+    with ThreadPoolExecutor(max_workers=len(available_browsers), thread_name_prefix='cookie-probe') as pool:
+        logged_in = list(pool.map(_probe_browser, available_browsers))
+    return [browser for browser, has_login in zip(available_browsers, logged_in) if has_login]
@@ -21,3 +21,7 @@ BROWSER_EDGE = "edge"
 BROWSER_CHROMIUM = "chromium"
 BROWSER_OPERA = "opera"
 BROWSER_VIVALDI = "vivaldi"
+
+# A host remembered as needing browser cookies is fetched with them directly;
+# after this many seconds one fetch goes unauthenticated to see if it still does.
+HOST_AUTH_RECHECK_INTERVAL = 7 * 24 * 3600
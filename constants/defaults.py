@@ -15,11 +15,24 @@ DEFAULT_VIDEO_QUALITY = QUALITY_BEST
 DEFAULT_BROWSER_PREFERENCE = BROWSER_AUTO
 DEFAULT_OUTPUT_DIR = "~/Downloads"
 
+# ===== PARALLEL DOWNLOADS =====
+DEFAULT_MAX_PARALLEL_DOWNLOADS = 3
+DEFAULT_PER_HOST_DOWNLOADS = 2
+MAX_PARALLEL_DOWNLOADS_LIMIT = 8
+# Structured per-job progress updates per second (yt-dlp hooks are coalesced)
+DEFAULT_PROGRESS_RATE_HZ = 10
+# Fetched entries handed to the UI per batch while a playlist is still paging
+FETCH_BATCH_SIZE = 100
+
+# ===== BANDWIDTH =====
+# Global download caps offered in Preferences, in KiB/s (0 = unlimited)
+BANDWIDTH_LIMIT_CHOICES_KIB = (0, 256, 512, 1024, 2048, 5120, 10240, 20480)
+
 # ===== WINDOW SIZES =====
 MAIN_WINDOW_MIN_WIDTH = 900
 MAIN_WINDOW_MIN_HEIGHT = 850
 PREFERENCES_WINDOW_MIN_WIDTH = 550
-PREFERENCES_WINDOW_MIN_HEIGHT = 350
+PREFERENCES_WINDOW_MIN_HEIGHT = 450
 
 # ===== ICON SIZES =====
 ICON_BANNER_SIZE = 60
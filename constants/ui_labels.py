@@ -2,6 +2,8 @@
 
 # ===== BUTTON LABELS =====
 BTN_FETCH = "Fetch"
+BTN_REFRESH = "Refresh"
+CHECK_SYNC_NEW_ONLY = "New uploads only"
 BTN_DOWNLOAD_SELECTED = "Download Selected"
 BTN_SELECT_ALL = "Select All"
 BTN_SELECT_NONE = "Select None"
@@ -20,6 +22,7 @@ GROUP_FILENAME_TEMPLATE = "Filename Template"
 GROUP_DOWNLOAD_OPTIONS = "Download Options"
 GROUP_PROGRESS = "Progress"
 GROUP_AUTHENTICATION = "Authentication"
+GROUP_DOWNLOADS = "Downloads"
 
 # ===== INPUT PLACEHOLDERS =====
 PLACEHOLDER_URL = "Enter video URL or channel/playlist URL..."
@@ -2,6 +2,7 @@
 
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QGroupBox,
@@ -12,14 +13,31 @@ from PyQt5.QtWidgets import (
 )
 
 from constants import (
+    BANDWIDTH_LIMIT_CHOICES_KIB,
     BTN_CANCEL,
     BTN_SAVE,
     GROUP_AUTHENTICATION,
+    GROUP_DOWNLOADS,
+    MAX_PARALLEL_DOWNLOADS_LIMIT,
     PREFERENCES_WINDOW_MIN_HEIGHT,
     PREFERENCES_WINDOW_MIN_WIDTH,
     PREFERENCES_WINDOW_TITLE,
 )
-from settings import save_browser_preference
+from settings import (
+    save_bandwidth_limit_kib,
+    save_browser_preference,
+    save_max_parallel_downloads,
+    save_per_host_limit,
+    save_use_download_archive,
+)
+
+
+def _bandwidth_label(kib):
+    if not kib:
+        return "Unlimited"
+    if kib % 1024 == 0:
+        return f"{kib // 1024} MiB/s"
+    return f"{kib} KiB/s"
 
 
 class PreferencesDialog(QDialog):
@@ -84,6 +102,53 @@ class PreferencesDialog(QDialog):
         auth_group.setLayout(auth_layout)
         layout.addWidget(auth_group)
 
+        downloads_group = QGroupBox(GROUP_DOWNLOADS)
+        downloads_layout = QVBoxLayout()
+        worker_choices = [str(n) for n in range(1, MAX_PARALLEL_DOWNLOADS_LIMIT + 1)]
+
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("Parallel downloads:"))
+        self.workers_combo = QComboBox()
+        self.workers_combo.addItems(worker_choices)
+        self.workers_combo.setToolTip("Maximum number of items downloaded at the same time")
+        workers_layout.addWidget(self.workers_combo)
+        workers_layout.addStretch()
+        downloads_layout.addLayout(workers_layout)
+
+        per_host_layout = QHBoxLayout()
+        per_host_layout.addWidget(QLabel("Per-site limit:"))
+        self.per_host_combo = QComboBox()
+        self.per_host_combo.addItems(worker_choices)
+        self.per_host_combo.setToolTip(
+            "Maximum simultaneous downloads from any one site (YouTube, Odysee, a podcast CDN, ...).\n"
+            "Each site is counted separately, so a mixed batch can use every parallel slot."
+        )
+        per_host_layout.addWidget(self.per_host_combo)
+        per_host_layout.addStretch()
+        downloads_layout.addLayout(per_host_layout)
+
+        bandwidth_layout = QHBoxLayout()
+        bandwidth_layout.addWidget(QLabel("Bandwidth limit:"))
+        self.bandwidth_combo = QComboBox()
+        self.bandwidth_combo.addItems([_bandwidth_label(kib) for kib in BANDWIDTH_LIMIT_CHOICES_KIB])
+        self.bandwidth_combo.setToolTip(
+            "Total download speed shared by every running download.\n"
+            "When one download finishes, the others get its share."
+        )
+        bandwidth_layout.addWidget(self.bandwidth_combo)
+        bandwidth_layout.addStretch()
+        downloads_layout.addLayout(bandwidth_layout)
+
+        self.archive_checkbox = QCheckBox("Skip items already downloaded")
+        self.archive_checkbox.setToolTip(
+            "Remember every finished download and skip it when a playlist or channel is downloaded again.\n"
+            "Uses the same archive format as yt-dlp's --download-archive."
+        )
+        downloads_layout.addWidget(self.archive_checkbox)
+
+        downloads_group.setLayout(downloads_layout)
+        layout.addWidget(downloads_group)
+
         layout.addStretch()
 
         button_layout = QHBoxLayout()
@@ -114,6 +179,12 @@ class PreferencesDialog(QDialog):
                 'vivaldi': 8,
             }
             self.browser_combo.setCurrentIndex(browser_map.get(current_browser, 0))
+            self.workers_combo.setCurrentText(str(getattr(parent, 'max_parallel_downloads', 1)))
+            self.per_host_combo.setCurrentText(str(getattr(parent, 'per_host_limit', 1)))
+            self.archive_checkbox.setChecked(getattr(parent, 'use_download_archive', True))
+            current_kib = getattr(parent, 'bandwidth_limit_kib', 0)
+            if current_kib in BANDWIDTH_LIMIT_CHOICES_KIB:
+                self.bandwidth_combo.setCurrentIndex(BANDWIDTH_LIMIT_CHOICES_KIB.index(current_kib))
 
     def save_preferences(self):
         """Save preferences and close dialog."""
@@ -128,4 +199,21 @@ class PreferencesDialog(QDialog):
 
             self.parent_app.browser_preference = preference
             save_browser_preference(preference)
+
+            max_workers = int(self.workers_combo.currentText())
+            per_host_limit = int(self.per_host_combo.currentText())
+            self.parent_app.max_parallel_downloads = max_workers
+            self.parent_app.per_host_limit = per_host_limit
+            save_max_parallel_downloads(max_workers)
+            save_per_host_limit(per_host_limit)
+
+            self.parent_app.use_download_archive = self.archive_checkbox.isChecked()
+            save_use_download_archive(self.parent_app.use_download_archive)
+
+            kib = BANDWIDTH_LIMIT_CHOICES_KIB[max(0, self.bandwidth_combo.currentIndex())]
+            self.parent_app.bandwidth_limit_kib = kib
+            save_bandwidth_limit_kib(kib)
+            governor = getattr(self.parent_app, 'bandwidth_governor', None)
+            if governor is not None:
+                governor.configure(kib * 1024, governor.host_limits, governor.schedule)
         self.close()
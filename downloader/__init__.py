@@ -0,0 +1,33 @@
+"""Qt-free download engine for AV Morning Star."""
+
+from .archive import AlreadyDownloaded, DownloadArchive, archive_id, open_download_archive
+from .bandwidth import BandwidthGovernor, ScheduleWindow, parse_schedule
+from .engine import DownloadEngine, get_filepath
+from .fragments import FragmentTuner, open_fragment_tuner
+from .job_store import JobStore, open_job_store
+from .progress import BatchProgress, ProgressThrottle, describe_progress, progress_snapshot
+from .scheduler import FilenameReservations, host_key
+from .sessions import YoutubeDLSessionPool
+
+__all__ = [
+    'AlreadyDownloaded',
+    'BandwidthGovernor',
+    'BatchProgress',
+    'DownloadArchive',
+    'DownloadEngine',
+    'FilenameReservations',
+    'FragmentTuner',
+    'JobStore',
+    'ProgressThrottle',
+    'ScheduleWindow',
+    'YoutubeDLSessionPool',
+    'archive_id',
+    'describe_progress',
+    'get_filepath',
+    'host_key',
+    'open_download_archive',
+    'open_fragment_tuner',
+    'open_job_store',
+    'parse_schedule',
+    'progress_snapshot',
+]
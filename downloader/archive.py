@@ -0,0 +1,103 @@
+"""Download archive: the set of items already downloaded, by extractor and ID.
+
+The file format matches yt-dlp's ``--download-archive`` (one
+``"<extractor key lowercased> <video id>"`` line per item), so an archive can
+be shared with the yt-dlp command line in either direction.
+
+The file is read once into an in-memory set on a background thread, so even
+an archive with hundreds of thousands of entries never delays startup;
+lookups block only if they arrive before loading has finished.  New entries
+are appended to the file as they are added.
+"""
+
+import os
+import threading
+
+from app_paths import data_dir
+
+
+class AlreadyDownloaded(Exception):
+    """Raised to skip an item that is already in the download archive."""
+
+
+def archive_id(ie_key: str, video_id: str) -> str:
+    """Return the archive line for an item, as yt-dlp's ``make_archive_id`` does."""
+    return f'{ie_key.lower()} {video_id}'
+
+
+class DownloadArchive:
+    """Thread-safe archive backed by the text file at *path*."""
+
+    def __init__(self, path):
+        self.path = path
+        self._ids = set()
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()
+        self._loader = None
+
+    def start_loading(self):
+        """Read the archive file on a daemon thread; return self for chaining."""
+        if self._loader is None:
+            self._loader = threading.Thread(target=self._load, name='download-archive-load', daemon=True)
+            self._loader.start()
+        return self
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                ids = {line.strip() for line in f}
+        except OSError:
+            ids = set()
+        ids.discard('')
+        with self._lock:
+            self._ids |= ids
+        self._loaded.set()
+
+    def _wait_loaded(self):
+        if self._loader is None:
+            self._load()
+        self._loaded.wait()
+
+    def __len__(self):
+        self._wait_loaded()
+        return len(self._ids)
+
+    def contains(self, ie_key, video_id) -> bool:
+        """Return True if the item has been downloaded before."""
+        if not ie_key or not video_id:
+            return False
+        self._wait_loaded()
+        return archive_id(ie_key, video_id) in self._ids
+
+    def contains_info(self, info) -> bool:
+        """Return True if a yt-dlp info dict describes an archived item."""
+        info = info or {}
+        return self.contains(info.get('extractor_key') or info.get('ie_key'), info.get('id'))
+
+    def add(self, ie_key, video_id):
+        """Record a finished download, appending it to the archive file."""
+        if not ie_key or not video_id:
+            return
+        self._wait_loaded()
+        line = archive_id(ie_key, video_id)
+        with self._lock:
+            if line in self._ids:
+                return
+            self._ids.add(line)
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+            except OSError:
+                pass
+
+
+def open_download_archive(path=None):
+    """Open the archive (default: ``archive.txt`` in the app data dir) and start loading it.
+
+    Returns None if the data directory cannot be created.
+    """
+    try:
+        path = path or os.path.join(data_dir(), 'archive.txt')
+    except OSError:
+        return None
+    return DownloadArchive(path).start_loading()
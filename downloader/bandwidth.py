@@ -0,0 +1,179 @@
+"""Shared bandwidth governor: token buckets every transfer draws from.
+
+One :class:`BandwidthGovernor` is shared by every concurrent transfer in the
+app.  After each chunk, a transfer asks it for permission to account for the
+bytes it has just received and sleeps for as long as the buckets say it is
+ahead of its allowance.  Because all transfers draw from the same global
+bucket (and, per site, from that site's bucket), a job that finishes or
+pauses simply stops drawing and the others absorb its share: total
+throughput stays at the cap however many jobs are running.
+
+Time-of-day schedule windows override the global cap while they are active,
+e.g. a tight limit during working hours and no limit overnight.
+"""
+
+import threading
+import time
+
+# Longest single sleep, so cancellation is noticed promptly.
+_SLEEP_SLICE = 0.25
+
+
+def _parse_clock(text) -> int:
+    hours, minutes = str(text).strip().split(':')
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f'Invalid time of day: {text!r}')
+    return hours * 60 + minutes
+
+
+class ScheduleWindow:
+    """Cap of *limit* bytes/s (0 or None = unlimited) between two ``HH:MM`` times.
+
+    A window whose end is not after its start wraps past midnight.
+    """
+
+    def __init__(self, start, end, limit):
+        self.start = _parse_clock(start)
+        self.end = _parse_clock(end)
+        self.limit = int(limit) if limit else None
+
+    def contains(self, minute_of_day) -> bool:
+        if self.start < self.end:
+            return self.start <= minute_of_day < self.end
+        return minute_of_day >= self.start or minute_of_day < self.end
+
+
+def parse_schedule(entries):
+    """Build windows from ``[{'start': 'HH:MM', 'end': 'HH:MM', 'limit': bytes_per_s}, ...]``.
+
+    Malformed entries are skipped.
+    """
+    windows = []
+    for entry in entries or ():
+        try:
+            windows.append(ScheduleWindow(entry['start'], entry['end'], entry.get('limit')))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+    return windows
+
+
+class TokenBucket:
+    """Token bucket refilled at *rate* bytes/s, holding at most one second of burst.
+
+    :meth:`reserve` always succeeds but may leave the bucket in debt; the
+    returned delay is how long the caller must wait for the debt to clear.
+    Later callers queue behind that debt, which paces all of them together.
+    """
+
+    def __init__(self, rate, clock=time.monotonic):
+        self._clock = clock
+        self.rate = float(rate)
+        self.tokens = self.rate
+        self._stamp = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.rate, self.tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def set_rate(self, rate):
+        self._refill()
+        self.rate = float(rate)
+        self.tokens = min(self.tokens, self.rate)
+
+    def reserve(self, amount) -> float:
+        self._refill()
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class BandwidthGovernor:
+    """Global and per-host rate limits shared by every transfer.  Thread-safe.
+
+    Args:
+        limit: Global cap in bytes/s; None or 0 for unlimited.
+        host_limits: ``{host_key: bytes_per_s}`` caps for individual sites
+            (keys as returned by :func:`downloader.scheduler.host_key`).
+        schedule: :class:`ScheduleWindow` list; the first window containing
+            the current local time replaces *limit*.
+    """
+
+    def __init__(self, limit=None, host_limits=None, schedule=None,
+                 clock=time.monotonic, sleep=time.sleep, local_time=time.localtime):
+        self._clock = clock
+        self._sleep = sleep
+        self._local_time = local_time
+        self._lock = threading.Lock()
+        self._global = None
+        self._hosts = {}
+        self._seen = {}
+        self.configure(limit, host_limits, schedule)
+
+    def configure(self, limit=None, host_limits=None, schedule=None):
+        """Replace every limit; transfers already running pick the new values up immediately."""
+        with self._lock:
+            self.limit = int(limit) if limit else None
+            self.host_limits = {host: int(rate) for host, rate in (host_limits or {}).items() if rate}
+            self.schedule = list(schedule or ())
+            self._hosts = {host: bucket for host, bucket in self._hosts.items() if host in self.host_limits}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.limit or self.host_limits or any(w.limit for w in self.schedule))
+
+    def current_limit(self):
+        """Return the global cap in force right now (bytes/s), or None if unlimited."""
+        if self.schedule:
+            now = self._local_time()
+            minute = now.tm_hour * 60 + now.tm_min
+            for window in self.schedule:
+                if window.contains(minute):
+                    return window.limit
+        return self.limit
+
+    def _bucket(self, bucket, rate):
+        if not rate:
+            return None
+        if bucket is None:
+            return TokenBucket(rate, self._clock)
+        if bucket.rate != rate:
+            bucket.set_rate(rate)
+        return bucket
+
+    def throttle(self, host, nbytes, should_stop=None):
+        """Account for *nbytes* just received from *host*, sleeping as needed to stay under the caps."""
+        if nbytes <= 0:
+            return
+        with self._lock:
+            self._global = self._bucket(self._global, self.current_limit())
+            delay = self._global.reserve(nbytes) if self._global else 0.0
+            host_rate = self.host_limits.get(host)
+            if host_rate:
+                bucket = self._hosts[host] = self._bucket(self._hosts.get(host), host_rate)
+                delay = max(delay, bucket.reserve(nbytes))
+        deadline = self._clock() + delay
+        while delay > 0:
+            if should_stop and should_stop():
+                return
+            self._sleep(min(delay, _SLEEP_SLICE))
+            delay = deadline - self._clock()
+
+    def record(self, key, host, downloaded_bytes, should_stop=None):
+        """Throttle a transfer that reports a running byte total, as yt-dlp progress hooks do.
+
+        *key* identifies the transfer; only the growth since its previous
+        report is charged.  The first report only sets the baseline: a
+        resumed transfer starts counting at the size of its ``.part`` file,
+        which was received (and charged) by an earlier run.
+        """
+        with self._lock:
+            previous = self._seen.get(key)
+            self._seen[key] = downloaded_bytes
+        if previous is not None:
+            self.throttle(host, downloaded_bytes - previous, should_stop)
+
+    def forget(self, key):
+        """Drop the byte total of a finished transfer."""
+        with self._lock:
+            self._seen.pop(key, None)
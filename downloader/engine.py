@@ -0,0 +1,376 @@
+"""Batch download engine: a three-stage extract → transfer → post-process pipeline.
+
+Each stage has its own worker pool and bounded queue (see
+:mod:`downloader.pipeline`), so FFmpeg work on one item overlaps the network
+transfer of the next.  The engine has no Qt dependency; ``DownloadThread``
+drives it from a QThread and turns its callbacks into signals.
+"""
+
+import contextlib
+import os
+import threading
+
+from extractors import AUTH_RELOAD_INTERVAL, get_extractor, is_auth_error, shared_cookie_jars, shared_info_cache
+
+from .archive import AlreadyDownloaded
+from .fragments import is_throttling_error
+from .hooks import TransferHooksMixin
+from .journal import JobJournalMixin
+from .lyrics_step import LyricsPool
+from .pipeline import Pipeline, Stage
+from .progress import EXTRACT, POSTPROCESS, TRANSFER, ProgressThrottle
+from .scheduler import FilenameReservations, host_key
+from .sessions import YoutubeDLSessionPool
+
+# Items each stage may queue per transfer worker before upstream stages block.
+_QUEUE_DEPTH_PER_WORKER = 2
+
+# Errors a stale signed media URL produces when fetch-phase metadata is reused.
+_EXPIRED_URL_ERRORS = ('HTTP Error 403', 'HTTP Error 410')
+
+
+def _transfer_opts(opts, outtmpl=None):
+    """Return *opts* without postprocessors (and with *outtmpl* if given) for the transfer stage."""
+    opts = {key: value for key, value in opts.items() if key != 'postprocessors'}
+    if outtmpl:
+        opts['outtmpl'] = outtmpl
+    return opts
+
+
+# Keys yt-dlp's transfer left on the requested download for its own merge and
+# fixup postprocessors, which already ran in the transfer stage.
+_TRANSFER_PRIVATE_KEYS = ('__postprocessors', '__files_to_merge', '__files_to_move')
+
+
+def _postprocess_info(info, download):
+    """Return the info dict to post-process *download* (``requested_downloads[0]``) with.
+
+    yt-dlp strips the fields a requested download shares with its video
+    (title, artist, thumbnails, chapters...) once the transfer is done, so
+    they are merged back for the tagging postprocessors, and the transfer's
+    private keys are dropped so its merger and fixups do not run twice.
+    """
+    merged = {**info, **download}
+    for key in ('requested_downloads', *_TRANSFER_PRIVATE_KEYS):
+        merged.pop(key, None)
+    return merged
+
+
+def get_filepath(info: dict) -> str | None:
+    """Return the final post-processed file path from a yt-dlp info dict."""
+    requested = info.get('requested_downloads') or []
+    if requested:
+        return requested[0].get('filepath')
+    return info.get('filepath') or info.get('_filename')
+
+
+class DownloadEngine(TransferHooksMixin, JobJournalMixin):
+    """Download a batch of URLs with a global worker cap and a per-host cap.
+
+    Args:
+        urls: URLs to download, in the order they should start.
+        output_path, format_type, ...: Download settings, passed through to
+            the extractor's ``get_download_opts()``.
+        max_workers: Number of items extracted, and transferred, concurrently.
+        per_host_limit: Maximum concurrent items against any single host in
+            the extract and transfer stages (see
+            :func:`downloader.scheduler.host_key`).
+        postprocess_workers: Number of items post-processed (FFmpeg, lyrics)
+            concurrently; defaults to half the CPU count, at most
+            *max_workers*.
+        on_progress: ``callback(message, percent)`` for batch status
+            messages.  May be called from several worker threads at once.
+        on_job_progress: ``callback(progress)`` with a structured dict from
+            :func:`downloader.progress.progress_snapshot` for each job,
+            coalesced to at most *progress_rate_hz* updates per job.  Called
+            from worker and fragment threads.
+        progress_rate_hz: Per-job update rate for *on_job_progress*.
+        governor: Optional :class:`downloader.bandwidth.BandwidthGovernor`
+            every transfer draws from; usually shared across batches.
+        fragment_tuner: Optional :class:`downloader.fragments.FragmentTuner`
+            choosing ``concurrent_fragment_downloads`` per site for HLS/DASH
+            transfers and learning from their throughput.
+        should_stop: Callable returning True once the batch is cancelled.
+        on_stage_done: ``callback(stage, index, url)`` each time an item
+            completes the ``'extract'``, ``'transfer'`` or ``'postprocess'``
+            stage.  Called from worker threads.
+        job_store: Optional :class:`downloader.job_store.JobStore`.  The batch
+            is journalled there so an interrupted run can be resumed.
+        batch_id: Resume this journalled batch instead of creating a new one;
+            only its unfinished jobs are downloaded.
+        archive: Optional :class:`downloader.archive.DownloadArchive`.  Items
+            already in it are skipped; finished items are added to it.
+        lyrics_cache: Optional :class:`lyrics.LyricsCache` shared by every
+            lyrics lookup in the batch.
+    """
+
+    def __init__(
+        self,
+        urls,
+        output_path,
+        format_type,
+        video_quality=None,
+        audio_codec='mp3',
+        audio_quality='192',
+        download_subs=False,
+        embed_thumbnail=False,
+        normalize_audio=False,
+        denoise_audio=False,
+        dynamic_normalization=False,
+        filename_template=None,
+        cookies_from_browser=None,
+        video_container='mp4',
+        denoise_video=False,
+        stabilize_video=False,
+        sharpen_video=False,
+        normalize_video_audio=False,
+        denoise_video_audio=False,
+        fetch_lyrics_flag=False,
+        save_lrc=False,
+        max_workers=1,
+        per_host_limit=1,
+        postprocess_workers=None,
+        on_progress=None,
+        on_job_progress=None,
+        progress_rate_hz=10.0,
+        governor=None,
+        fragment_tuner=None,
+        should_stop=None,
+        on_stage_done=None,
+        job_store=None,
+        batch_id=None,
+        archive=None,
+        lyrics_cache=None,
+    ):
+        self.urls = list(urls)
+        self.output_path = output_path
+        self.format_type = format_type
+        self.video_quality = video_quality
+        self.video_container = video_container
+        self.audio_codec = audio_codec
+        self.audio_quality = audio_quality
+        self.download_subs = download_subs
+        self.embed_thumbnail = embed_thumbnail
+        self.normalize_audio = normalize_audio
+        self.denoise_audio = denoise_audio
+        self.dynamic_normalization = dynamic_normalization
+        self.filename_template = filename_template or '%(title)s.%(ext)s'
+        self.cookies_from_browser = cookies_from_browser
+        self.denoise_video = denoise_video
+        self.stabilize_video = stabilize_video
+        self.sharpen_video = sharpen_video
+        self.normalize_video_audio = normalize_video_audio
+        self.denoise_video_audio = denoise_video_audio
+        self.fetch_lyrics_flag = fetch_lyrics_flag
+        self.save_lrc = save_lrc
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.postprocess_workers = postprocess_workers or max(1, min(max_workers, (os.cpu_count() or 2) // 2))
+        self.on_progress = on_progress
+        self.on_job_progress = on_job_progress
+        self._progress_throttle = ProgressThrottle(progress_rate_hz)
+        self.governor = governor
+        self.fragment_tuner = fragment_tuner
+        self.should_stop = should_stop
+        self.on_stage_done = on_stage_done
+        self.job_store = job_store
+        self.batch_id = batch_id
+        self.archive = archive
+
+        self._lock = threading.Lock()
+        self._reservations = FilenameReservations()
+        self._sessions = YoutubeDLSessionPool(max_idle=2 * max(1, max_workers))
+        self._progress_saved = {}
+        # Indexes of jobs whose transfer reported fragment progress.
+        self._fragmented = set()
+        self._lyrics = LyricsPool(cache=lyrics_cache)
+        self.successful = 0
+        self.skipped = 0
+        self.failed_urls = []
+
+    # ------------------------------------------------------------------
+    # Batch
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """Download every URL; return ``(successful_count, [(url, error), ...])``."""
+        jobs = self._journal_jobs()
+        host_of = lambda job: host_key(job['url'])  # noqa: E731
+        depth = _QUEUE_DEPTH_PER_WORKER * max(1, self.max_workers)
+        pipeline = Pipeline(
+            [
+                Stage(EXTRACT, self._extract_stage, self.max_workers, depth, host_of, self.per_host_limit),
+                Stage(TRANSFER, self._transfer_stage, self.max_workers, depth, host_of, self.per_host_limit),
+                Stage(POSTPROCESS, self._postprocess_stage, self.postprocess_workers, depth),
+            ],
+            on_event=self._on_stage_event,
+            should_stop=self._stopped,
+        )
+        watch = self.fragment_tuner.watching() if self.fragment_tuner is not None else contextlib.nullcontext()
+        try:
+            with watch:
+                pipeline.run(jobs)
+            if self._lyrics.pending() and not self._stopped():
+                self._emit('Finishing lyrics...', 100)
+        finally:
+            self._sessions.close()
+            self._lyrics.wait(cancel=self._stopped())
+        if self.batch_id and not self._stopped():
+            self._journal('discard_batch', self.batch_id)
+        return self.successful, list(self.failed_urls)
+
+    @property
+    def lyrics_errors(self):
+        """``(audio_filepath, message)`` for every lyrics lookup that failed."""
+        return list(self._lyrics.errors)
+
+    def _stopped(self):
+        return bool(self.should_stop and self.should_stop())
+
+    def _emit(self, message, percent):
+        if self.on_progress:
+            self.on_progress(message, percent)
+
+    def _on_stage_event(self, stage, job, error):
+        """Account for an item leaving *stage*; a raised error ends the item there."""
+        idx, total = job['idx'], len(self.urls)
+        if error is None:
+            if self.on_stage_done:
+                self.on_stage_done(stage, idx, job['url'])
+        elif isinstance(error, AlreadyDownloaded):
+            self._journal('mark_done', job['job_id'])
+            with self._lock:
+                self.skipped += 1
+            self._emit(f'Skipped {idx}/{total} (already downloaded)', 100)
+        elif not self._stopped():
+            if stage == TRANSFER and self.fragment_tuner is not None and is_throttling_error(error) \
+                    and self._was_fragmented(job):
+                self.fragment_tuner.back_off(host_key(job['url']))
+            if self.cookies_from_browser and is_auth_error(error):
+                shared_cookie_jars.invalidate(self.cookies_from_browser, min_age=AUTH_RELOAD_INTERVAL)
+            self._journal('mark_failed', job['job_id'], str(error))
+            with self._lock:
+                self.failed_urls.append((job['url'], str(error)))
+            self._emit(f'Failed {idx}/{total}, continuing...', 0)
+
+    def build_ydl_opts(self, extractor):
+        """Return the yt-dlp options for one item, including progress hooks."""
+        ydl_opts = extractor.get_download_opts(
+            self.output_path,
+            self.filename_template,
+            self.format_type,
+            self.video_quality,
+            self.audio_codec,
+            self.audio_quality,
+            self.download_subs,
+            self.embed_thumbnail,
+            self.normalize_audio,
+            self.denoise_audio,
+            self.dynamic_normalization,
+            self.video_container,
+            self.denoise_video,
+            self.stabilize_video,
+            self.sharpen_video,
+            self.normalize_video_audio,
+            self.denoise_video_audio,
+            fetch_lyrics=self.fetch_lyrics_flag,
+        )
+        ydl_opts['progress_hooks'] = [self.progress_hook]
+        return ydl_opts
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _extract_stage(self, job):
+        """Resolve options and metadata, skip archived items, reserve the output name."""
+        url = job['url']
+        if self.archive is not None and self.archive.contains(*shared_info_cache.handle(url)):
+            raise AlreadyDownloaded(url)
+        extractor = get_extractor(url, cookies_from_browser=self.cookies_from_browser)
+        job['opts'] = self.build_ydl_opts(extractor)
+        job['cached'] = shared_info_cache.lookup(url, self.cookies_from_browser)
+        with self._sessions.session(_transfer_opts(job['opts'])) as ydl:
+            if job['cached']:
+                info = ydl.sanitize_info(job['cached'], remove_private_keys=True)
+            else:
+                info = self._extract(ydl, url)
+            archived = self.archive is not None and self.archive.contains_info(info)
+            planned, job['outtmpl'] = (None, None) if archived else self._plan_output(ydl, info, job['recorded_path'])
+        if archived:
+            raise AlreadyDownloaded(url)
+        job['info'] = info
+        self._journal('mark_running', job['job_id'], planned)
+        return job
+
+    def _transfer_stage(self, job):
+        """Download the media, deferring FFmpeg post-processing to the next stage.
+
+        When the info dict came from :data:`extractors.shared_info_cache` and
+        its media URLs are rejected, the item is extracted afresh and retried
+        once under the same reserved filename.
+        """
+        self._emit(f"Downloading {job['idx']}/{len(self.urls)}...", 0)
+        opts = _transfer_opts(job['opts'], job['outtmpl'])
+        if self.fragment_tuner is not None:
+            job['fragments'] = self.fragment_tuner.concurrency(host_key(job['url']))
+        try:
+            with self._sessions.session(opts) as ydl:
+                job['info'] = self._download(ydl, job, job['info'])
+                return job
+        except Exception as e:
+            if not job['cached'] or self._stopped() or not any(m in str(e) for m in _EXPIRED_URL_ERRORS):
+                raise
+        shared_info_cache.forget(job['url'])
+        with self._sessions.session(opts) as ydl:
+            fresh = self._extract(ydl, job['url'])
+            job['info'] = self._download(ydl, job, fresh)
+        return job
+
+    def _postprocess_stage(self, job):
+        """Run the item's FFmpeg postprocessors, queue its lyrics lookup, then record it as done."""
+        info = job['info']
+        requested = (info or {}).get('requested_downloads') or []
+        if job['opts'].get('postprocessors') and requested:
+            self._emit(f"Post-processing {job['idx']}/{len(self.urls)}...", 100)
+            with self._sessions.session(job['opts']) as ydl:
+                pp_info = _postprocess_info(info, requested[0])
+                requested[0] = ydl.post_process(pp_info['filepath'], pp_info)
+
+        if self.format_type == 'audio' and self.fetch_lyrics_flag and info:
+            filepath = get_filepath(info)
+            if filepath:
+                self._lyrics.submit(info, filepath, self.save_lrc)
+
+        if self.archive is not None and info:
+            self.archive.add(info.get('extractor_key'), info.get('id'))
+        self._journal('mark_done', job['job_id'], get_filepath(info) if info else None)
+        with self._lock:
+            self.successful += 1
+
+    def _extract(self, ydl, url):
+        """Run a full extraction, steered by the fetch phase's ``ie_key`` if known."""
+        raw = ydl.extract_info(url, download=False, ie_key=shared_info_cache.ie_key(url))
+        shared_info_cache.remember(url, raw, self.cookies_from_browser)
+        return ydl.sanitize_info(raw, remove_private_keys=True)
+
+    def _plan_output(self, ydl, info, recorded_path=None):
+        """Reserve this item's output name; return ``(planned_path, outtmpl_override)``.
+
+        A path recorded by an interrupted run is reused verbatim so yt-dlp
+        finds and continues its ``.part`` file.  Otherwise the override is
+        None when the planned filename is free, or a literal template for the
+        de-duplicated stem (``%`` escaped) that keeps yt-dlp's ``%(ext)s`` so
+        post-processing can still change extensions.
+        """
+        if recorded_path:
+            stem = os.path.splitext(recorded_path)[0]
+            return recorded_path, stem.replace('%', '%%') + '.%(ext)s'
+        if not info or info.get('_type', 'video') != 'video':
+            return None, None
+        planned = ydl.prepare_filename(info)
+        base, ext = os.path.splitext(planned)
+        stem = self._reservations.reserve(planned)
+        if stem == base:
+            return planned, None
+        return stem + ext, stem.replace('%', '%%') + '.%(ext)s'
@@ -0,0 +1,250 @@
+"""Adaptive per-host concurrency for fragmented (HLS/DASH) downloads.
+
+yt-dlp fetches the fragments of an HLS or DASH stream one at a time unless
+``concurrent_fragment_downloads`` is raised, so per-fragment latency caps
+throughput.  yt-dlp reads that option once per download, so the
+:class:`FragmentTuner` adapts it between downloads, per site:
+
+* each site starts at a small concurrency;
+* while a finished download's measured throughput beats the best seen so far
+  by a clear margin, the next download to that site uses twice as many
+  fragment connections, up to a ceiling;
+* once doubling stops paying off, the site settles on its best level;
+* an HTTP 429/5xx failure or a stall halves the level and settles it there;
+* a settled site is re-probed one level up after a run of clean downloads,
+  and keeps that level (and resumes ramping) if the probe beats its best
+  throughput, so a transient back-off does not stick.
+
+A settled level saved more than :data:`SETTLED_TTL` ago is unsettled when
+loaded, so old back-offs expire across sessions too.
+
+Stalls are spotted both between progress callbacks and, while a batch runs,
+by a watchdog thread (:meth:`FragmentTuner.watching`), since a transfer stuck
+on a fragment makes no callbacks at all.
+
+Learned levels are saved to a small JSON file so the next session starts
+where this one left off.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+from app_paths import data_dir
+
+from .progress import JOB_INDEX_KEY
+
+# Info-dict key carrying the fragment concurrency a transfer was started with.
+FRAGMENTS_KEY = '_avms_fragments'
+
+INITIAL_CONCURRENCY = 2
+MAX_CONCURRENCY = 16
+# Throughput must beat the best so far by this fraction to count as better.
+_MIN_GAIN = 0.10
+# Clean downloads at a settled level before probing one level higher.
+REPROBE_AFTER = 5
+# A settled level older than this (seconds) is ramped afresh on load.
+SETTLED_TTL = 24 * 3600
+# No progress callback for this long during a fragmented download is a stall.
+STALL_SECONDS = 20.0
+# How often a running batch looks for transfers that have gone silent.
+STALL_CHECK_INTERVAL = 5.0
+
+_THROTTLING_ERRORS = ('HTTP Error 429', 'HTTP Error 5', 'Too Many Requests')
+# yt-dlp protocols whose downloads honour concurrent_fragment_downloads.
+_FRAGMENTED_PROTOCOLS = ('m3u8', 'http_dash_segments', 'ism', 'f4m')
+
+
+def is_throttling_error(error) -> bool:
+    """Return True for errors that mean the server wants fewer connections."""
+    return any(marker in str(error) for marker in _THROTTLING_ERRORS)
+
+
+def is_fragmented(info) -> bool:
+    """Return True if the format(s) selected in *info* download as fragments (HLS/DASH)."""
+    protocols = str((info or {}).get('protocol') or '').split('+')
+    return any(protocol.startswith(_FRAGMENTED_PROTOCOLS) for protocol in protocols)
+
+
+class FragmentTuner:
+    """Learns and persists a fragment concurrency per host.  Thread-safe.
+
+    Args:
+        path: JSON file the learned levels are loaded from and saved to, or
+            None to keep them in memory only.
+    """
+
+    def __init__(self, path=None, clock=time.monotonic, wall_clock=time.time):
+        self.path = path
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._lock = threading.Lock()
+        self._hosts = self._load()
+        self._transfers = {}
+
+    def _load(self):
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        now = self._wall_clock()
+        hosts = {}
+        for host, state in data.items():
+            if not isinstance(state, dict):
+                continue
+            settled_at = state.get('settled_at')
+            settled = bool(state.get('settled')) and isinstance(settled_at, (int, float)) \
+                and now - settled_at < SETTLED_TTL
+            hosts[host] = self._new_state(
+                concurrency=max(1, min(MAX_CONCURRENCY, int(state.get('concurrency', INITIAL_CONCURRENCY)))),
+                best_rate=float(state['best_rate']) if settled and state.get('best_rate') else None,
+                settled=settled,
+                settled_at=settled_at if settled else None,
+            )
+        return hosts
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp = f'{self.path}.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self._hosts, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _new_state(concurrency=INITIAL_CONCURRENCY, best_rate=None, settled=False, settled_at=None):
+        # clean: downloads finished at the settled level since it settled.
+        # probe_from: the settled level while one download probes a level higher.
+        return {'concurrency': concurrency, 'best_rate': best_rate, 'settled': settled,
+                'settled_at': settled_at, 'clean': 0, 'probe_from': None}
+
+    def _state(self, host):
+        return self._hosts.setdefault(host, self._new_state())
+
+    def _settle(self, state, concurrency):
+        state.update(concurrency=concurrency, settled=True, settled_at=self._wall_clock(), clean=0, probe_from=None)
+
+    def concurrency(self, host) -> int:
+        """Return the fragment concurrency to start the next download from *host* with."""
+        with self._lock:
+            return self._state(host)['concurrency']
+
+    def report(self, host, concurrency, nbytes, elapsed):
+        """Record a finished fragmented download of *nbytes* in *elapsed* seconds."""
+        if not nbytes or not elapsed or elapsed <= 0:
+            return
+        rate = nbytes / elapsed
+        with self._lock:
+            state = self._state(host)
+            if concurrency != state['concurrency']:
+                return  # started before the level last changed
+            best = state['best_rate']
+            improved = best is None or rate > best * (1 + _MIN_GAIN)
+            if improved:
+                state['best_rate'] = rate
+            if state['probe_from'] is not None:
+                if improved:
+                    # The site has recovered: keep the higher level and ramp from it.
+                    state.update(settled=False, settled_at=None, probe_from=None)
+                else:
+                    self._settle(state, state['probe_from'])
+            elif not state['settled']:
+                if improved:
+                    state['concurrency'] = min(MAX_CONCURRENCY, concurrency * 2)
+                else:
+                    self._settle(state, max(1, concurrency // 2))
+            else:
+                state['clean'] += 1
+                if state['clean'] >= REPROBE_AFTER and concurrency < MAX_CONCURRENCY:
+                    state.update(probe_from=concurrency, concurrency=concurrency * 2, clean=0)
+            self._save()
+
+    def back_off(self, host):
+        """Halve *host*'s level after throttling or a stall; it is re-probed after clean downloads."""
+        with self._lock:
+            state = self._state(host)
+            if state['probe_from'] is not None:
+                # Only the probe was too much: return to the level that was working.
+                self._settle(state, state['probe_from'])
+            else:
+                state['best_rate'] = None
+                self._settle(state, max(1, state['concurrency'] // 2))
+            self._save()
+
+    def observe(self, host, d):
+        """Feed a yt-dlp progress hook dict; reports throughput and stalls for fragmented downloads."""
+        info = d.get('info_dict') or {}
+        concurrency = info.get(FRAGMENTS_KEY)
+        if not concurrency:
+            return
+        # yt-dlp's final 'finished' callback carries no fragment fields, so
+        # fragmented transfers are remembered from their 'downloading' ones.
+        key = (info.get(JOB_INDEX_KEY), d.get('filename'))
+        status = d.get('status')
+        now = self._clock()
+        with self._lock:
+            host, last = self._transfers.get(key, (host, None))
+            if status != 'downloading':
+                self._transfers.pop(key, None)
+            elif d.get('fragment_count'):
+                self._transfers[key] = (host, now)
+        if last is None:
+            return
+        if status == 'finished':
+            self.report(host, concurrency, d.get('downloaded_bytes') or d.get('total_bytes'), d.get('elapsed'))
+        elif status == 'downloading' and now - last > STALL_SECONDS:
+            self.back_off(host)
+
+    def check_stalls(self):
+        """Back off the host of every fragmented transfer silent for longer than :data:`STALL_SECONDS`.
+
+        A transfer stuck on a fragment makes no progress callbacks at all,
+        so :meth:`observe` alone would only notice once it recovers.  A
+        stalled transfer is forgotten: it is backed off once, and its
+        eventual throughput is not reported.
+        """
+        now = self._clock()
+        with self._lock:
+            stalled = [key for key, (_, last) in self._transfers.items() if now - last > STALL_SECONDS]
+            hosts = {self._transfers.pop(key)[0] for key in stalled}
+        for host in hosts:
+            self.back_off(host)
+
+    @contextlib.contextmanager
+    def watching(self, interval=STALL_CHECK_INTERVAL):
+        """Run :meth:`check_stalls` every *interval* seconds on a background thread while the block runs."""
+        done = threading.Event()
+
+        def watch():
+            while not done.wait(interval):
+                self.check_stalls()
+
+        thread = threading.Thread(target=watch, name='fragment-stall-watch', daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            done.set()
+            thread.join()
+
+
+def open_fragment_tuner(path=None):
+    """Open the tuner backed by ``fragment_concurrency.json`` in the app data dir.
+
+    Falls back to an in-memory tuner if the data directory cannot be created.
+    """
+    try:
+        path = path or os.path.join(data_dir(), 'fragment_concurrency.json')
+    except OSError:
+        path = None
+    return FragmentTuner(path)
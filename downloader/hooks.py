@@ -0,0 +1,76 @@
+"""yt-dlp-facing transfer hooks for :class:`downloader.engine.DownloadEngine`.
+
+Every progress callback yt-dlp makes during a transfer (possibly from its
+fragment threads) passes through :meth:`TransferHooksMixin.progress_hook`,
+which fans it out to the job journal, the fragment tuner, the bandwidth
+governor and the throttled structured-progress callback.
+"""
+
+from .fragments import FRAGMENTS_KEY, is_fragmented
+from .journal import JOB_KEY
+from .progress import JOB_INDEX_KEY, TRANSFER, is_final, progress_snapshot
+from .scheduler import host_key
+
+
+class TransferHooksMixin:
+    """Start transfers tagged for their job and route their progress callbacks."""
+
+    @staticmethod
+    def _tag(job, info):
+        """Return *info* tagged so progress hooks can tell which job they belong to."""
+        return {**info, JOB_KEY: job['job_id'], JOB_INDEX_KEY: job['idx'], FRAGMENTS_KEY: job.get('fragments')}
+
+    def _download(self, ydl, job, info):
+        if not job.get('fragments'):
+            return ydl.process_ie_result(self._tag(job, info), download=True)
+        # Fragment downloaders read this from the session's live params when
+        # they start, so sessions stay keyed by the batch options; the pooled
+        # session gets its own value back for whoever checks it out next.
+        params = ydl.params
+        missing = object()
+        previous = params.get('concurrent_fragment_downloads', missing)
+        params['concurrent_fragment_downloads'] = job['fragments']
+        try:
+            return ydl.process_ie_result(self._tag(job, info), download=True)
+        finally:
+            if previous is missing:
+                params.pop('concurrent_fragment_downloads', None)
+            else:
+                params['concurrent_fragment_downloads'] = previous
+
+    def _was_fragmented(self, job):
+        """Return True if *job*'s transfer fetched fragments, so its fragment level was in play."""
+        with self._lock:
+            if job['idx'] in self._fragmented:
+                return True
+        return is_fragmented(job.get('info'))
+
+    def progress_hook(self, d):
+        if self._stopped():
+            raise Exception("Download cancelled")
+
+        info = d.get('info_dict') or {}
+        job_id = info.get(JOB_KEY)
+        if job_id is not None and d.get('downloaded_bytes') is not None:
+            self._save_progress(job_id, d)
+
+        index = info.get(JOB_INDEX_KEY)
+        host = host_key(info.get('webpage_url') or '')
+        if self.fragment_tuner is not None:
+            if d.get('fragment_count') or d.get('fragment_index'):
+                with self._lock:
+                    self._fragmented.add(index)
+            self.fragment_tuner.observe(host, d)
+        if self.governor is not None:
+            transfer = (index, d.get('filename'))
+            if d.get('status') == 'downloading' and d.get('downloaded_bytes'):
+                self.governor.record(transfer, host, d['downloaded_bytes'], should_stop=self._stopped)
+            elif is_final(d):
+                self.governor.forget(transfer)
+
+        if not self.on_job_progress or d.get('status') not in ('downloading', 'finished', 'error'):
+            return
+        if self._progress_throttle.should_emit(index, final=is_final(d)):
+            # 'finished' is one file's transfer; a merge or more formats may
+            # follow, and post-processing is reported by stage completion.
+            self.on_job_progress(progress_snapshot(d, index, TRANSFER))
@@ -0,0 +1,161 @@
+"""Crash-safe SQLite journal of download jobs.
+
+Every batch is written to the store before its first transfer starts.  Each
+job row carries the URL, a JSON snapshot of the batch's download settings,
+its state, the bytes transferred so far and the output path reserved for it.
+Because the output path is recorded, a resumed job lands on the same
+filename and yt-dlp continues the existing ``.part`` file from its current
+size instead of starting over.
+
+A batch that completes (successfully or not) is removed; a batch that was
+interrupted — app closed mid-download, crash, reboot — stays behind and is
+offered for resumption on the next start.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from app_paths import data_dir
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+_PENDING_STATES = (QUEUED, RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id    TEXT    NOT NULL,
+    position    INTEGER NOT NULL,
+    url         TEXT    NOT NULL,
+    settings    TEXT    NOT NULL,
+    state       TEXT    NOT NULL,
+    bytes_done  INTEGER NOT NULL DEFAULT 0,
+    total_bytes INTEGER,
+    output_path TEXT,
+    error       TEXT,
+    updated_at  REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_batch ON jobs (batch_id, position);
+"""
+
+
+class JobStore:
+    """Thread-safe access to the job journal at *db_path*."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ------------------------------------------------------------------
+    # Batches
+    # ------------------------------------------------------------------
+
+    def create_batch(self, urls, settings: dict):
+        """Journal a new batch; return ``(batch_id, [job_id, ...])`` in URL order."""
+        batch_id = uuid.uuid4().hex
+        snapshot = json.dumps(settings, sort_keys=True)
+        now = time.time()
+        job_ids = []
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                for position, url in enumerate(urls):
+                    cursor = self._conn.execute(
+                        'INSERT INTO jobs (batch_id, position, url, settings, state, updated_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (batch_id, position, url, snapshot, QUEUED, now),
+                    )
+                    job_ids.append(cursor.lastrowid)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return batch_id, job_ids
+
+    def pending_jobs(self, batch_id):
+        """Return ``[{'id', 'url', 'output_path', 'bytes_done'}, ...]`` still to download."""
+        rows = self._execute(
+            'SELECT id, url, output_path, bytes_done FROM jobs '
+            'WHERE batch_id = ? AND state IN (?, ?) ORDER BY position',
+            (batch_id, *_PENDING_STATES),
+        )
+        return [
+            {'id': job_id, 'url': url, 'output_path': output_path, 'bytes_done': bytes_done}
+            for job_id, url, output_path, bytes_done in rows
+        ]
+
+    def unfinished_batches(self):
+        """Return ``[{'batch_id', 'settings', 'jobs'}, ...]`` for interrupted batches."""
+        rows = self._execute(
+            'SELECT batch_id, MIN(settings) FROM jobs '
+            'WHERE state IN (?, ?) GROUP BY batch_id ORDER BY MIN(id)',
+            _PENDING_STATES,
+        )
+        return [
+            {'batch_id': batch_id, 'settings': json.loads(settings), 'jobs': self.pending_jobs(batch_id)}
+            for batch_id, settings in rows
+        ]
+
+    def discard_batch(self, batch_id):
+        """Forget a batch entirely (finished, or declined for resumption)."""
+        self._execute('DELETE FROM jobs WHERE batch_id = ?', (batch_id,))
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def mark_running(self, job_id, output_path):
+        self._execute(
+            'UPDATE jobs SET state = ?, output_path = ?, updated_at = ? WHERE id = ?',
+            (RUNNING, output_path, time.time(), job_id),
+        )
+
+    def record_progress(self, job_id, bytes_done, total_bytes=None):
+        self._execute(
+            'UPDATE jobs SET bytes_done = ?, total_bytes = COALESCE(?, total_bytes), updated_at = ? WHERE id = ?',
+            (int(bytes_done), total_bytes, time.time(), job_id),
+        )
+
+    def mark_done(self, job_id, output_path=None):
+        self._execute(
+            'UPDATE jobs SET state = ?, output_path = COALESCE(?, output_path), error = NULL, updated_at = ? '
+            'WHERE id = ?',
+            (DONE, output_path, time.time(), job_id),
+        )
+
+    def mark_failed(self, job_id, error):
+        self._execute(
+            'UPDATE jobs SET state = ?, error = ?, updated_at = ? WHERE id = ?',
+            (FAILED, error, time.time(), job_id),
+        )
+
+
+def open_job_store(db_path=None):
+    """Open the job journal (default: ``jobs.sqlite3`` in the app data dir).
+
+    Returns None if it cannot be opened, so downloads still work without
+    crash recovery on a read-only or full disk.
+    """
+    try:
+        return JobStore(db_path or os.path.join(data_dir(), 'jobs.sqlite3'))
+    except (OSError, sqlite3.Error):
+        return None
@@ -0,0 +1,71 @@
+"""Job-store bookkeeping for :class:`downloader.engine.DownloadEngine`."""
+
+import sqlite3
+import time
+
+# DownloadEngine keyword arguments journalled with each batch and replayed on resume.
+SETTING_NAMES = (
+    'output_path', 'format_type', 'video_quality', 'audio_codec', 'audio_quality',
+    'download_subs', 'embed_thumbnail', 'normalize_audio', 'denoise_audio',
+    'dynamic_normalization', 'filename_template', 'cookies_from_browser', 'video_container',
+    'denoise_video', 'stabilize_video', 'sharpen_video', 'normalize_video_audio',
+    'denoise_video_audio', 'fetch_lyrics_flag', 'save_lrc',
+)
+
+# Info-dict key that ties progress callbacks (which may arrive on yt-dlp's
+# fragment threads) back to the job they belong to.
+JOB_KEY = '_avms_job_id'
+# Minimum seconds between journal writes of a job's byte count.
+_PROGRESS_SAVE_INTERVAL = 2.0
+
+
+class JobJournalMixin:
+    """Record batch and per-job progress in the engine's optional ``job_store``."""
+
+    def settings_snapshot(self):
+        """Return the download settings as JSON-friendly keyword arguments."""
+        return {name: getattr(self, name) for name in SETTING_NAMES}
+
+    def _journal_jobs(self):
+        """Return one job dict per item to download, journalling the batch.
+
+        Output paths recorded by an earlier run are reserved up front so new
+        items cannot claim the name of a partially downloaded one.
+        """
+        pending = [{'id': None, 'url': url, 'output_path': None} for url in self.urls]
+        try:
+            if self.job_store and self.batch_id:
+                pending = self.job_store.pending_jobs(self.batch_id)
+                self.urls = [job['url'] for job in pending]
+            elif self.job_store:
+                self.batch_id, job_ids = self.job_store.create_batch(self.urls, self.settings_snapshot())
+                for job, job_id in zip(pending, job_ids):
+                    job['id'] = job_id
+        except sqlite3.Error:
+            self.job_store = None
+        for job in pending:
+            if job['output_path']:
+                self._reservations.reserve(job['output_path'])
+        return [
+            {'idx': idx, 'url': job['url'], 'job_id': job['id'], 'recorded_path': job['output_path']}
+            for idx, job in enumerate(pending, 1)
+        ]
+
+    def _journal(self, method, *args):
+        """Call ``job_store.<method>(*args)``; losing crash recovery never fails a download."""
+        if self.job_store is None or args[0] is None:
+            return
+        try:
+            getattr(self.job_store, method)(*args)
+        except sqlite3.Error:
+            pass
+
+    def _save_progress(self, job_id, d):
+        """Journal a job's byte count, at most every few seconds while downloading."""
+        now = time.monotonic()
+        with self._lock:
+            if d['status'] == 'downloading' and now - self._progress_saved.get(job_id, 0) < _PROGRESS_SAVE_INTERVAL:
+                return
+            self._progress_saved[job_id] = now
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        self._journal('record_progress', job_id, d['downloaded_bytes'], int(total) if total else None)
@@ -0,0 +1,118 @@
+"""Fetch and embed lyrics for a completed audio download."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from lyrics import embed_lyrics, fetch_lyrics, is_music_track, save_lrc_file
+
+# Lyrics lookups are network-bound round trips, not CPU work.
+_DEFAULT_LYRICS_WORKERS = 4
+
+
+def find_lrc_sidecar(audio_filepath: str) -> str | None:
+    """Return the path of a .lrc file written alongside *audio_filepath*, if any.
+
+    yt-dlp names subtitle files as ``{stem}.{lang}.lrc``; we scan the
+    parent directory for any ``.lrc`` file whose stem starts with the
+    audio file stem to handle language-code suffixes robustly.
+    """
+    audio_path = Path(audio_filepath)
+    stem = audio_path.stem
+    parent = audio_path.parent
+    try:
+        for candidate in parent.iterdir():
+            if candidate.suffix == '.lrc' and candidate.stem.startswith(stem):
+                return str(candidate)
+    except OSError:
+        pass
+    return None
+
+
+def handle_lyrics(info: dict, audio_filepath: str, save_lrc: bool = False, cache=None) -> None:
+    """Fetch and embed lyrics for *audio_filepath* when *info* is a music track.
+
+    *cache* is an optional :class:`lyrics.LyricsCache` consulted before any
+    provider is queried.
+    """
+    if not is_music_track(info):
+        return
+
+    synced: str | None = None
+    plain: str | None = None
+
+    # Phase 1 — use the .lrc sidecar that yt-dlp wrote for YouTube Music.
+    lrc_path = find_lrc_sidecar(audio_filepath)
+    if lrc_path:
+        try:
+            synced = Path(lrc_path).read_text(encoding='utf-8')
+            if not save_lrc:
+                os.remove(lrc_path)
+        except OSError:
+            synced = None
+
+    # Phase 2 — LRCLIB API for all other platforms (or as a fallback).
+    if not synced and not plain:
+        track = info.get('track') or info.get('title') or ''
+        artist = (
+            info.get('artist')
+            or info.get('creator')
+            or info.get('uploader')
+            or ''
+        )
+        album = info.get('album') or ''
+        duration = info.get('duration')
+        synced, plain = fetch_lyrics(track, artist, album, duration, cache=cache, race=True)
+
+    if not synced and not plain:
+        return
+
+    embed_lyrics(audio_filepath, synced_lrc=synced, plain_text=plain)
+
+    if save_lrc and synced and not lrc_path:
+        save_lrc_file(audio_filepath, synced)
+
+
+class LyricsPool:
+    """Run :func:`handle_lyrics` on background threads, off the download path.
+
+    Lookups (LRCLIB plus the syncedlyrics fallback, each with its own
+    timeout) take seconds, so post-processing hands them here and moves on to
+    the next item.  The batch calls :meth:`wait` once at the very end.
+    Failures never fail the download; they are collected in ``errors`` as
+    ``(audio_filepath, message)`` pairs.  Every job shares *cache*.
+    """
+
+    def __init__(self, max_workers: int = _DEFAULT_LYRICS_WORKERS, cache=None):
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.errors = []
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+
+    def submit(self, info: dict, audio_filepath: str, save_lrc: bool = False) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='lyrics')
+            self._futures.append(self._executor.submit(self._run, info, audio_filepath, save_lrc))
+
+    def _run(self, info, audio_filepath, save_lrc):
+        try:
+            handle_lyrics(info, audio_filepath, save_lrc, cache=self.cache)
+        except Exception as e:
+            with self._lock:
+                self.errors.append((audio_filepath, str(e)))
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(not future.done() for future in self._futures)
+
+    def wait(self, cancel: bool = False) -> None:
+        """Block until every submitted job finishes; with *cancel*, drop jobs not yet started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._futures = []
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=cancel)
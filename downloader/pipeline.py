@@ -0,0 +1,171 @@
+"""Staged item pipeline: bounded queues feeding per-stage worker pools.
+
+Each :class:`Stage` owns a pool of threads that take items from the stage's
+queue, apply the stage's worker and hand the result to the next stage.
+Queues are bounded, so a fast stage blocks once it is far enough ahead of a
+slow one instead of buffering the whole batch.  Because every stage has its
+own pool, items at different stages proceed at the same time: one item can
+be post-processing on the CPU while the next is transferring over the
+network and a third is being extracted.
+"""
+
+import threading
+from collections import deque
+
+_CLOSED = object()
+
+
+class Stage:
+    """One pipeline stage.
+
+    Args:
+        name: Reported in completion events.
+        worker: ``worker(item)`` returns the item to pass to the next stage,
+            or None when the item needs no further stages.
+        workers: Number of threads running this stage.
+        capacity: Maximum items waiting in this stage's queue (0 = unbounded).
+        host_of: Optional ``host_of(item)``; with *per_host_limit*, at most
+            that many items for one host run in this stage at once.  Items
+            for a busy host are passed over in favour of later items for an
+            idle host.
+        per_host_limit: Per-host cap applied when *host_of* is given.
+    """
+
+    def __init__(self, name, worker, workers=1, capacity=0, host_of=None, per_host_limit=None):
+        self.name = name
+        self.worker = worker
+        self.workers = max(1, int(workers))
+        self.capacity = max(0, int(capacity))
+        self.host_of = host_of
+        self.per_host_limit = max(1, int(per_host_limit)) if per_host_limit else None
+
+
+class _StageQueue:
+    """Bounded FIFO that only hands out items whose host has a free slot."""
+
+    def __init__(self, stage):
+        self._stage = stage
+        self._cond = threading.Condition()
+        self._items = deque()
+        self._active = {}
+        self._closed = False
+
+    def _host(self, item):
+        if self._stage.host_of is None or self._stage.per_host_limit is None:
+            return None
+        return self._stage.host_of(item)
+
+    def put(self, item):
+        with self._cond:
+            while self._stage.capacity and len(self._items) >= self._stage.capacity:
+                self._cond.wait()
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get(self):
+        """Return the oldest eligible item, or ``_CLOSED`` once drained and closed."""
+        with self._cond:
+            while True:
+                for index, item in enumerate(self._items):
+                    host = self._host(item)
+                    if host is None or self._active.get(host, 0) < self._stage.per_host_limit:
+                        del self._items[index]
+                        if host is not None:
+                            self._active[host] = self._active.get(host, 0) + 1
+                        self._cond.notify_all()
+                        return item
+                if self._closed and not self._items:
+                    return _CLOSED
+                self._cond.wait()
+
+    def release(self, item):
+        host = self._host(item)
+        if host is None:
+            return
+        with self._cond:
+            self._active[host] -= 1
+            self._cond.notify_all()
+
+
+class Pipeline:
+    """Run items through *stages* in order.
+
+    Args:
+        stages: :class:`Stage` instances, first to last.
+        on_event: Optional ``on_event(stage_name, item, error)`` called from
+            worker threads each time an item leaves a stage; *error* is the
+            exception the worker raised, or None on success.  An item whose
+            worker raised goes no further.
+        should_stop: Optional callable; once it returns True no new items are
+            fed in and queued items are discarded without running.
+    """
+
+    def __init__(self, stages, on_event=None, should_stop=None):
+        self.stages = list(stages)
+        self.on_event = on_event
+        self.should_stop = should_stop
+        self._lock = threading.Lock()
+
+    def _stopped(self):
+        return bool(self.should_stop and self.should_stop())
+
+    def run(self, items):
+        """Feed *items* (any iterable, consumed lazily) and wait for every stage to drain."""
+        queues = [_StageQueue(stage) for stage in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+        threads = []
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._work, args=(index, queues, remaining),
+                    name=f'pipeline-{stage.name}-{n}', daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+        try:
+            for item in items:
+                if self._stopped():
+                    break
+                queues[0].put(item)
+        finally:
+            queues[0].close()
+            for thread in threads:
+                thread.join()
+
+    def _work(self, index, queues, remaining):
+        stage = self.stages[index]
+        queue = queues[index]
+        next_queue = queues[index + 1] if index + 1 < len(queues) else None
+        try:
+            while True:
+                item = queue.get()
+                if item is _CLOSED:
+                    break
+                if self._stopped():
+                    queue.release(item)
+                    continue
+                try:
+                    result = stage.worker(item)
+                except Exception as e:
+                    self._emit(stage.name, item, e)
+                    continue
+                finally:
+                    queue.release(item)
+                self._emit(stage.name, item, None)
+                if result is not None and next_queue is not None:
+                    next_queue.put(result)
+        finally:
+            with self._lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last and next_queue is not None:
+                next_queue.close()
+
+    def _emit(self, stage_name, item, error):
+        if self.on_event:
+            self.on_event(stage_name, item, error)
@@ -0,0 +1,152 @@
+"""Coalesced, structured per-job download progress.
+
+yt-dlp calls progress hooks on every chunk it writes; fragmented (HLS/DASH)
+downloads can produce hundreds of calls per second, from several fragment
+threads at once.  :class:`ProgressThrottle` lets at most *rate_hz* updates per
+job through, always passing the final ``finished``/``error`` update, and
+:func:`progress_snapshot` turns a hook dict into plain numbers so consumers
+never parse yt-dlp's formatted ``_percent_str``.  :class:`BatchProgress`
+folds the per-job updates into one percent for the whole batch.
+"""
+
+import os
+import threading
+import time
+
+# Pipeline stage names, as reported in progress and stage-completion events.
+EXTRACT = 'extract'
+TRANSFER = 'transfer'
+POSTPROCESS = 'postprocess'
+
+# Info-dict key carrying the job's 1-based batch index into progress hooks.
+JOB_INDEX_KEY = '_avms_job_index'
+
+_FINAL_STATUSES = ('finished', 'error')
+
+
+class ProgressThrottle:
+    """Per-key rate limiter for progress updates.  Thread-safe."""
+
+    def __init__(self, rate_hz=10.0, clock=time.monotonic):
+        self.interval = 1.0 / rate_hz if rate_hz and rate_hz > 0 else 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last = {}
+
+    def should_emit(self, key, final=False) -> bool:
+        """Return True if an update for *key* may be sent now.
+
+        *final* updates are always sent and reset the key's timer.
+        """
+        now = self._clock()
+        with self._lock:
+            if final:
+                self._last.pop(key, None)
+                return True
+            last = self._last.get(key)
+            if last is not None and now - last < self.interval:
+                return False
+            self._last[key] = now
+            return True
+
+
+class BatchProgress:
+    """Overall percent of a batch whose jobs report progress independently.
+
+    Parallel jobs each send their own :func:`progress_snapshot`; showing any
+    one of them makes a single progress bar jump between jobs.  Each job
+    counts for an equal share: its latest transfer percent until it
+    completes, then all of it.  Jobs that have not reported count as 0.
+    """
+
+    def __init__(self, total):
+        self.total = max(1, int(total))
+        self._percent = {}
+        self._done = set()
+
+    def update(self, progress) -> int:
+        """Record a job's snapshot; return the batch percent (0-100 int)."""
+        index = progress['index']
+        if index not in self._done:
+            self._percent[index] = progress['percent']
+        return self.percent()
+
+    def complete(self, index) -> int:
+        """Count job *index* as finished; return the batch percent."""
+        self._done.add(index)
+        self._percent[index] = 100
+        return self.percent()
+
+    def percent(self) -> int:
+        return min(100, int(sum(self._percent.values()) / self.total))
+
+
+def _number(value):
+    return value if isinstance(value, (int, float)) else None
+
+
+def progress_snapshot(d, index, stage) -> dict:
+    """Return a structured progress dict for the yt-dlp hook dict *d*.
+
+    Keys: ``index``, ``stage``, ``status``, ``filename``,
+    ``downloaded_bytes``, ``total_bytes`` (exact or estimated, or None),
+    ``speed`` (bytes/s or None), ``eta`` (seconds or None),
+    ``fragment_index``, ``fragment_count`` and ``percent`` (0-100 int).
+    """
+    status = d.get('status')
+    downloaded = _number(d.get('downloaded_bytes')) or 0
+    total = _number(d.get('total_bytes')) or _number(d.get('total_bytes_estimate'))
+    fragment_index = _number(d.get('fragment_index'))
+    fragment_count = _number(d.get('fragment_count'))
+
+    if status == 'finished':
+        percent = 100.0
+    elif total:
+        percent = downloaded / total * 100
+    elif fragment_index and fragment_count:
+        percent = fragment_index / fragment_count * 100
+    else:
+        percent = 0.0
+
+    return {
+        'index': index,
+        'stage': stage,
+        'status': status,
+        'filename': d.get('filename') or d.get('tmpfilename') or '',
+        'downloaded_bytes': int(downloaded),
+        'total_bytes': int(total) if total else None,
+        'speed': _number(d.get('speed')),
+        'eta': _number(d.get('eta')),
+        'fragment_index': fragment_index,
+        'fragment_count': fragment_count,
+        'percent': max(0, min(100, int(percent))),
+    }
+
+
+def is_final(d) -> bool:
+    return d.get('status') in _FINAL_STATUSES
+
+
+def _format_bytes(count):
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if count < 1024 or unit == 'GiB':
+            return f'{count:.0f} {unit}' if unit == 'B' else f'{count:.1f} {unit}'
+        count /= 1024
+
+
+def describe_progress(p) -> str:
+    """Return a one-line human summary of a :func:`progress_snapshot` dict."""
+    name = os.path.basename(p['filename']) or 'Downloading...'
+    if p['status'] == 'finished':
+        return f'{name}: downloaded'
+    parts = [_format_bytes(p['downloaded_bytes'])]
+    if p['total_bytes']:
+        parts[0] += f" / {_format_bytes(p['total_bytes'])}"
+    if p['speed']:
+        parts.append(f"{_format_bytes(p['speed'])}/s")
+    if p['eta'] is not None:
+        minutes, seconds = divmod(int(p['eta']), 60)
+        parts.append(f'ETA {minutes}:{seconds:02d}')
+    if p['fragment_index'] and p['fragment_count']:
+        parts.append(f"fragment {p['fragment_index']}/{p['fragment_count']}")
+    return f"{name}: {', '.join(parts)}"
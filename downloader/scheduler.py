@@ -0,0 +1,56 @@
+"""Per-host keys for concurrency caps, and batch-wide output filename reservation."""
+
+import os
+import threading
+from urllib.parse import urlparse
+
+# Every YouTube hostname is one origin for throttling.  This is wider than
+# extractors.is_youtube_url, which leaves out music.youtube.com.
+_YOUTUBE_HOSTNAMES = frozenset({'youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com', 'youtu.be'})
+_YOUTUBE_HOST_KEY = 'youtube.com'
+
+
+def host_key(url: str) -> str:
+    """Return the hostname *url* is counted against for per-host limits.
+
+    YouTube's many hostnames collapse onto one key; everything else is keyed
+    by its lowercased hostname without a leading ``www.``.
+    """
+    try:
+        hostname = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    if hostname in _YOUTUBE_HOSTNAMES:
+        return _YOUTUBE_HOST_KEY
+    return hostname.removeprefix('www.')
+
+
+class FilenameReservations:
+    """Batch-wide registry of output filenames claimed by download workers.
+
+    Paths are reserved by stem (extension stripped) because post-processing
+    can change the extension — two sources named ``Song.webm`` and
+    ``Song.m4a`` would both end up as ``Song.mp3``.  Reservations are held
+    for the whole batch so a later item cannot land on an earlier item's file
+    and be mistaken for an already-downloaded copy.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stems = set()
+
+    def reserve(self, filepath: str) -> str:
+        """Claim *filepath* and return the stem that was reserved.
+
+        If the stem is already taken, `` (2)``, `` (3)``, ... is appended
+        until a free stem is found.
+        """
+        stem = os.path.splitext(filepath)[0]
+        with self._lock:
+            candidate = stem
+            counter = 2
+            while os.path.normcase(candidate) in self._stems:
+                candidate = f'{stem} ({counter})'
+                counter += 1
+            self._stems.add(os.path.normcase(candidate))
+        return candidate
@@ -0,0 +1,101 @@
+"""Pool of warm ``YoutubeDL`` instances shared across the items of a batch."""
+
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from extractors import install_fused_audio, shared_cookie_jars, split_fused_audio
+from lazy_imports import LazyModule
+
+yt_dlp = LazyModule('yt_dlp')
+
+
+def options_key(opts: dict) -> str:
+    """Return a stable key for a yt-dlp option dict.
+
+    Values that are not JSON-serialisable (progress hooks, postprocessor
+    instances) are keyed by ``repr``, so the same bound method or object
+    always maps to the same key.
+    """
+    return json.dumps(opts, sort_keys=True, default=repr)
+
+
+class YoutubeDLSessionPool:
+    """Check out ``YoutubeDL`` instances by effective option set and reuse them.
+
+    Building a ``YoutubeDL`` re-initialises its HTTP handlers, cookie jar,
+    extractor registry and postprocessor chain, and a fresh instance starts
+    with no keep-alive connections.  Items that share settings therefore
+    borrow an idle instance with identical options instead.
+
+    ``YoutubeDL`` is not safe for concurrent use, so every checkout is
+    exclusive: the pool grows to at most one instance per concurrently
+    running worker for each option set.  An instance whose item raised is
+    closed rather than returned, since a failed download can leave it in an
+    unknown state.  At most *max_idle* idle instances are kept; the least
+    recently used are closed first.
+    """
+
+    def __init__(self, max_idle: int = 8):
+        self.max_idle = max(1, max_idle)
+        self._lock = threading.Lock()
+        self._idle = OrderedDict()
+        self._idle_count = 0
+        self._closed = False
+
+    @contextmanager
+    def session(self, opts: dict):
+        """Yield a ``YoutubeDL`` built with *opts*, reusing an idle one if possible."""
+        key = options_key(opts)
+        ydl = self._checkout(key)
+        if ydl is None:
+            ydl_opts, fused = split_fused_audio(opts)
+            ydl = shared_cookie_jars.youtube_dl(yt_dlp.YoutubeDL, ydl_opts)
+            install_fused_audio(ydl, fused)
+        try:
+            yield ydl
+        except BaseException:
+            ydl.close()
+            raise
+        self._checkin(key, ydl)
+
+    def close(self):
+        """Close every idle instance; later check-ins are closed immediately."""
+        with self._lock:
+            self._closed = True
+            idle = [ydl for bucket in self._idle.values() for ydl in bucket]
+            self._idle.clear()
+            self._idle_count = 0
+        for ydl in idle:
+            ydl.close()
+
+    def _checkout(self, key):
+        with self._lock:
+            bucket = self._idle.get(key)
+            if not bucket:
+                return None
+            ydl = bucket.pop()
+            self._idle_count -= 1
+            if not bucket:
+                del self._idle[key]
+            return ydl
+
+    def _checkin(self, key, ydl):
+        evicted = []
+        with self._lock:
+            if self._closed:
+                evicted.append(ydl)
+            else:
+                self._idle.setdefault(key, []).append(ydl)
+                self._idle.move_to_end(key)
+                self._idle_count += 1
+                while self._idle_count > self.max_idle:
+                    oldest_key = next(iter(self._idle))
+                    bucket = self._idle[oldest_key]
+                    evicted.append(bucket.pop(0))
+                    self._idle_count -= 1
+                    if not bucket:
+                        del self._idle[oldest_key]
+        for stale in evicted:
+            stale.close()
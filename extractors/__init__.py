@@ -5,10 +5,15 @@ Platform-specific video extractors for AV Morning Star
 from urllib.parse import urlparse
 
 from .base import BaseExtractor
+from .cookie_jars import AUTH_RELOAD_INTERVAL, BrowserCookieJars, is_auth_error, shared_cookie_jars
+from .fetch_cache import FetchCache, open_fetch_cache
+from .fused_audio import install_fused_audio, split_fused_audio
 from .generic import GenericExtractor
+from .info_cache import InfoCache, shared_info_cache
 from .platform_names import platform_name_for_url
 from .podcast_page import PodcastPageExtractor
 from .rss import RSSExtractor
+from .sync_state import SyncState, open_sync_state, video_id
 from .youtube_ytdlp import YouTubeExtractor  # Using yt-dlp backend for PO token support
 
 __all__ = [
@@ -17,6 +22,19 @@ __all__ = [
     'GenericExtractor',
     'PodcastPageExtractor',
     'RSSExtractor',
+    'InfoCache',
+    'FetchCache',
+    'open_fetch_cache',
+    'SyncState',
+    'open_sync_state',
+    'video_id',
+    'shared_info_cache',
+    'AUTH_RELOAD_INTERVAL',
+    'BrowserCookieJars',
+    'shared_cookie_jars',
+    'is_auth_error',
+    'split_fused_audio',
+    'install_fused_audio',
     'get_extractor',
     'is_youtube_url',
     'is_rss_url',
@@ -4,10 +4,10 @@ Base extractor class defining the common interface for all platform extractors
 
 import os
 
-import yt_dlp
-
+from lazy_imports import LazyModule
 from lyrics.detector import is_youtube_music_url
 
+from .cookie_jars import shared_cookie_jars
 from .extract_errors import format_extract_error
 from .ffmpeg_filters import (
     AUDIO_DENOISE_FILTER,
@@ -17,8 +17,12 @@ from .ffmpeg_filters import (
     VIDEO_SHARPEN_FILTER,
     strip_ansi_codes,
 )
+from .info_cache import shared_info_cache
+from .sync_state import entry_id, until_known
 from .ytdlp_format_opts import build_audio_opts, build_video_opts
 
+yt_dlp = LazyModule('yt_dlp')
+
 __all__ = [
     'BaseExtractor',
     'VIDEO_DENOISE_FILTER',
@@ -122,7 +126,7 @@ class BaseExtractor:
 
     def extract_info(self):
         try:
-            with yt_dlp.YoutubeDL(self.get_fetch_opts()) as ydl:
+            with shared_cookie_jars.youtube_dl(yt_dlp.YoutubeDL, self.get_fetch_opts()) as ydl:
                 info = ydl.extract_info(self.url, download=False)
 
                 if info and 'entries' in info:
@@ -130,19 +134,74 @@ class BaseExtractor:
                 return self._parse_single_video(info)
 
         except Exception as e:
-            error_msg = strip_ansi_codes(str(e))
-            raise format_extract_error(error_msg) from e
+            raise self._fetch_error(e) from e
+
+    def iter_video_batches(self, batch_size=100, stop_at=None, start=0):
+        """Yield the video list in batches of up to *batch_size* entries.
+
+        With flat extraction, playlist and channel entries are read lazily
+        (``process=False``), so the first batch is ready after the first page
+        rather than after yt-dlp has paged through everything.  Extractors
+        that resolve every entry fall back to one batch from
+        :meth:`extract_info`.
+
+        *stop_at* is a set of entry IDs already synced: listing stops at the
+        first of them, before any further pages are requested.
+
+        *start* skips that many leading playlist entries (those an interrupted
+        fetch already listed).  yt-dlp's ``playliststart`` does the skipping:
+        paged sources jump straight to the page holding the entry, lazily
+        paged ones (YouTube tabs) still walk the earlier pages but never
+        build their entries.
+        """
+        opts = self.get_fetch_opts()
+        if not opts.get('extract_flat'):
+            videos = self.extract_info()[start:]
+            yield until_known(videos, stop_at) if stop_at else videos
+            return
+        if start:
+            opts = {**opts, 'playliststart': start + 1}
+        try:
+            with shared_cookie_jars.youtube_dl(yt_dlp.YoutubeDL, opts) as ydl:
+                info = ydl.extract_info(self.url, download=False, process=False)
+                # Follow redirects (e.g. a channel URL to its Videos tab) the
+                # way processing would, unless every URL result stays flat.
+                while info and info.get('_type') in ('url', 'url_transparent') and opts['extract_flat'] is not True:
+                    info = ydl.extract_info(info['url'], download=False, ie_key=info.get('ie_key'), process=False)
+
+                if not info or info.get('_type') not in ('playlist', 'multi_video'):
+                    yield self._parse_single_video(ydl.process_ie_result(info, download=False) if info else info)
+                    return
+
+                batch = []
+                for _, entry in yt_dlp.utils.PlaylistEntries(ydl, info).get_requested_items():
+                    if stop_at and entry and entry_id(entry) in stop_at:
+                        break
+                    batch.append(entry)
+                    if len(batch) >= batch_size:
+                        yield self._parse_playlist(batch)
+                        batch = []
+                if batch:
+                    yield self._parse_playlist(batch)
+        except Exception as e:
+            raise self._fetch_error(e) from e
+
+    def _fetch_error(self, e):
+        """Return the user-facing exception for a failed fetch."""
+        return format_extract_error(strip_ansi_codes(str(e)))
 
     def _parse_playlist(self, entries):
         videos = []
         for entry in entries:
             if entry:
+                url = (
+                    entry.get('url')
+                    or entry.get('webpage_url')
+                    or f"https://www.youtube.com/watch?v={entry.get('id')}"
+                )
+                self._remember_info(url, entry)
                 videos.append({
-                    'url': (
-                        entry.get('url')
-                        or entry.get('webpage_url')
-                        or f"https://www.youtube.com/watch?v={entry.get('id')}"
-                    ),
+                    'url': url,
                     'title': entry.get('title', 'Unknown Title'),
                     'duration': entry.get('duration', 0),
                     'uploader': self._get_uploader(entry),
@@ -150,6 +209,7 @@ class BaseExtractor:
         return videos
 
     def _parse_single_video(self, info):
+        self._remember_info(self.url, info)
         return [{
             'url': self.url,
             'title': info.get('title', 'Unknown Title'),
@@ -157,6 +217,10 @@ class BaseExtractor:
             'uploader': self._get_uploader(info),
         }]
 
+    def _remember_info(self, url, info):
+        """Keep fetch-phase metadata so the download phase can skip re-extraction."""
+        shared_info_cache.remember(url, info, self.cookies_from_browser)
+
     def _get_uploader(self, info):
         return (
             info.get('uploader')
@@ -0,0 +1,107 @@
+"""Browser cookies loaded once and shared in memory by every yt-dlp instance.
+
+A ``YoutubeDL`` built with ``cookiesfrombrowser`` reads the browser's cookie
+store on first use: a copy of its SQLite database and, for Chromium browsers,
+a keyring round trip to decrypt it.  The fetch thread and every download item
+each built their own instance, so a batch paid that cost once per item.
+
+:class:`BrowserCookieJars` loads each browser's cookies once into a
+``YoutubeDLCookieJar`` and hands the same jar to every instance, which also
+keeps cookies the site updates during the session.  The jar has no filename
+and is never saved, so cookies stay in memory only.  After an authentication
+error the jar is dropped and reloaded on next use, picking up a fresh login.
+"""
+
+import threading
+import time
+
+from lazy_imports import LazyModule
+
+yt_dlp_cookies = LazyModule('yt_dlp.cookies')
+
+# An item failing on auth reloads the jar at most this often per batch.
+AUTH_RELOAD_INTERVAL = 60
+
+# Lower-cased error fragments that mean the site wants a (fresh) login.
+AUTH_ERROR_MARKERS = (
+    'sign in to confirm',
+    'login required',
+    'log in to',
+    'please log in',
+    'members only',
+    'cookies are no longer valid',
+)
+
+
+def is_auth_error(message):
+    """Return True if a yt-dlp error *message* suggests missing or stale cookies."""
+    lower = str(message).lower()
+    return any(marker in lower for marker in AUTH_ERROR_MARKERS)
+
+
+def _spec_key(spec):
+    """Normalise a browser name or ``cookiesfrombrowser`` tuple to a tuple key."""
+    return tuple(spec) if isinstance(spec, (tuple, list)) else (spec,)
+
+
+def _load_from_browser(spec):
+    name, profile, keyring, container = (*spec, None, None, None)[:4]
+    return yt_dlp_cookies.extract_cookies_from_browser(name, profile, keyring=keyring, container=container)
+
+
+class BrowserCookieJars:
+    """One in-memory cookie jar per browser specification.  Thread-safe.
+
+    Args:
+        loader: Callable taking a ``cookiesfrombrowser`` tuple and returning a
+            cookie jar; defaults to yt-dlp's browser cookie extraction.
+    """
+
+    def __init__(self, loader=None):
+        self._loader = loader or _load_from_browser
+        # Held while loading, so concurrent first users share one load
+        # (and one keyring prompt) instead of racing.
+        self._lock = threading.Lock()
+        # key -> (jar, loaded_at)
+        self._jars = {}
+
+    def jar(self, spec):
+        """Return the shared jar for *spec*, loading it on first use."""
+        key = _spec_key(spec)
+        with self._lock:
+            entry = self._jars.get(key)
+            if entry is None:
+                entry = self._jars[key] = (self._loader(key), time.monotonic())
+            return entry[0]
+
+    def invalidate(self, spec=None, min_age=0):
+        """Drop the jar for *spec* (every jar if None) so the next use reloads it.
+
+        With *min_age*, a jar loaded less than that many seconds ago is kept,
+        so a batch whose items all fail on auth reloads once, not per item.
+        """
+        cutoff = time.monotonic() - min_age
+        with self._lock:
+            keys = list(self._jars) if spec is None else [_spec_key(spec)]
+            for key in keys:
+                entry = self._jars.get(key)
+                if entry is not None and entry[1] <= cutoff:
+                    del self._jars[key]
+
+    def youtube_dl(self, factory, opts):
+        """Return ``factory(opts)`` using the shared jar for ``opts['cookiesfrombrowser']``.
+
+        *factory* is ``yt_dlp.YoutubeDL`` (or a stand-in).  The browser option
+        is removed so the instance never reads the store itself; its
+        ``cookiejar`` cached property is set to the shared jar instead.
+        """
+        spec = opts.get('cookiesfrombrowser')
+        if not spec:
+            return factory(opts)
+        jar = self.jar(spec)
+        ydl = factory({key: value for key, value in opts.items() if key != 'cookiesfrombrowser'})
+        ydl.cookiejar = jar
+        return ydl
+
+
+shared_cookie_jars = BrowserCookieJars()
@@ -0,0 +1,225 @@
+"""Cache of fetch results (the video lists shown in the UI), in memory and on disk.
+
+A fetch of a large channel or playlist can take minutes, and clicking Fetch
+again a minute later used to repeat all of it.  :class:`FetchCache` keeps the
+normalised video list for each ``(url, cookies_from_browser)`` pair, since
+what a site lists can depend on who is signed in, for a limited time:
+
+* recent results are kept in memory, and every result is written to a small
+  SQLite database so it survives a restart;
+* identical fetches already in flight are coalesced: later callers wait for
+  the first one and share its result instead of starting their own;
+* ``refresh=True`` bypasses the cache (the UI's Refresh button).
+
+The ``(ie_key, id)`` handles :data:`extractors.shared_info_cache` recorded
+during the original fetch are stored too and restored on a cache hit, so
+archive marks and download-time extractor steering keep working.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from app_paths import cache_dir
+
+from .info_cache import shared_info_cache
+
+FETCH_TTL = 60 * 60
+_MAX_MEMORY_ENTRIES = 16
+_MAX_DISK_ENTRIES = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    url       TEXT NOT NULL,
+    auth      TEXT NOT NULL,
+    videos    TEXT NOT NULL,
+    handles   TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (url, auth)
+);
+"""
+
+
+class _Flight:
+    """One fetch in progress that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.videos = None
+        self.error = None
+
+
+def _key(url, cookies_from_browser):
+    return (url.strip(), cookies_from_browser or '')
+
+
+class FetchCache:
+    """Thread-safe TTL cache of fetch results.
+
+    Args:
+        db_path: SQLite file backing the cache, or None for memory only.
+        ttl: Seconds a result is served before it is fetched again.
+    """
+
+    def __init__(self, db_path=None, ttl=FETCH_TTL, info_cache=None):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._info_cache = info_cache if info_cache is not None else shared_info_cache
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Lookup and storage
+    # ------------------------------------------------------------------
+
+    def get(self, url, cookies_from_browser=None, now=None):
+        """Return the cached video list for *url*, or None if absent or expired."""
+        key = _key(url, cookies_from_browser)
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                entry = self._load(key)
+            if entry is None:
+                return None
+            videos, handles, stored_at = entry
+            if now - stored_at >= self.ttl:
+                self._drop(key)
+                return None
+            self._remember_in_memory(key, entry)
+        for video_url, (ie_key, video_id) in handles.items():
+            self._info_cache.remember(video_url, {'ie_key': ie_key, 'id': video_id})
+        return [dict(video) for video in videos]
+
+    def put(self, url, cookies_from_browser, videos, now=None):
+        """Store a fresh fetch result."""
+        key = _key(url, cookies_from_browser)
+        stored_at = time.time() if now is None else now
+        handles = {}
+        for video in videos:
+            ie_key, video_id = self._info_cache.handle(video.get('url'))
+            if ie_key:
+                handles[video['url']] = (ie_key, video_id)
+        entry = ([dict(video) for video in videos], handles, stored_at)
+        with self._lock:
+            self._remember_in_memory(key, entry)
+            self._store(key, entry)
+
+    def invalidate(self, url, cookies_from_browser=None):
+        with self._lock:
+            self._drop(_key(url, cookies_from_browser))
+
+    def _remember_in_memory(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > _MAX_MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def _drop(self, key):
+        self._memory.pop(key, None)
+        if self._conn is not None:
+            try:
+                self._conn.execute('DELETE FROM fetches WHERE url = ? AND auth = ?', key)
+            except sqlite3.Error:
+                pass
+
+    def _load(self, key):
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                'SELECT videos, handles, stored_at FROM fetches WHERE url = ? AND auth = ?', key,
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        try:
+            videos = json.loads(row[0])
+            handles = {url: tuple(handle) for url, handle in json.loads(row[1]).items()}
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return videos, handles, row[2]
+
+    def _store(self, key, entry):
+        if self._conn is None:
+            return
+        videos, handles, stored_at = entry
+        try:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO fetches (url, auth, videos, handles, stored_at) VALUES (?, ?, ?, ?, ?)',
+                (*key, json.dumps(videos), json.dumps(handles), stored_at),
+            )
+            self._conn.execute(
+                'DELETE FROM fetches WHERE rowid NOT IN '
+                '(SELECT rowid FROM fetches ORDER BY stored_at DESC LIMIT ?)',
+                (_MAX_DISK_ENTRIES,),
+            )
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+    # ------------------------------------------------------------------
+    # Coalesced fetch
+    # ------------------------------------------------------------------
+
+    def fetch(self, url, cookies_from_browser, fetch_videos, refresh=False):
+        """Return ``(videos, from_cache)``, calling ``fetch_videos()`` only when needed.
+
+        A caller arriving while an identical fetch is running waits for it and
+        shares its result (or its exception).
+        """
+        if not refresh:
+            cached = self.get(url, cookies_from_browser)
+            if cached is not None:
+                return cached, True
+
+        key = _key(url, cookies_from_browser)
+        with self._lock:
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._inflight[key] = _Flight()
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return [dict(video) for video in flight.videos], False
+
+        try:
+            flight.videos = fetch_videos()
+            self.put(url, cookies_from_browser, flight.videos)
+            return flight.videos, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+
+def open_fetch_cache(db_path=None):
+    """Open the fetch cache (default: ``fetch.sqlite3`` in the app cache dir).
+
+    Falls back to a memory-only cache if the database cannot be opened.
+    """
+    try:
+        return FetchCache(db_path or os.path.join(cache_dir(), 'fetch.sqlite3'))
+    except (OSError, sqlite3.Error):
+        return FetchCache()
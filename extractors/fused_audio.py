@@ -0,0 +1,74 @@
+"""Single-pass audio post-processing: convert, filter, tag and attach artwork in one FFmpeg run.
+
+yt-dlp's audio chain runs ``FFmpegExtractAudio`` (with ``-af`` filters), then
+``FFmpegMetadata``, then ``EmbedThumbnail``; each reads and rewrites the whole
+output file.  :func:`build_audio_opts` instead lists one ``FusedAudio`` entry
+whose postprocessor (:mod:`extractors.fused_audio_pp`) does all of it in the
+conversion run.  Cover art goes into that run where FFmpeg writes it the way
+players expect (MP3); other containers get it from yt-dlp's EmbedThumbnail,
+which tags them in place with mutagen.
+
+yt-dlp only builds postprocessors it knows by key, so the entry is taken out
+of the options before ``YoutubeDL`` sees them and its postprocessor is added
+to the instance (:func:`split_fused_audio`, :func:`install_fused_audio`).
+"""
+
+from lazy_imports import LazyModule
+
+fused_audio_pp = LazyModule('extractors.fused_audio_pp')
+
+FUSED_AUDIO_KEY = 'FusedAudio'
+
+# Output extensions whose cover art is attached in the FFmpeg run itself.
+FUSED_COVER_EXTS = ('mp3',)
+# Image formats MP3 cover art accepts as-is; anything else is re-encoded to PNG.
+_COVER_IMAGE_EXTS = ('jpg', 'jpeg', 'png')
+
+
+def fused_audio_args(codec, codec_opts=(), filters=(), metadata_args=(), cover=None, chapters_input=None):
+    """Return FFmpeg output arguments for one fused audio pass.
+
+    Args:
+        codec: Audio encoder, ``'copy'``, or None for FFmpeg's default.
+        codec_opts: Encoder options (quality, muxer flags).
+        filters: ``-af`` filter strings, applied in order.
+        metadata_args: Flat ``-metadata`` arguments (see yt-dlp's FFmpegMetadata).
+        cover: ``(input index, image extension)`` of the artwork, or None.
+        chapters_input: Index of an FFMETADATA input holding the chapters, or None.
+    """
+    args = ['-map', '0:a']
+    if cover is not None:
+        index, image_ext = cover
+        args += [
+            '-map', f'{index}:v',
+            '-c:v', 'copy' if image_ext in _COVER_IMAGE_EXTS else 'png',
+            # ID3v2.3 is what most players read cover art from (as yt-dlp's EmbedThumbnail writes).
+            '-id3v2_version', '3',
+            '-metadata:s:v', 'title=Album cover', '-metadata:s:v', 'comment=Cover (front)',
+        ]
+    if chapters_input is not None:
+        args += ['-map_metadata', str(chapters_input)]
+    if filters:
+        args += ['-af', ','.join(filters)]
+    if codec is not None:
+        args += ['-acodec', codec]
+    return [*args, *codec_opts, *metadata_args]
+
+
+def split_fused_audio(opts):
+    """Return ``(opts, specs)``: *opts* without ``FusedAudio`` entries, and those entries' arguments."""
+    postprocessors = opts.get('postprocessors') or []
+    specs = [
+        {key: value for key, value in pp.items() if key != 'key'}
+        for pp in postprocessors if pp.get('key') == FUSED_AUDIO_KEY
+    ]
+    if not specs:
+        return opts, []
+    remaining = [pp for pp in postprocessors if pp.get('key') != FUSED_AUDIO_KEY]
+    return {**opts, 'postprocessors': remaining}, specs
+
+
+def install_fused_audio(ydl, specs):
+    """Add a fused audio postprocessor to *ydl* for each spec from :func:`split_fused_audio`."""
+    for spec in specs:
+        ydl.add_post_processor(fused_audio_pp.FusedAudioPP(ydl, **spec), when='post_process')
@@ -0,0 +1,103 @@
+"""The ``FusedAudio`` yt-dlp postprocessor (see :mod:`extractors.fused_audio`).
+
+Imports yt-dlp's postprocessors, so it is only loaded when a download
+session installs one.
+"""
+
+import os
+
+from yt_dlp.postprocessor import (
+    EmbedThumbnailPP,
+    FFmpegExtractAudioPP,
+    FFmpegMetadataPP,
+    FFmpegThumbnailsConvertorPP,
+    PostProcessor,
+)
+from yt_dlp.postprocessor.ffmpeg import ACODECS, FFmpegPostProcessorError
+from yt_dlp.utils import PostProcessingError, determine_ext, prepend_extension, replace_extension
+
+from .fused_audio import FUSED_COVER_EXTS, fused_audio_args
+
+
+class FusedAudioPP(FFmpegExtractAudioPP):
+    """FFmpegExtractAudio that also filters, tags and attaches artwork in its FFmpeg run.
+
+    Codec selection, quality and file handling are FFmpegExtractAudio's; only
+    the FFmpeg invocation is widened.  A file already in the target format,
+    which FFmpegExtractAudio leaves alone, still gets one pass for its
+    filters and tags.
+    """
+
+    def __init__(self, downloader=None, preferredcodec=None, preferredquality=None, filters=(),
+                 embed_thumbnail=False):
+        super().__init__(downloader, preferredcodec, preferredquality)
+        self._filters = list(filters)
+        self._embed_thumbnail = embed_thumbnail
+
+    @PostProcessor._restrict_to(images=False)
+    def run(self, information):
+        self._info = information
+        self._ran = self._cover_attached = False
+        files_to_delete, information = super().run(information)
+        if not self._ran:
+            path = information['filepath']
+            temp_path = prepend_extension(path, 'temp')
+            self.to_screen(f'Tagging "{path}"')
+            self.run_ffmpeg(path, temp_path, 'copy', [])
+            os.replace(temp_path, path)
+        if self._embed_thumbnail and not self._cover_attached:
+            more, information = EmbedThumbnailPP(self._downloader).run(information)
+            files_to_delete += more
+        return files_to_delete, information
+
+    def run_ffmpeg(self, path, out_path, codec, more_opts):
+        self._ran = True
+        info = self._info
+        ext = determine_ext(out_path)
+        filters = self._filters
+        if filters and codec == 'copy':
+            # Filtering needs a decode and encode, even into the same format.
+            _, encoder, _ = ACODECS.get({'ogg': 'vorbis'}.get(ext, ext), (None, None, None))
+            if encoder:
+                codec, more_opts = encoder, self._quality_args(encoder)
+            else:
+                self.report_warning(f'Cannot filter {ext} audio without changing its codec; skipping filters')
+                filters = []
+
+        inputs = [path]
+        cover = self._thumbnail(info) if self._embed_thumbnail and ext in FUSED_COVER_EXTS else None
+        if cover:
+            inputs.append(cover)
+        chapters_path = None
+        if info.get('chapters'):
+            self._fixup_chapters(info)
+            chapters_path = replace_extension(path, 'meta')
+            # Writes the FFMETADATA file; the -map_metadata it yields assumes input 1.
+            list(FFmpegMetadataPP._get_chapter_opts(info['chapters'], chapters_path))
+            inputs.append(chapters_path)
+        metadata = [arg for pair in FFmpegMetadataPP._get_metadata_opts(self, info) for arg in pair]
+
+        args = fused_audio_args(
+            codec, more_opts, filters, metadata,
+            cover=(1, determine_ext(cover)) if cover else None,
+            chapters_input=len(inputs) - 1 if chapters_path else None,
+        )
+        try:
+            self.run_ffmpeg_multiple_files(inputs, out_path, args)
+        except FFmpegPostProcessorError as err:
+            raise PostProcessingError(f'audio conversion failed: {err.msg}')
+        finally:
+            if chapters_path:
+                self._delete_downloaded_files(chapters_path)
+        if cover:
+            self._cover_attached = True
+            self._delete_downloaded_files(cover, info=info)
+
+    def _thumbnail(self, info):
+        """Return the path of the thumbnail written for *info*, or None."""
+        idx = next((-i for i, t in enumerate((info.get('thumbnails') or [])[::-1], 1) if t.get('filepath')), None)
+        if idx is None or not os.path.exists(info['thumbnails'][idx]['filepath']):
+            return None
+        # Fix a WebP saved with a .jpg extension so FFmpeg is not told it is JPEG.
+        FFmpegThumbnailsConvertorPP(self._downloader).fixup_webp(info, idx)
+        return info['thumbnails'][idx]['filepath']
@@ -0,0 +1,110 @@
+"""In-process cache of yt-dlp info dicts for reuse between fetch and download.
+
+The fetch phase already runs ``extract_info`` for every URL it lists.  For a
+single video that is a full extraction (formats and signed media URLs); for
+playlist entries it is a flat stub whose ``ie_key`` still saves the download
+phase from matching the URL against every extractor.  ``DownloadEngine``
+consults this cache before extracting again.
+
+Signed media URLs expire (YouTube's carry an ``expire=`` timestamp), so a full
+info dict is only handed out while every format URL has comfortably longer
+to live; infos without an expiry marker fall back to a short TTL.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
+# Infos without an explicit expiry are trusted for this long after fetch.
+_DEFAULT_INFO_TTL = 10 * 60
+# Require this much remaining lifetime on signed URLs before reusing them.
+_EXPIRY_MARGIN = 15 * 60
+
+
+def _url_expiry(url):
+    """Return the ``expire=`` Unix timestamp embedded in a media URL, or None."""
+    try:
+        values = parse_qs(urlparse(url).query).get('expire')
+        return int(values[0]) if values else None
+    except (ValueError, TypeError):
+        return None
+
+
+def is_info_fresh(info: dict, stored_at: float, now: float | None = None) -> bool:
+    """Return True when *info*'s media URLs can still be used for a download."""
+    now = time.time() if now is None else now
+    formats = info.get('formats') or []
+    if not formats:
+        return False
+    expiries = [exp for exp in (_url_expiry(f.get('url') or '') for f in formats) if exp]
+    if expiries:
+        return min(expiries) - now > _EXPIRY_MARGIN
+    return now - stored_at < _DEFAULT_INFO_TTL
+
+
+class InfoCache:
+    """Bounded, thread-safe store of full infos and flat-entry ``(ie_key, id)`` handles.
+
+    Full infos are keyed by ``(url, cookies_from_browser)`` because the
+    formats a site offers can depend on the session.  Both stores evict the
+    least recently used entry once full.
+    """
+
+    def __init__(self, max_infos: int = 32, max_handles: int = 50_000):
+        self.max_infos = max_infos
+        self.max_handles = max_handles
+        self._lock = threading.Lock()
+        self._infos = OrderedDict()
+        self._handles = OrderedDict()
+
+    def remember(self, url: str, info: dict, cookies_from_browser=None, now: float | None = None) -> None:
+        """Store a full info dict (one with ``formats``) or a flat-entry handle."""
+        if not url or not info:
+            return
+        if info.get('formats'):
+            stored_at = time.time() if now is None else now
+            with self._lock:
+                self._infos[(url, cookies_from_browser)] = (info, stored_at)
+                self._infos.move_to_end((url, cookies_from_browser))
+                while len(self._infos) > self.max_infos:
+                    self._infos.popitem(last=False)
+        ie_key = info.get('ie_key') or info.get('extractor_key')
+        if ie_key:
+            with self._lock:
+                self._handles[url] = (ie_key, info.get('id'))
+                self._handles.move_to_end(url)
+                while len(self._handles) > self.max_handles:
+                    self._handles.popitem(last=False)
+
+    def lookup(self, url: str, cookies_from_browser=None, now: float | None = None) -> dict | None:
+        """Return the cached full info for *url* if it is still fresh, else None."""
+        key = (url, cookies_from_browser)
+        with self._lock:
+            entry = self._infos.get(key)
+            if entry is None:
+                return None
+            info, stored_at = entry
+            if not is_info_fresh(info, stored_at, now):
+                del self._infos[key]
+                return None
+            self._infos.move_to_end(key)
+            return info
+
+    def ie_key(self, url: str) -> str | None:
+        """Return the yt-dlp extractor key recorded for *url*, if any."""
+        return self.handle(url)[0]
+
+    def handle(self, url: str) -> tuple:
+        """Return ``(ie_key, video_id)`` recorded for *url*; either may be None."""
+        with self._lock:
+            return self._handles.get(url, (None, None))
+
+    def forget(self, url: str) -> None:
+        """Drop every full info stored for *url* (e.g. after a 403 on its media URLs)."""
+        with self._lock:
+            for key in [key for key in self._infos if key[0] == url]:
+                del self._infos[key]
+
+
+shared_info_cache = InfoCache()
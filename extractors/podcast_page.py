@@ -11,6 +11,7 @@ from urllib.parse import urljoin, urlparse
 from urllib.request import Request, urlopen
 
 from .base import BaseExtractor
+from .sync_state import until_known
 
 
 class _LinkParser(HTMLParser):
@@ -67,6 +68,11 @@ class PodcastPageExtractor(BaseExtractor):
 
         return [self._build_item(audio_url) for audio_url in unique_audio_urls]
 
+    def iter_video_batches(self, batch_size=100, stop_at=None, start=0):
+        # A single HTML page: nothing arrives incrementally.
+        videos = self.extract_info()[start:]
+        yield until_known(videos, stop_at) if stop_at else videos
+
     # Maximum response body size accepted from a podcast page (5 MiB).
     _MAX_FETCH_BYTES = 5 * 1024 * 1024
 
@@ -44,6 +44,7 @@ class RSSExtractor(GenericExtractor):
             )
             if not url:
                 continue
+            self._remember_info(url, entry)
             videos.append({
                 'url': url,
                 'title': entry.get('title', 'Unknown Episode'),
@@ -0,0 +1,119 @@
+"""Per-channel sync points for fetching only new uploads.
+
+Sync mode remembers the IDs of the newest entries seen for each channel or
+playlist URL.  The next sync fetch stops paging at the first entry it already
+knows, the way yt-dlp's ``break_on_existing`` stops at archived videos, so a
+channel that gained two uploads since yesterday costs a page of requests
+instead of a full crawl.  This relies on the listing being newest-first, as
+channel tabs and feeds are.
+
+Several IDs are kept per URL rather than one, so a deleted or privated
+newest upload does not turn the next sync into a full crawl.
+"""
+
+import json
+import os
+import threading
+
+from app_paths import data_dir
+
+from .info_cache import shared_info_cache
+
+# Newest entry IDs remembered per URL.
+KNOWN_IDS_PER_URL = 20
+
+
+def video_id(video):
+    """Return the ID sync mode tracks a fetched *video* dict by.
+
+    The site's own ID when known, else the entry URL (direct podcast files
+    have no other identity).
+    """
+    return video.get('id') or shared_info_cache.handle(video.get('url'))[1] or video.get('url')
+
+
+def entry_id(entry):
+    """Same as :func:`video_id` for a raw yt-dlp playlist entry."""
+    return entry.get('id') or entry.get('url')
+
+
+def until_known(videos, known_ids):
+    """Return the leading run of *videos* whose IDs are not in *known_ids*."""
+    for index, video in enumerate(videos):
+        if video_id(video) in known_ids:
+            return videos[:index]
+    return videos
+
+
+class SyncState:
+    """Newest-seen entry IDs per channel/playlist URL, saved as JSON.  Thread-safe.
+
+    Args:
+        path: JSON file the sync points are loaded from and saved to, or None
+            to keep them in memory only.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._urls = self._load()
+
+    def _load(self):
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            url: [str(entry_id) for entry_id in ids][:KNOWN_IDS_PER_URL]
+            for url, ids in data.items() if isinstance(ids, list)
+        }
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp = f'{self.path}.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self._urls, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def known_ids(self, url) -> frozenset:
+        """Return the entry IDs already synced for *url* (empty on the first sync)."""
+        with self._lock:
+            return frozenset(self._urls.get(url.strip(), ()))
+
+    def record(self, url, new_ids):
+        """Mark *new_ids* (newest first) as synced for *url*."""
+        new_ids = [str(entry_id) for entry_id in new_ids if entry_id]
+        if not new_ids:
+            return
+        key = url.strip()
+        with self._lock:
+            merged = list(dict.fromkeys(new_ids + self._urls.get(key, [])))
+            self._urls[key] = merged[:KNOWN_IDS_PER_URL]
+            self._save()
+
+    def forget(self, url):
+        """Drop *url*'s sync point so its next sync fetches everything."""
+        with self._lock:
+            if self._urls.pop(url.strip(), None) is not None:
+                self._save()
+
+
+def open_sync_state(path=None):
+    """Open the sync points stored in ``channel_sync.json`` in the app data dir.
+
+    Falls back to in-memory state if the data directory cannot be created.
+    """
+    try:
+        path = path or os.path.join(data_dir(), 'channel_sync.json')
+    except OSError:
+        path = None
+    return SyncState(path)
@@ -11,9 +11,12 @@ As of February 2026, YouTube requires external JS runtime (Deno/Node.js) for PO
 generation. yt-dlp handles this automatically.
 """
 
-import yt_dlp
+from lazy_imports import LazyModule
 
 from .base import BaseExtractor
+from .cookie_jars import shared_cookie_jars
+
+yt_dlp = LazyModule('yt_dlp')
 
 
 class YouTubeExtractor(BaseExtractor):
@@ -31,13 +34,7 @@ class YouTubeExtractor(BaseExtractor):
         self.platform_name = "YouTube"
         self.cookies_from_browser = cookies_from_browser
 
-    def extract_info(self):
-        """
-        Extract video information from YouTube URL
-
-        Returns:
-            List of dicts with video info: [{'title': ..., 'url': ..., 'uploader': ..., 'duration': ...}, ...]
-        """
+    def get_fetch_opts(self):
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -52,15 +49,27 @@ class YouTubeExtractor(BaseExtractor):
         # Add browser cookies if specified
         if self.cookies_from_browser:
             ydl_opts['cookiesfrombrowser'] = (self.cookies_from_browser,)
+        return ydl_opts
+
+    def extract_info(self):
+        """
+        Extract video information from YouTube URL
 
+        Returns:
+            List of dicts with video info: [{'title': ..., 'url': ..., 'uploader': ..., 'duration': ...}, ...]
+        """
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with shared_cookie_jars.youtube_dl(yt_dlp.YoutubeDL, self.get_fetch_opts()) as ydl:
                 info = ydl.extract_info(self.url, download=False)
                 return self._convert_to_standard_format(info)
-        except yt_dlp.utils.DownloadError as e:
+        except Exception as e:
+            raise self._fetch_error(e) from e
+
+    def _fetch_error(self, e):
+        if isinstance(e, yt_dlp.utils.DownloadError):
             error_msg = str(e)
             if 'Sign in to confirm' in error_msg or 'bot' in error_msg.lower():
-                raise Exception(
+                return Exception(
                     f"YouTube bot detection active. To fix this:\n\n"
                     f"1. Make sure you're logged into YouTube in {self.cookies_from_browser or 'your browser'}\n"
                     f"2. Go to Tools > Preferences and verify browser selection\n"
@@ -69,15 +78,13 @@ class YouTubeExtractor(BaseExtractor):
                     f"5. Wait a few minutes if rate-limited\n\n"
                     f"Technical details: {error_msg[:200]}"
                 )
-            else:
-                raise Exception(f"YouTube extraction failed: {error_msg}")
-        except Exception as e:
-            raise Exception(f"Failed to extract YouTube info: {str(e)}\n\n"
-                          f"Troubleshooting:\n"
-                          f"1. Verify you're logged into YouTube in {self.cookies_from_browser or 'your browser'}\n"
-                          f"2. Update yt-dlp: pip install --upgrade yt-dlp\n"
-                          f"3. Ensure Deno is installed: deno --version\n"
-                          f"4. Try a different browser in Preferences")
+            return Exception(f"YouTube extraction failed: {error_msg}")
+        return Exception(f"Failed to extract YouTube info: {str(e)}\n\n"
+                         f"Troubleshooting:\n"
+                         f"1. Verify you're logged into YouTube in {self.cookies_from_browser or 'your browser'}\n"
+                         f"2. Update yt-dlp: pip install --upgrade yt-dlp\n"
+                         f"3. Ensure Deno is installed: deno --version\n"
+                         f"4. Try a different browser in Preferences")
 
     def _convert_to_standard_format(self, info):
         """
@@ -89,18 +96,17 @@ class YouTubeExtractor(BaseExtractor):
         Returns:
             List of video dicts in our standard format
         """
-        videos = []
-
         # Handle playlist/channel (multiple videos)
         if 'entries' in info:
-            for entry in info['entries']:
-                if entry:  # Some entries might be None
-                    videos.append(self._format_single_video(entry))
+            return self._parse_playlist(info['entries'])
         # Handle single video
-        else:
-            videos.append(self._format_single_video(info))
+        return self._parse_single_video(info)
 
-        return videos
+    def _parse_playlist(self, entries):
+        return [self._format_single_video(entry) for entry in entries if entry]  # Some entries might be None
+
+    def _parse_single_video(self, info):
+        return [self._format_single_video(info)]
 
     def _format_single_video(self, entry):
         """
@@ -112,13 +118,15 @@ class YouTubeExtractor(BaseExtractor):
         Returns:
             Dict with standardized video info
         """
+        url = (
+            entry.get('webpage_url')
+            or entry.get('url')
+            or f"https://www.youtube.com/watch?v={entry.get('id', '')}"
+        )
+        self._remember_info(url, entry)
         return {
             'title': entry.get('title', 'Unknown Title'),
-            'url': (
-                entry.get('webpage_url')
-                or entry.get('url')
-                or f"https://www.youtube.com/watch?v={entry.get('id', '')}"
-            ),
+            'url': url,
             'uploader': entry.get('uploader') or entry.get('channel') or 'Unknown',
             'duration': entry.get('duration', 0),  # Duration in seconds
             'thumbnail': entry.get('thumbnail'),
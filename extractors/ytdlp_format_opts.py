@@ -7,6 +7,7 @@ from .ffmpeg_filters import (
     VIDEO_DENOISE_FILTER,
     VIDEO_SHARPEN_FILTER,
 )
+from .fused_audio import FUSED_AUDIO_KEY
 
 
 def build_video_opts(
@@ -112,17 +113,16 @@ def build_audio_opts(
     normalize_audio,
     denoise_audio,
     dynamic_normalization,
+    fused=True,
 ):
-    """Build audio-specific yt-dlp options with optional FFmpeg filters."""
-    opts = {
-        'format': 'bestaudio/best',
-        'postprocessors': [{
-            'key': 'FFmpegExtractAudio',
-            'preferredcodec': audio_codec.lower(),
-            'preferredquality': audio_quality,
-        }],
-    }
-
+    """Build audio-specific yt-dlp options with optional FFmpeg filters.
+
+    With *fused* (the default) one ``FusedAudio`` postprocessor converts,
+    filters, tags and (for MP3) attaches artwork in a single FFmpeg run; see
+    :mod:`extractors.fused_audio`.  Otherwise yt-dlp's chain of
+    ``FFmpegExtractAudio``, ``FFmpegMetadata`` and ``EmbedThumbnail`` is used,
+    each rewriting the file.
+    """
     audio_filters = []
     if denoise_audio:
         audio_filters.append(AUDIO_DENOISE_FILTER)
@@ -132,6 +132,30 @@ def build_audio_opts(
         else:
             audio_filters.append(AUDIO_LOUDNORM_FILTER)
 
+    if fused:
+        opts = {
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': FUSED_AUDIO_KEY,
+                'preferredcodec': audio_codec.lower(),
+                'preferredquality': audio_quality,
+                'filters': audio_filters,
+                'embed_thumbnail': bool(embed_thumbnail),
+            }],
+        }
+        if embed_thumbnail:
+            opts['writethumbnail'] = True
+        return opts
+
+    opts = {
+        'format': 'bestaudio/best',
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': audio_codec.lower(),
+            'preferredquality': audio_quality,
+        }],
+    }
+
     if audio_filters:
         opts['postprocessor_args'] = {
             'extractaudio+ffmpeg_o': ['-af', ','.join(audio_filters)],
@@ -0,0 +1,56 @@
+"""Deferred imports for heavy dependencies.
+
+``import yt_dlp`` loads yt-dlp's whole extractor registry, which costs more
+than building the main window.  Modules that need it bind a
+:class:`LazyModule` instead, so nothing is imported until the first real use,
+and the GUI starts a :func:`warm_up` thread once the window is visible so the
+first Fetch does not pay for the import either.
+"""
+
+import importlib
+import threading
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Attribute reads, writes and deletes go to the real module, so
+    ``unittest.mock.patch('pkg.mod.yt_dlp.YoutubeDL', ...)`` keeps working.
+    Safe to use from several threads: the import system serialises the
+    first import of a module.
+    """
+
+    def __init__(self, name):
+        object.__setattr__(self, '_name', name)
+
+    def _load(self):
+        return importlib.import_module(self._name)
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+    def __repr__(self):
+        return f'<LazyModule {self._name!r}>'
+
+
+def warm_up(*names):
+    """Import *names* on a daemon thread and return the started thread.
+
+    Import errors are left for the first real use to report.
+    """
+    def load():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+
+    thread = threading.Thread(target=load, name='import-warm-up', daemon=True)
+    thread.start()
+    return thread
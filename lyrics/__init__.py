@@ -1,5 +1,6 @@
 """Lyrics fetch, detect, and embed utilities for AV Morning Star."""
 
+from .cache import LyricsCache, open_lyrics_cache
 from .detector import is_music_track, is_youtube_music_url
 from .embedder import embed_lyrics, is_lrc_format, parse_lrc_timestamps, save_lrc_file, strip_lrc_tags
 from .fetcher import fetch_lyrics
@@ -13,4 +14,6 @@ __all__ = [
     'parse_lrc_timestamps',
     'strip_lrc_tags',
     'is_lrc_format',
+    'LyricsCache',
+    'open_lyrics_cache',
 ]
@@ -0,0 +1,116 @@
+"""Persistent on-disk cache of lyrics lookups, including "not found" results.
+
+Entries are keyed by the normalised ``(track, artist, album, duration)``
+signature: text is Unicode-normalised, case-folded and whitespace-collapsed,
+and the duration is rounded to whole seconds, so the same song reached via a
+different URL or re-downloaded later maps to the same row.
+
+Found lyrics and misses are kept for different lengths of time: lyrics for a
+released track rarely change, while a miss should be retried after a few days
+in case someone has since uploaded them to LRCLIB.  When the table grows past
+*max_entries* the least recently used rows are evicted.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from app_paths import cache_dir
+
+FOUND_TTL = 90 * 24 * 3600
+MISS_TTL = 3 * 24 * 3600
+MAX_ENTRIES = 20_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lyrics (
+    key       TEXT PRIMARY KEY,
+    synced    TEXT,
+    plain     TEXT,
+    stored_at REAL NOT NULL,
+    used_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lyrics_used ON lyrics (used_at);
+"""
+
+
+def _normalize(text) -> str:
+    return ' '.join(unicodedata.normalize('NFKC', str(text or '')).casefold().split())
+
+
+def lyrics_key(track_name, artist_name, album_name='', duration=None) -> str:
+    """Return the cache key for a track signature."""
+    rounded = '' if duration is None else str(int(round(float(duration))))
+    return '\x1f'.join((_normalize(track_name), _normalize(artist_name), _normalize(album_name), rounded))
+
+
+class LyricsCache:
+    """Thread-safe lyrics cache backed by the SQLite database at *db_path*."""
+
+    def __init__(self, db_path, found_ttl=FOUND_TTL, miss_ttl=MISS_TTL, max_entries=MAX_ENTRIES):
+        self.db_path = db_path
+        self.found_ttl = found_ttl
+        self.miss_ttl = miss_ttl
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM lyrics').fetchone()[0]
+
+    def get(self, track_name, artist_name, album_name='', duration=None, now=None):
+        """Return cached ``(synced_lrc, plain_text)``, or None if unknown or expired.
+
+        A cached miss is returned as ``(None, None)``.
+        """
+        key = lyrics_key(track_name, artist_name, album_name, duration)
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT synced, plain, stored_at FROM lyrics WHERE key = ?', (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            synced, plain, stored_at = row
+            ttl = self.found_ttl if (synced or plain) else self.miss_ttl
+            if now - stored_at >= ttl:
+                self._conn.execute('DELETE FROM lyrics WHERE key = ?', (key,))
+                return None
+            self._conn.execute('UPDATE lyrics SET used_at = ? WHERE key = ?', (now, key))
+        return synced or None, plain or None
+
+    def put(self, track_name, artist_name, album_name='', duration=None, synced=None, plain=None, now=None):
+        """Store a lookup result; pass neither *synced* nor *plain* to record a miss."""
+        key = lyrics_key(track_name, artist_name, album_name, duration)
+        now = time.time() if now is None else now
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO lyrics (key, synced, plain, stored_at, used_at) VALUES (?, ?, ?, ?, ?)',
+                (key, synced or None, plain or None, now, now),
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM lyrics').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM lyrics WHERE key IN (SELECT key FROM lyrics ORDER BY used_at LIMIT ?)',
+                    (count - self.max_entries,),
+                )
+
+
+def open_lyrics_cache(db_path=None):
+    """Open the lyrics cache (default: ``lyrics.sqlite3`` in the app cache dir).
+
+    Returns None if it cannot be opened; lyrics are then fetched uncached.
+    """
+    try:
+        return LyricsCache(db_path or os.path.join(cache_dir(), 'lyrics.sqlite3'))
+    except (OSError, sqlite3.Error):
+        return None
@@ -5,14 +5,24 @@ LRC and plain text in one response.
 
 Fallback: syncedlyrics aggregates Musixmatch, NetEase, Megalobiz, and Genius
 when LRCLIB has no match (common for CJK tracks on NetEase).
+
+Results, including "not found", can be kept in a :class:`lyrics.cache.LyricsCache`
+so a track looked up once is never sent to a provider again until its entry
+expires.  Transient failures (network errors, HTTP 5xx/429) are never cached.
+
+With ``race=True`` every source is queried at once under a single deadline
+(see :mod:`lyrics.race`), so the worst case is one timeout rather than the
+sum of all of them.
 """
 
+import functools
 import json
 import urllib.error
 import urllib.parse
 import urllib.request
 
 from .embedder import is_lrc_format, strip_lrc_tags
+from .race import Lookup, race_lookups
 
 _BASE = 'https://lrclib.net/api'
 _USER_AGENT = 'AV-Morning-Star/1.0 (https://github.com/asafelobotomy/AV-Morning-Star)'
@@ -22,15 +32,27 @@ _TIMEOUT = 10
 _SYNCEDLYRICS_PROVIDERS = ['Musixmatch', 'NetEase', 'Megalobiz', 'Genius']
 
 
+class _LookupFailed(Exception):
+    """LRCLIB could not be asked; the absence of lyrics is not known."""
+
+
 def _get(path: str, params: dict) -> dict | None:
+    """Return the decoded JSON response, or None when LRCLIB has no match.
+
+    Raises :class:`_LookupFailed` when the request itself failed.
+    """
     url = f'{_BASE}{path}?{urllib.parse.urlencode(params)}'
     req = urllib.request.Request(url, headers={'User-Agent': _USER_AGENT})
     try:
         with urllib.request.urlopen(req, timeout=_TIMEOUT) as resp:
             if resp.status == 200:
                 return json.loads(resp.read().decode('utf-8'))
-    except (urllib.error.HTTPError, urllib.error.URLError, OSError, ValueError):
-        pass
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise _LookupFailed(str(e)) from e
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        raise _LookupFailed(str(e)) from e
     return None
 
 
@@ -40,24 +62,49 @@ def _fetch_lrclib(
     album_name: str,
     duration: float | None,
 ) -> tuple[str | None, str | None]:
-    """Query LRCLIB; return ``(synced_lrc, plain_text)`` or ``(None, None)``."""
+    """Query LRCLIB; return ``(synced_lrc, plain_text)`` or ``(None, None)``.
+
+    A failed ``/get`` still falls back to ``/search``.  Raises
+    :class:`_LookupFailed` if LRCLIB could not be reached and gave no match.
+    """
     result = None
+    get_failure = None
     if album_name and duration is not None:
-        result = _get('/get', {
-            'track_name': track_name,
-            'artist_name': artist_name,
-            'album_name': album_name,
-            'duration': int(duration),
-        })
+        try:
+            result = _lrclib_get(track_name, artist_name, album_name, duration)
+        except _LookupFailed as e:
+            get_failure = e
 
     if not result:
-        results = _get('/search', {
-            'track_name': track_name,
-            'artist_name': artist_name,
-        })
-        if results and isinstance(results, list):
-            result = results[0]
+        result = _lrclib_search(track_name, artist_name)
+        if not result and get_failure is not None:
+            raise get_failure
+
+    return _lrclib_lyrics(result)
+
+
+def _lrclib_get(track_name: str, artist_name: str, album_name: str, duration: float) -> dict | None:
+    """Exact-signature lookup via ``/api/get``."""
+    return _get('/get', {
+        'track_name': track_name,
+        'artist_name': artist_name,
+        'album_name': album_name,
+        'duration': int(duration),
+    })
+
+
+def _lrclib_search(track_name: str, artist_name: str) -> dict | None:
+    """Return the best ``/api/search`` match."""
+    results = _get('/search', {
+        'track_name': track_name,
+        'artist_name': artist_name,
+    })
+    if results and isinstance(results, list):
+        return results[0]
+    return None
 
+
+def _lrclib_lyrics(result: dict | None) -> tuple[str | None, str | None]:
     if not result or result.get('instrumental'):
         return None, None
 
@@ -66,7 +113,11 @@ def _fetch_lrclib(
     return synced, plain
 
 
-def _fetch_syncedlyrics(track_name: str, artist_name: str) -> tuple[str | None, str | None]:
+def _fetch_syncedlyrics(
+    track_name: str,
+    artist_name: str,
+    providers: list[str] | None = None,
+) -> tuple[str | None, str | None]:
     """Query syncedlyrics providers; return ``(synced_lrc, plain_text)`` or ``(None, None)``."""
     try:
         import syncedlyrics
@@ -75,7 +126,7 @@ def _fetch_syncedlyrics(track_name: str, artist_name: str) -> tuple[str | None,
 
     search_term = f'{track_name} - {artist_name}'
     try:
-        result = syncedlyrics.search(search_term, providers=_SYNCEDLYRICS_PROVIDERS)
+        result = syncedlyrics.search(search_term, providers=providers or _SYNCEDLYRICS_PROVIDERS)
     except Exception:  # noqa: BLE001 — provider/network errors are non-fatal
         return None, None
 
@@ -92,6 +143,8 @@ def fetch_lyrics(
     artist_name: str,
     album_name: str = '',
     duration: float | None = None,
+    cache=None,
+    race: bool = False,
 ) -> tuple[str | None, str | None]:
     """Return ``(synced_lrc, plain_text)`` for the given track.
 
@@ -103,12 +156,59 @@ def fetch_lyrics(
     1. LRCLIB exact-signature lookup via ``/api/get``, then ``/api/search``.
     2. syncedlyrics fallback (Musixmatch, NetEase, Megalobiz, Genius) when
        LRCLIB returns no match.
+
+    With *race*, LRCLIB ``/get`` and ``/search`` and each syncedlyrics
+    provider are queried concurrently under one overall deadline, and the
+    best answer wins: synced LRCLIB, then synced from another provider, then
+    plain text.
+
+    With a *cache* (:class:`lyrics.cache.LyricsCache`), a cached result or
+    cached miss is returned without any network request, and fresh results
+    are stored.  A miss is only cached when LRCLIB answered definitively.
     """
     if not track_name or not artist_name:
         return None, None
 
-    synced, plain = _fetch_lrclib(track_name, artist_name, album_name, duration)
-    if synced or plain:
-        return synced, plain
+    if cache is not None:
+        cached = cache.get(track_name, artist_name, album_name, duration)
+        if cached is not None:
+            return cached
+
+    if race:
+        synced, plain, definitive = _race_providers(track_name, artist_name, album_name, duration)
+    else:
+        synced, plain, definitive = _query_providers(track_name, artist_name, album_name, duration)
+
+    if cache is not None and (synced or plain or definitive):
+        cache.put(track_name, artist_name, album_name, duration, synced, plain)
+    return synced, plain
+
+
+def _query_providers(track_name, artist_name, album_name, duration):
+    """Sequential lookup; return ``(synced, plain, definitive)``."""
+    definitive = True
+    try:
+        synced, plain = _fetch_lrclib(track_name, artist_name, album_name, duration)
+    except _LookupFailed:
+        synced, plain = None, None
+        definitive = False
+
+    if not synced and not plain:
+        synced, plain = _fetch_syncedlyrics(track_name, artist_name)
+    return synced, plain, definitive
+
 
-    return _fetch_syncedlyrics(track_name, artist_name)
+def _race_providers(track_name, artist_name, album_name, duration):
+    """Concurrent lookup, ordered by source priority; return ``(synced, plain, definitive)``."""
+    lookups = []
+    if album_name and duration is not None:
+        lookups.append(Lookup(
+            lambda: _lrclib_lyrics(_lrclib_get(track_name, artist_name, album_name, duration)),
+            authoritative=True,
+        ))
+    lookups.append(Lookup(lambda: _lrclib_lyrics(_lrclib_search(track_name, artist_name)), authoritative=True))
+    lookups.extend(
+        Lookup(functools.partial(_fetch_syncedlyrics, track_name, artist_name, [provider]))
+        for provider in _SYNCEDLYRICS_PROVIDERS
+    )
+    return race_lookups(lookups, _TIMEOUT)
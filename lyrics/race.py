@@ -0,0 +1,78 @@
+"""Run several lyrics lookups at once and keep the best answer within a deadline.
+
+Each lookup returns ``(synced_lrc, plain_text)``.  Results are ranked synced
+before plain, then by the lookup's position in the list, so callers express
+source priority simply by ordering their lookups.  As soon as no lookup still
+running could beat the best result so far, the race ends; the losers are
+abandoned: they run on daemon threads, finish on their own and are ignored.
+"""
+
+import queue
+import threading
+import time
+
+
+class Lookup:
+    """One entry in a race.
+
+    Args:
+        run: Zero-argument callable returning ``(synced_lrc, plain_text)``.
+        authoritative: A miss from every authoritative lookup means the
+            track has no lyrics (as opposed to "we could not find out").
+    """
+
+    def __init__(self, run, authoritative=False):
+        self.run = run
+        self.authoritative = authoritative
+
+
+def _rank(order, synced):
+    return (0 if synced else 1, order)
+
+
+def _run_lookup(order, lookup, results):
+    try:
+        results.put((order, lookup.run(), None))
+    except Exception as e:  # noqa: BLE001 — a failed source just loses the race
+        results.put((order, None, e))
+
+
+def race_lookups(lookups, deadline):
+    """Run *lookups* in parallel for at most *deadline* seconds.
+
+    Returns ``(synced_lrc, plain_text, definitive)``.  *definitive* is True
+    when every authoritative lookup finished without raising, so a miss can
+    safely be remembered.
+    """
+    lookups = list(lookups)
+    if not lookups:
+        return None, None, False
+    results = queue.Queue()
+    for order, lookup in enumerate(lookups):
+        # Daemon threads: an abandoned lookup must not hold up interpreter exit.
+        threading.Thread(
+            target=_run_lookup, args=(order, lookup, results), name=f'lyrics-race-{order}', daemon=True,
+        ).start()
+    pending = set(range(len(lookups)))
+    best, best_rank = (None, None), None
+    failed = False
+    end = time.monotonic() + deadline
+    while pending:
+        if best_rank is not None and best_rank <= _rank(min(pending), True):
+            break
+        try:
+            order, result, error = results.get(timeout=max(0.0, end - time.monotonic()))
+        except queue.Empty:
+            break
+        pending.discard(order)
+        if error is not None:
+            failed = failed or lookups[order].authoritative
+            continue
+        synced, plain = result
+        if not synced and not plain:
+            continue
+        rank = _rank(order, synced)
+        if best_rank is None or rank < best_rank:
+            best, best_rank = (synced or None, plain or None), rank
+    unfinished = any(lookups[order].authoritative for order in pending)
+    return best[0], best[1], not failed and not unfinished
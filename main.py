@@ -7,6 +7,8 @@ A PyQt5 application for downloading videos and audio from URLs
 import os
 import sys
 
+from app_paths import add_deno_to_path
+from browser_utils import warm_browser_detection
 from constants import (
     APP_FULL_TITLE,
     DEFAULT_FILENAME_TAGS,
@@ -14,16 +16,33 @@ from constants import (
     ICON_SPLASH_SIZE,
     MODE_BASIC,
 )
-from settings import load_browser_preference, load_output_path, load_theme
+from downloader import (
+    BandwidthGovernor,
+    open_download_archive,
+    open_fragment_tuner,
+    open_job_store,
+    parse_schedule,
+)
+from extractors import open_fetch_cache, open_sync_state
+from lazy_imports import warm_up
+from lyrics import open_lyrics_cache
+from settings import (
+    load_bandwidth_host_limits,
+    load_bandwidth_limit_kib,
+    load_bandwidth_schedule,
+    load_browser_preference,
+    load_max_parallel_downloads,
+    load_output_path,
+    load_per_host_limit,
+    load_theme,
+    load_use_download_archive,
+)
 
 # Suppress Qt Wayland warnings
 os.environ['QT_LOGGING_RULES'] = 'qt.qpa.wayland=false'
 
 # Add Deno to PATH if installed (required for YouTube PO tokens)
-deno_path = os.path.expanduser('~/.deno/bin')
-if os.path.exists(deno_path) and deno_path not in os.environ.get('PATH', ''):
-    os.environ['PATH'] = f"{deno_path}:{os.environ.get('PATH', '')}"
-    os.environ['DENO_INSTALL'] = os.path.expanduser('~/.deno')
+add_deno_to_path()
 
 from PyQt5.QtCore import Qt, QTimer  # noqa: E402
 from PyQt5.QtGui import QIcon, QPixmap  # noqa: E402
@@ -55,12 +74,25 @@ class MediaDownloaderApp(
 ):
     def __init__(self):
         super().__init__()
-        self.videos_list = []
-        self.checkboxes = []
         self.output_path = os.path.expanduser(load_output_path())
         self.mode = MODE_BASIC
         self.filename_template = DEFAULT_FILENAME_TAGS.copy()
         self.browser_preference = load_browser_preference()
+        self.max_parallel_downloads = load_max_parallel_downloads()
+        self.per_host_limit = load_per_host_limit()
+        self.job_store = open_job_store()
+        self.use_download_archive = load_use_download_archive()
+        self.download_archive = open_download_archive()
+        self.lyrics_cache = open_lyrics_cache()
+        self.bandwidth_limit_kib = load_bandwidth_limit_kib()
+        self.bandwidth_governor = BandwidthGovernor(
+            self.bandwidth_limit_kib * 1024,
+            load_bandwidth_host_limits(),
+            parse_schedule(load_bandwidth_schedule()),
+        )
+        self.fragment_tuner = open_fragment_tuner()
+        self.fetch_cache = open_fetch_cache()
+        self.sync_state = open_sync_state()
         self._youtube_auth_handled = False
         self.current_theme = load_theme()
 
@@ -78,10 +110,9 @@ def main():
     app.setDesktopFileName("com.github.asafelobotomy.avmorningstar.desktop")
 
     icon_path = os.path.join(os.path.dirname(__file__), ICON_FILENAME)
+    splash = None
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
-
-    if os.path.exists(icon_path):
         splash_pix = QPixmap(icon_path)
         scaled_splash = splash_pix.scaled(
             ICON_SPLASH_SIZE, ICON_SPLASH_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation,
@@ -90,12 +121,16 @@ def main():
         splash.show()
         app.processEvents()
 
-        window = MediaDownloaderApp()
-        QTimer.singleShot(1500, splash.close)
-        QTimer.singleShot(1500, window.show)
-    else:
-        window = MediaDownloaderApp()
-        window.show()
+    # Show the window as soon as it is built; yt-dlp is imported lazily and
+    # warmed up once the event loop is running, so the first Fetch is quick too.
+    # Browser detection is warmed the same way for the cookie fallbacks.
+    window = MediaDownloaderApp()
+    window.show()
+    if splash is not None:
+        splash.finish(window)
+    QTimer.singleShot(0, lambda: warm_up('yt_dlp'))
+    QTimer.singleShot(0, warm_browser_detection)
+    QTimer.singleShot(0, window.offer_resume_downloads)
 
     sys.exit(app.exec_())
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark GUI startup: time to first frame, import costs and peak RSS.
+
+Each run starts a fresh interpreter with ``-X importtime`` under the
+offscreen Qt platform, builds ``main.MediaDownloaderApp``, shows it and
+reports once the event loop has processed the first show/paint events.
+Settings, data and caches live in a scratch XDG profile shared by the runs,
+so results do not depend on the size of the user's archive or job history.
+Results are written as JSON so runs from different commits can be compared:
+
+    python3 scripts/bench_startup.py --runs 5 -o before.json
+    python3 scripts/bench_startup.py --runs 5 --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULT_PREFIX = "BENCH_RESULT "
+# Modules whose cumulative import cost is summarised for every run.
+TRACKED_MODULES = ("main", "threads", "extractors", "downloader", "lyrics", "themes", "PyQt5", "yt_dlp")
+# Pointed at a scratch directory so every run sees the same empty profile.
+PROFILE_VARS = ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_CACHE_HOME")
+METRICS = ("first_frame_s", "import_s", "construct_s", "peak_rss_kib")
+
+# Runs in the child.  Times are wall-clock so the parent can measure from
+# the moment it spawned the process, interpreter start-up included.
+CHILD_CODE = f"""
+import json, resource, sys, time
+t_import = time.time()
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+import main
+t_imported = time.time()
+app = QApplication(sys.argv)
+window = main.MediaDownloaderApp()
+window.show()
+t_shown = time.time()
+
+def report():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print({RESULT_PREFIX!r} + json.dumps({{
+        'import_end': t_imported, 'import_start': t_import, 'shown': t_shown, 'first_frame': time.time(),
+        'peak_rss_kib': rss // 1024 if sys.platform == 'darwin' else rss,
+    }}), flush=True)
+    app.quit()
+
+QTimer.singleShot(0, report)
+app.exec_()
+"""
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """Return ``-X importtime`` lines as ``{module, self_us, cumulative_us, depth}`` dicts."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            entries.append({
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            })
+        except ValueError:
+            continue
+    return entries
+
+
+def tracked_costs(entries: list[dict]) -> dict[str, int]:
+    """Return the cumulative import cost (µs) of each tracked module that was imported."""
+    return {e["module"]: e["cumulative_us"] for e in entries if e["module"] in TRACKED_MODULES}
+
+
+def run_once(python: str, env: dict[str, str]) -> dict:
+    """Start the app once; return first-frame, import and construction times plus RSS and import costs."""
+    started = time.time()
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", CHILD_CODE],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    lines = [line for line in proc.stdout.splitlines() if line.startswith(RESULT_PREFIX)]
+    if proc.returncode != 0 or not lines:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        tail = "\n".join(errors[-5:])
+        raise RuntimeError(f"startup run failed (exit {proc.returncode}):\n{tail}")
+    child = json.loads(lines[-1][len(RESULT_PREFIX):])
+    entries = parse_importtime(proc.stderr)
+    return {
+        "first_frame_s": round(child["first_frame"] - started, 4),
+        "import_s": round(child["import_end"] - child["import_start"], 4),
+        "construct_s": round(child["shown"] - child["import_end"], 4),
+        "peak_rss_kib": child["peak_rss_kib"],
+        "tracked_imports_us": tracked_costs(entries),
+        "imports": entries,
+    }
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Return the median and minimum of each metric across *runs*."""
+    return {
+        metric: {
+            "median": statistics.median(run[metric] for run in runs),
+            "min": min(run[metric] for run in runs),
+        }
+        for metric in METRICS
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Return one line per metric with the median change against *baseline*."""
+    lines = []
+    for metric in METRICS:
+        new = current["summary"][metric]["median"]
+        old = baseline.get("summary", {}).get(metric, {}).get("median")
+        if not old:
+            lines.append(f"{metric:>14}: {new} (no baseline)")
+            continue
+        lines.append(f"{metric:>14}: {old} -> {new} ({(new - old) / old * 100:+.1f}%)")
+    return lines
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure GUI startup in fresh offscreen subprocesses.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of startups to measure (default: 5)")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to benchmark (default: this one)")
+    parser.add_argument("-o", "--output", help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="Print median changes against an earlier result file")
+    parser.add_argument(
+        "--keep-imports", action="store_true",
+        help="Keep the full -X importtime table of every run (default: first run only)",
+    )
+    args = parser.parse_args(argv)
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="avms-bench-") as profile:
+        env = {
+            **os.environ,
+            "QT_QPA_PLATFORM": "offscreen",
+            **{var: os.path.join(profile, var.lower()) for var in PROFILE_VARS},
+        }
+        for index in range(max(1, args.runs)):
+            try:
+                run = run_once(args.python, env)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(f"error: {e}", file=sys.stderr)
+                return 1
+            if index and not args.keep_imports:
+                del run["imports"]
+            runs.append(run)
+            print(f"run {index + 1}: first frame {run['first_frame_s']:.3f}s, "
+                  f"peak RSS {run['peak_rss_kib'] / 1024:.1f} MiB", file=sys.stderr)
+
+    result = {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "summary": summarize(runs),
+        "runs": runs,
+    }
+    text = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        for line in compare(result, baseline):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
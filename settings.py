@@ -1,8 +1,18 @@
 """Persistent application settings via QSettings (no cookies or secrets stored)."""
 
+import json
+import time
+
 from PyQt5.QtCore import QSettings
 
-from constants import DEFAULT_BROWSER_PREFERENCE, DEFAULT_OUTPUT_DIR
+from constants import (
+    BANDWIDTH_LIMIT_CHOICES_KIB,
+    DEFAULT_BROWSER_PREFERENCE,
+    DEFAULT_MAX_PARALLEL_DOWNLOADS,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_PER_HOST_DOWNLOADS,
+    MAX_PARALLEL_DOWNLOADS_LIMIT,
+)
 from themes import DEFAULT_THEME
 
 ORGANIZATION = "AVMorningStar"
@@ -18,6 +28,23 @@ def _settings():
     return QSettings(ORGANIZATION, APPLICATION)
 
 
+def _load_bounded_int(key, default, maximum):
+    """Return the integer stored under *key*, or *default* if missing or out of 1..*maximum*."""
+    try:
+        value = int(_settings().value(key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if 1 <= value <= maximum else default
+
+
+def _load_bool(key, default):
+    """Return the boolean stored under *key*; QSettings may hand back 'true'/'false' strings."""
+    value = _settings().value(key, default)
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
 def load_browser_preference():
     value = _settings().value('browser_preference', DEFAULT_BROWSER_PREFERENCE)
     return value if value in _VALID_BROWSERS else DEFAULT_BROWSER_PREFERENCE
@@ -48,3 +75,125 @@ def load_output_path():
 def save_output_path(path):
     if path:
         _settings().setValue('output_path', path)
+
+
+def load_max_parallel_downloads():
+    return _load_bounded_int(
+        'max_parallel_downloads', DEFAULT_MAX_PARALLEL_DOWNLOADS, MAX_PARALLEL_DOWNLOADS_LIMIT,
+    )
+
+
+def save_max_parallel_downloads(count):
+    if 1 <= count <= MAX_PARALLEL_DOWNLOADS_LIMIT:
+        _settings().setValue('max_parallel_downloads', count)
+
+
+def load_per_host_limit():
+    return _load_bounded_int('per_host_limit', DEFAULT_PER_HOST_DOWNLOADS, MAX_PARALLEL_DOWNLOADS_LIMIT)
+
+
+def save_per_host_limit(count):
+    if 1 <= count <= MAX_PARALLEL_DOWNLOADS_LIMIT:
+        _settings().setValue('per_host_limit', count)
+
+
+def load_use_download_archive():
+    return _load_bool('use_download_archive', True)
+
+
+def save_use_download_archive(enabled):
+    _settings().setValue('use_download_archive', bool(enabled))
+
+
+def load_bandwidth_limit_kib():
+    """Return the global download cap in KiB/s (0 = unlimited)."""
+    try:
+        value = int(_settings().value('bandwidth_limit_kib', 0))
+    except (TypeError, ValueError):
+        return 0
+    return value if value in BANDWIDTH_LIMIT_CHOICES_KIB else 0
+
+
+def save_bandwidth_limit_kib(kib):
+    if kib in BANDWIDTH_LIMIT_CHOICES_KIB:
+        _settings().setValue('bandwidth_limit_kib', kib)
+
+
+def _load_json(key, expected_type):
+    value = _settings().value(key, '')
+    try:
+        parsed = json.loads(value) if isinstance(value, str) and value else None
+    except ValueError:
+        return expected_type()
+    return parsed if isinstance(parsed, expected_type) else expected_type()
+
+
+def load_bandwidth_host_limits():
+    """Return per-site caps as ``{host: bytes_per_s}``.
+
+    Stored under ``bandwidth_host_limits`` as JSON ``{"host": KiB/s}``, e.g.
+    ``{"youtube.com": 2048}``; there is no UI for it yet.
+    """
+    limits = {}
+    for host, kib in _load_json('bandwidth_host_limits', dict).items():
+        if isinstance(kib, (int, float)) and kib > 0:
+            limits[str(host).lower()] = int(kib * 1024)
+    return limits
+
+
+def load_bandwidth_schedule():
+    """Return time-of-day windows as ``[{'start', 'end', 'limit'}]`` (limit in bytes/s).
+
+    Stored under ``bandwidth_schedule`` as JSON, e.g.
+    ``[{"start": "09:00", "end": "18:00", "limit_kib": 512}]``; a window
+    without ``limit_kib`` (or with 0) lifts the cap during those hours.
+    """
+    windows = []
+    for entry in _load_json('bandwidth_schedule', list):
+        if not isinstance(entry, dict):
+            continue
+        kib = entry.get('limit_kib') or 0
+        if not isinstance(kib, (int, float)) or kib < 0:
+            continue
+        windows.append({'start': entry.get('start'), 'end': entry.get('end'), 'limit': int(kib * 1024)})
+    return windows
+
+
+def _load_host_auth_map():
+    return _load_json('host_auth', dict)
+
+
+def load_host_auth(host):
+    """Return the auth memory for *host* as ``{'browser', 'auth_at'}``, or None.
+
+    Stored under ``host_auth`` as JSON ``{host: {"browser": ..., "auth_at": unix_time}}``:
+    ``auth_at`` is when the host last demanded authentication and ``browser``
+    the browser whose cookies last satisfied it (None until one has).
+    """
+    entry = _load_host_auth_map().get(host)
+    if not isinstance(entry, dict) or not isinstance(entry.get('auth_at'), (int, float)):
+        return None
+    browser = entry.get('browser')
+    if browser in ('auto', 'none') or browser not in _VALID_BROWSERS:
+        browser = None
+    return {'browser': browser, 'auth_at': float(entry['auth_at'])}
+
+
+def save_host_auth(host, browser=None, auth_at=None):
+    """Update *host*'s auth memory; arguments left as None keep their stored value."""
+    if not host:
+        return
+    hosts = _load_host_auth_map()
+    entry = hosts.get(host) if isinstance(hosts.get(host), dict) else {}
+    if browser in _VALID_BROWSERS and browser not in ('auto', 'none'):
+        entry['browser'] = browser
+    if auth_at is not None or not isinstance(entry.get('auth_at'), (int, float)):
+        entry['auth_at'] = auth_at if auth_at is not None else time.time()
+    hosts[host] = entry
+    _settings().setValue('host_auth', json.dumps(hosts, sort_keys=True))
+
+
+def forget_host_auth(host):
+    hosts = _load_host_auth_map()
+    if hosts.pop(host, None) is not None:
+        _settings().setValue('host_auth', json.dumps(hosts, sort_keys=True))
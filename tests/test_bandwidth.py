@@ -0,0 +1,185 @@
+"""
+Tests for downloader.bandwidth — the shared token-bucket bandwidth governor.
+
+Covers:
+- TokenBucket pacing and burst
+- One global cap shared by concurrent transfers, redistributed when one stops
+- Per-host caps and time-of-day schedule windows
+- Resumed transfers charged from their first report, not their offset
+- Cancellation while throttled; DownloadEngine feeding the governor
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest.mock import MagicMock
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.bandwidth import BandwidthGovernor, ScheduleWindow, TokenBucket, parse_schedule
+from downloader.engine import DownloadEngine
+from downloader.progress import JOB_INDEX_KEY
+
+
+class FakeClock:
+    """Monotonic clock whose sleep() advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.now += seconds
+            self.slept += seconds
+
+
+def _local_time(hour, minute=0):
+    return lambda: time.struct_time((2026, 1, 1, hour, minute, 0, 3, 1, 0))
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_pacing(self):
+        clock = FakeClock()
+        bucket = TokenBucket(1000, clock)
+        self.assertEqual(bucket.reserve(1000), 0.0)
+        self.assertAlmostEqual(bucket.reserve(500), 0.5)
+
+    def test_refills_over_time_up_to_one_second(self):
+        clock = FakeClock()
+        bucket = TokenBucket(1000, clock)
+        bucket.reserve(1000)
+        clock.now = 10
+        self.assertEqual(bucket.reserve(1000), 0.0)
+        self.assertGreater(bucket.reserve(1), 0.0)
+
+
+class TestBandwidthGovernor(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def _governor(self, **kwargs):
+        kwargs.setdefault('local_time', _local_time(12))
+        return BandwidthGovernor(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_unlimited_never_sleeps(self):
+        governor = self._governor()
+        governor.throttle('a.example', 10 ** 9)
+        self.assertEqual(self.clock.slept, 0)
+        self.assertFalse(governor.enabled)
+
+    def test_transfers_share_the_global_cap(self):
+        governor = self._governor(limit=1000)
+        for _ in range(10):
+            governor.throttle('a.example', 500)
+            governor.throttle('b.example', 500)
+        # 10 000 bytes at 1000 B/s, less the one-second initial burst.
+        self.assertAlmostEqual(self.clock.now, 9.0)
+
+    def test_share_goes_to_remaining_transfer(self):
+        governor = self._governor(limit=1000)
+        governor.throttle('a.example', 1000)
+        start = self.clock.now
+        for _ in range(4):
+            governor.throttle('a.example', 1000)
+        self.assertAlmostEqual(self.clock.now - start, 4.0)
+
+    def test_host_cap_applies_only_to_that_host(self):
+        governor = self._governor(host_limits={'slow.example': 100})
+        governor.throttle('fast.example', 10_000)
+        self.assertEqual(self.clock.slept, 0)
+        governor.throttle('slow.example', 300)
+        self.assertAlmostEqual(self.clock.slept, 2.0)
+
+    def test_record_charges_only_growth(self):
+        governor = self._governor(limit=1000)
+        governor.record(('job', 1), 'a.example', 1000)
+        governor.record(('job', 1), 'a.example', 2000)
+        governor.record(('job', 1), 'a.example', 2500)
+        self.assertAlmostEqual(self.clock.slept, 0.5)
+        governor.forget(('job', 1))
+        self.assertEqual(governor._seen, {})
+
+    def test_resumed_transfer_is_not_charged_its_offset(self):
+        governor = self._governor(limit=1000)
+        governor.record(('job', 1), 'a.example', 50_000_000)
+        self.assertEqual(self.clock.slept, 0)
+        governor.record(('job', 1), 'a.example', 50_001_500)
+        self.assertAlmostEqual(self.clock.slept, 0.5)
+
+    def test_schedule_window_overrides_global_limit(self):
+        window = ScheduleWindow('09:00', '17:00', 100)
+        self.assertEqual(self._governor(limit=1000, schedule=[window]).current_limit(), 100)
+        evening = self._governor(limit=1000, schedule=[window], local_time=_local_time(20))
+        self.assertEqual(evening.current_limit(), 1000)
+
+    def test_unlimited_window_lifts_cap(self):
+        night = ScheduleWindow('22:00', '06:00', 0)
+        governor = self._governor(limit=1000, schedule=[night], local_time=_local_time(2))
+        self.assertIsNone(governor.current_limit())
+
+    def test_configure_applies_to_running_transfers(self):
+        governor = self._governor(limit=1000)
+        governor.throttle('a.example', 1000)
+        governor.configure(None)
+        governor.throttle('a.example', 10 ** 6)
+        self.assertEqual(self.clock.slept, 0)
+
+    def test_stop_interrupts_throttling_sleep(self):
+        governor = self._governor(limit=100)
+        governor.throttle('a.example', 100)
+        governor.throttle('a.example', 10_000, should_stop=lambda: self.clock.now > 1)
+        self.assertLess(self.clock.now, 2)
+
+
+class TestSchedule(unittest.TestCase):
+    def test_window_wrapping_midnight(self):
+        window = ScheduleWindow('22:00', '06:00', 1)
+        self.assertTrue(window.contains(23 * 60))
+        self.assertTrue(window.contains(5 * 60))
+        self.assertFalse(window.contains(12 * 60))
+
+    def test_parse_schedule_skips_malformed_entries(self):
+        windows = parse_schedule([
+            {'start': '09:00', 'end': '17:30', 'limit': 512},
+            {'start': '25:00', 'end': '01:00', 'limit': 1},
+            {'start': '09:00'},
+            'nonsense',
+        ])
+        self.assertEqual([(w.start, w.end, w.limit) for w in windows], [(540, 1050, 512)])
+
+
+class TestEngineGovernor(unittest.TestCase):
+    def test_progress_hook_feeds_governor_with_site_host(self):
+        governor = MagicMock()
+        engine = DownloadEngine([], '/out', 'video', governor=governor)
+        info = {JOB_INDEX_KEY: 1, 'webpage_url': 'https://www.youtube.com/watch?v=x'}
+        engine.progress_hook({'status': 'downloading', 'downloaded_bytes': 4096, 'filename': 'a.part',
+                              'info_dict': info})
+        governor.record.assert_called_once()
+        key, host, downloaded = governor.record.call_args.args
+        self.assertEqual((key, host, downloaded), ((1, 'a.part'), 'youtube.com', 4096))
+
+        engine.progress_hook({'status': 'finished', 'filename': 'a.part', 'info_dict': info})
+        governor.forget.assert_called_once_with((1, 'a.part'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -139,13 +139,13 @@ class TestBaseExtractorOptions(unittest.TestCase):
         self.assertIn("-c:a", args)
         self.assertEqual(args[args.index("-c:a") + 1], "libopus")
 
-    # --- Audio postprocessor ordering ---
+    # --- Audio postprocessor ordering (yt-dlp chain, fused=False) ---
 
     def test_audio_metadata_before_thumbnail(self):
         """FFmpegMetadata must appear before EmbedThumbnail in the pipeline."""
         opts = build_audio_opts("mp3", "192", embed_thumbnail=True,
                                 normalize_audio=False, denoise_audio=False,
-                                dynamic_normalization=False)
+                                dynamic_normalization=False, fused=False)
         keys = [pp["key"] for pp in opts["postprocessors"]]
         self.assertIn("FFmpegMetadata", keys)
         self.assertIn("EmbedThumbnail", keys)
@@ -154,7 +154,7 @@ class TestBaseExtractorOptions(unittest.TestCase):
     def test_audio_metadata_present_without_thumbnail(self):
         opts = build_audio_opts("mp3", "192", embed_thumbnail=False,
                                 normalize_audio=False, denoise_audio=False,
-                                dynamic_normalization=False)
+                                dynamic_normalization=False, fused=False)
         keys = [pp["key"] for pp in opts["postprocessors"]]
         self.assertIn("FFmpegMetadata", keys)
         self.assertNotIn("EmbedThumbnail", keys)
@@ -162,7 +162,7 @@ class TestBaseExtractorOptions(unittest.TestCase):
     # --- Audio filter chains ---
 
     def _get_audio_postprocessor_args(self, normalize=False, denoise=False, dynamic=False):
-        opts = build_audio_opts("mp3", "192", False, normalize, denoise, dynamic)
+        opts = build_audio_opts("mp3", "192", False, normalize, denoise, dynamic, fused=False)
         return opts.get("postprocessor_args", {}).get("extractaudio+ffmpeg_o", [])
 
     def test_audio_denoise_filter_in_af_chain(self):
@@ -0,0 +1,61 @@
+"""
+Tests for the startup benchmark harness (scripts/bench_startup.py).
+
+Covers:
+- parse_importtime: -X importtime lines, header and unrelated stderr skipped
+- tracked_costs: cumulative cost of the tracked top-level modules
+- summarize / compare: medians, minimums and changes against a baseline
+"""
+
+import os
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'scripts'))
+
+import bench_startup
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   constants.identity
+import time:       254 |       2746 | constants
+Warning: something unrelated
+import time:      4867 |     110505 |   extractors.base
+import time:       402 |     131590 | extractors
+"""
+
+
+def _run(first_frame, rss):
+    return {'first_frame_s': first_frame, 'import_s': 0.2, 'construct_s': 0.1, 'peak_rss_kib': rss}
+
+
+class TestImportTime(unittest.TestCase):
+    def test_parse(self):
+        entries = bench_startup.parse_importtime(IMPORTTIME)
+        self.assertEqual(len(entries), 4)
+        self.assertEqual(entries[0], {'module': 'constants.identity', 'self_us': 120, 'cumulative_us': 120,
+                                      'depth': 1})
+        self.assertEqual(entries[1]['depth'], 0)
+
+    def test_tracked_costs(self):
+        costs = bench_startup.tracked_costs(bench_startup.parse_importtime(IMPORTTIME))
+        self.assertEqual(costs, {'extractors': 131590})
+
+
+class TestSummary(unittest.TestCase):
+    def test_median_and_min(self):
+        summary = bench_startup.summarize([_run(0.9, 100), _run(0.5, 120), _run(0.7, 110)])
+        self.assertEqual(summary['first_frame_s'], {'median': 0.7, 'min': 0.5})
+        self.assertEqual(summary['peak_rss_kib'], {'median': 110, 'min': 100})
+
+    def test_compare(self):
+        baseline = {'summary': bench_startup.summarize([_run(1.0, 100)])}
+        current = {'summary': bench_startup.summarize([_run(0.5, 100)])}
+        lines = bench_startup.compare(current, baseline)
+        self.assertIn('first_frame_s: 1.0 -> 0.5 (-50.0%)', lines[0])
+        self.assertIn('(no baseline)', bench_startup.compare(current, {})[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,17 +4,29 @@ Tests for browser detection utilities.
 Covers:
 - detect_available_browsers: return type and valid browser names
 - Chromium profile detection including Opera flat cookie path
+- Detection cache: reused until a profile root's mtime changes, refresh, warm-up
+- get_browsers_with_youtube_cookies: name-only SQLite probe, domain scoping,
+  unreadable stores, concurrent probing
 """
 
 import os
+import sqlite3
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from browser_utils import _has_chromium_cookies, _has_firefox_cookies, detect_available_browsers
+import browser_utils
+from browser_utils import (
+    _has_chromium_cookies,
+    _has_firefox_cookies,
+    detect_available_browsers,
+    get_browsers_with_youtube_cookies,
+    warm_browser_detection,
+)
 
 
 class TestDetectAvailableBrowsers(unittest.TestCase):
@@ -56,5 +68,124 @@ class TestDetectAvailableBrowsers(unittest.TestCase):
                 self.assertTrue(_has_firefox_cookies())
 
 
+class TestDetectionCache(unittest.TestCase):
+    """Scan results are reused until a profile root changes."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = self._tmp.name
+        for patcher in (
+            patch('browser_utils._FIREFOX_ROOTS', [self.root]),
+            patch('browser_utils._CHROMIUM_ROOTS', {}),
+            patch('browser_utils._detected', None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def add_profile(self, mtime):
+        profile = os.path.join(self.root, 'new.default')
+        os.makedirs(profile)
+        open(os.path.join(profile, 'cookies.sqlite'), 'w').close()
+        os.utime(self.root, ns=(mtime, mtime))
+
+    def test_cached_until_root_changes(self):
+        os.utime(self.root, ns=(1_000, 1_000))
+        with patch('browser_utils._scan_browsers', wraps=browser_utils._scan_browsers) as scan:
+            self.assertEqual(detect_available_browsers(), [])
+            self.assertEqual(detect_available_browsers(), [])
+            self.assertEqual(scan.call_count, 1)
+            self.add_profile(2_000)
+            self.assertEqual(detect_available_browsers(), ['firefox'])
+            self.assertEqual(scan.call_count, 2)
+
+    def test_refresh_rescans(self):
+        with patch('browser_utils._scan_browsers', return_value=['firefox']) as scan:
+            detect_available_browsers()
+            detect_available_browsers(refresh=True)
+        self.assertEqual(scan.call_count, 2)
+
+    def test_warm_up_fills_cache(self):
+        with patch('browser_utils._scan_browsers', return_value=['firefox']) as scan:
+            warm_browser_detection().join(5)
+            self.assertEqual(detect_available_browsers(), ['firefox'])
+        self.assertEqual(scan.call_count, 1)
+
+
+def _make_store(path, table, host_column, cookies):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE {table} ({host_column} TEXT, name TEXT, value TEXT)")
+    conn.executemany(f"INSERT INTO {table} VALUES (?, ?, 'secret')", cookies)
+    conn.commit()
+    conn.close()
+
+
+class TestYouTubeCookieProbe(unittest.TestCase):
+    """Only YouTube cookie names are read, one thread per browser."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.firefox_root = os.path.join(self._tmp.name, 'firefox')
+        self.chrome_root = os.path.join(self._tmp.name, 'chrome')
+        self.brave_root = os.path.join(self._tmp.name, 'brave')
+        os.makedirs(self.firefox_root)
+        for patcher in (
+            patch('browser_utils._FIREFOX_ROOTS', [self.firefox_root]),
+            patch('browser_utils._CHROMIUM_ROOTS', {'chrome': [self.chrome_root], 'brave': [self.brave_root]}),
+            patch('browser_utils._detected', None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_finds_logged_in_profiles_only(self):
+        _make_store(os.path.join(self.firefox_root, 'a.default', 'cookies.sqlite'), 'moz_cookies', 'host',
+                    [('.youtube.com', 'PREF'), ('.google.com', 'SAPISID')])
+        _make_store(os.path.join(self.chrome_root, 'Profile 2', 'Network', 'Cookies'), 'cookies', 'host_key',
+                    [('.youtube.com', '__Secure-3PAPISID')])
+        _make_store(os.path.join(self.brave_root, 'Default', 'Cookies'), 'cookies', 'host_key', [])
+        self.assertEqual(get_browsers_with_youtube_cookies(), ['chrome'])
+
+    def test_unreadable_store_is_skipped(self):
+        profile = os.path.join(self.chrome_root, 'Default')
+        os.makedirs(profile)
+        with open(os.path.join(profile, 'Cookies'), 'w') as f:
+            f.write('not a database')
+        with self.assertLogs('browser_utils', 'WARNING'):
+            self.assertEqual(get_browsers_with_youtube_cookies(), [])
+
+    def test_login_still_in_write_ahead_log_is_found(self):
+        path = os.path.join(self.firefox_root, 'a.default', 'cookies.sqlite')
+        _make_store(path, 'moz_cookies', 'host', [('.youtube.com', 'PREF')])
+        browser = sqlite3.connect(path)
+        self.addCleanup(browser.close)
+        browser.execute('PRAGMA journal_mode=WAL')
+        browser.execute('PRAGMA wal_autocheckpoint=0')
+        browser.execute("INSERT INTO moz_cookies VALUES ('.youtube.com', 'SAPISID', 'secret')")
+        browser.commit()
+        self.assertEqual(get_browsers_with_youtube_cookies(), ['firefox'])
+
+    def test_locked_store_is_read_immutable(self):
+        path = os.path.join(self.firefox_root, 'a.default', 'cookies.sqlite')
+        _make_store(path, 'moz_cookies', 'host', [('.youtube.com', 'SAPISID')])
+        browser = sqlite3.connect(path, isolation_level=None)
+        self.addCleanup(browser.close)
+        browser.execute('BEGIN EXCLUSIVE')
+        self.addCleanup(browser.execute, 'ROLLBACK')
+        self.assertEqual(get_browsers_with_youtube_cookies(), ['firefox'])
+
+    def test_browsers_are_probed_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def probe(browser):
+            barrier.wait()
+            return browser != 'brave'
+
+        with patch('browser_utils.detect_available_browsers', return_value=['firefox', 'chrome', 'brave']), \
+                patch('browser_utils._has_youtube_login', side_effect=probe):
+            self.assertEqual(get_browsers_with_youtube_cookies(), ['firefox', 'chrome'])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,138 @@
+"""
+Tests for incremental channel sync (extractors.sync_state).
+
+Covers:
+- SyncState: newest-first merge, per-URL cap, persistence, corrupt files, forget
+- video_id / until_known: site IDs, info-cache handles and URL fallback
+- iter_video_batches(stop_at=...): paging stops at the first known entry
+"""
+
+import json
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so extractor tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractors.podcast_page import PodcastPageExtractor
+from extractors.sync_state import KNOWN_IDS_PER_URL, SyncState, open_sync_state, until_known, video_id
+from extractors.youtube_ytdlp import YouTubeExtractor
+
+CHANNEL = 'https://www.youtube.com/@channel/videos'
+
+
+class TestSyncState(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, 'channel_sync.json')
+
+    def test_first_sync_knows_nothing(self):
+        self.assertEqual(SyncState(self.path).known_ids(CHANNEL), frozenset())
+
+    def test_record_merges_newest_first_and_caps(self):
+        state = SyncState(self.path)
+        state.record(CHANNEL, [f'old{n}' for n in range(KNOWN_IDS_PER_URL)])
+        state.record(CHANNEL, ['new1', 'new0', None])
+        known = state.known_ids(CHANNEL)
+        self.assertEqual(len(known), KNOWN_IDS_PER_URL)
+        self.assertIn('new1', known)
+        self.assertIn('old0', known)
+        self.assertNotIn(f'old{KNOWN_IDS_PER_URL - 1}', known)
+
+    def test_persists_across_instances(self):
+        SyncState(self.path).record(f' {CHANNEL} ', ['a', 'b'])
+        self.assertEqual(SyncState(self.path).known_ids(CHANNEL), {'a', 'b'})
+
+    def test_corrupt_file_starts_empty(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        self.assertEqual(SyncState(self.path).known_ids(CHANNEL), frozenset())
+
+    def test_forget(self):
+        state = SyncState(self.path)
+        state.record(CHANNEL, ['a'])
+        state.forget(CHANNEL)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_open_falls_back_to_memory(self):
+        with patch('extractors.sync_state.data_dir', side_effect=OSError):
+            state = open_sync_state()
+        self.assertIsNone(state.path)
+        state.record(CHANNEL, ['a'])
+        self.assertEqual(state.known_ids(CHANNEL), {'a'})
+
+
+class TestUntilKnown(unittest.TestCase):
+    def test_video_id_prefers_site_id_then_url(self):
+        self.assertEqual(video_id({'id': 'abc', 'url': 'u'}), 'abc')
+        self.assertEqual(video_id({'url': 'https://example.com/ep1.mp3'}), 'https://example.com/ep1.mp3')
+
+    def test_stops_at_first_known(self):
+        videos = [{'id': 'c'}, {'id': 'b'}, {'id': 'a'}, {'id': 'z'}]
+        self.assertEqual(until_known(videos, {'a'}), [{'id': 'c'}, {'id': 'b'}])
+        self.assertEqual(until_known(videos, {'x'}), videos)
+
+
+class _PlaylistEntries:
+    def __init__(self, ydl, info):
+        self.info = info
+
+    def get_requested_items(self):
+        yield from enumerate(self.info['entries'], 1)
+
+
+class TestStopAtKnown(unittest.TestCase):
+    def test_paging_stops_at_known_entry(self):
+        pulled = []
+
+        def pages():
+            for n in range(9, 0, -1):
+                pulled.append(n)
+                yield {'_type': 'url', 'ie_key': 'Youtube', 'id': f'v{n}', 'title': f'Video {n}',
+                       'url': f'https://www.youtube.com/watch?v=v{n}'}
+
+        class FakeYoutubeDL:
+            def __init__(self, params):
+                self.params = params
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def extract_info(self, url, download=True, ie_key=None, process=True):
+                return {'_type': 'playlist', 'entries': pages()}
+
+        utils = types.SimpleNamespace(PlaylistEntries=_PlaylistEntries)
+        fake = types.SimpleNamespace(YoutubeDL=FakeYoutubeDL, utils=utils)
+        with patch('extractors.base.yt_dlp', fake):
+            batches = list(YouTubeExtractor(CHANNEL).iter_video_batches(100, stop_at={'v7', 'v3'}))
+        self.assertEqual([[v['id'] for v in b] for b in batches], [['v9', 'v8']])
+        self.assertEqual(pulled, [9, 8, 7])
+
+    def test_single_page_extractors_are_filtered(self):
+        extractor = PodcastPageExtractor('https://example.com/show')
+        items = [{'url': 'https://example.com/ep3.mp3'}, {'url': 'https://example.com/ep2.mp3'}]
+        with patch.object(PodcastPageExtractor, 'extract_info', return_value=items):
+            batches = list(extractor.iter_video_batches(stop_at={'https://example.com/ep2.mp3'}))
+        self.assertEqual(batches, [items[:1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
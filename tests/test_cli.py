@@ -0,0 +1,170 @@
+"""
+Tests for the headless command-line interface (avmorningstar.cli / batch).
+
+Covers:
+- read_url_lists: positional URLs, list files, stdin, comments, de-duplication
+- Startup cost: importing the CLI pulls in neither PyQt5 nor yt-dlp
+- main(): JSON-lines events, exit codes, fetch errors and --sync recording
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so extractor tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from avmorningstar import cli
+from avmorningstar.batch import read_url_lists
+from extractors import SyncState
+
+CHANNEL = 'https://www.youtube.com/@channel/videos'
+
+
+class TestReadUrlLists(unittest.TestCase):
+    def test_files_stdin_and_comments(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write('# nightly\nhttps://a.example/1\n\n  ; skipped\nhttps://a.example/2\n')
+        self.addCleanup(os.unlink, f.name)
+        urls = read_url_lists(
+            ['https://a.example/2', ' '], [f.name, '-'], stdin=io.StringIO('https://a.example/3\n'),
+        )
+        self.assertEqual(urls, ['https://a.example/2', 'https://a.example/1', 'https://a.example/3'])
+
+
+class TestStartupCost(unittest.TestCase):
+    def test_cli_import_skips_gui_and_ytdlp(self):
+        code = (
+            'import sys; import avmorningstar.cli; '
+            "print(sorted({m.split('.')[0] for m in sys.modules} & "
+            "{'PyQt5', 'yt_dlp', 'extractors', 'downloader', 'mutagen'}))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
+
+class _FakeExtractor:
+    listings = {}
+
+    def __init__(self, url):
+        self.url = url
+
+    def iter_video_batches(self, batch_size=100, stop_at=None):
+        if self.url not in self.listings:
+            raise RuntimeError('Unsupported URL')
+        videos = [v for v in self.listings[self.url] if v['id'] not in (stop_at or ())]
+        yield videos
+
+
+class _FakeEngine:
+    fail = set()
+
+    def __init__(self, urls, on_progress=None, on_job_progress=None, on_stage_done=None, should_stop=None,
+                 **kwargs):
+        self.urls, self.kwargs = urls, kwargs
+        self.on_job_progress, self.on_stage_done = on_job_progress, on_stage_done
+        self.skipped = 0
+        self.lyrics_errors = []
+
+    def run(self):
+        failed = []
+        for idx, url in enumerate(self.urls, 1):
+            if url in self.fail:
+                failed.append((url, 'HTTP Error 403'))
+                continue
+            self.on_job_progress({'index': idx, 'stage': 'transfer', 'status': 'finished', 'percent': 100})
+            self.on_stage_done('transfer', idx, url)
+        return len(self.urls) - len(failed), failed
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        _FakeExtractor.listings = {
+            CHANNEL: [{'id': 'v2', 'url': 'https://www.youtube.com/watch?v=v2'},
+                      {'id': 'v1', 'url': 'https://www.youtube.com/watch?v=v1'}],
+        }
+        _FakeEngine.fail = set()
+        for target, value in (
+            ('extractors.get_extractor', lambda url, cookies_from_browser=None: _FakeExtractor(url)),
+            ('downloader.DownloadEngine', _FakeEngine),
+            ('downloader.open_fragment_tuner', lambda: None),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_cli(self, *argv):
+        out = io.StringIO()
+        code = cli.main(['--no-archive', *argv], stdout=out)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_downloads_and_reports_json_lines(self):
+        code, events = self.run_cli(CHANNEL, '-f', 'audio', '-j', '2')
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(events[0], {'event': 'start', 'inputs': 1})
+        self.assertEqual(events[1], {'event': 'fetched', 'url': CHANNEL, 'entries': 2})
+        progress = [e for e in events if e['event'] == 'progress']
+        self.assertEqual([e['url'] for e in progress], [v['url'] for v in _FakeExtractor.listings[CHANNEL]])
+        self.assertEqual(events[-1]['event'], 'done')
+        self.assertEqual(events[-1]['successful'], 2)
+        self.assertFalse(events[-1]['cancelled'])
+
+    def test_fetch_and_download_failures_exit_nonzero(self):
+        _FakeEngine.fail = {'https://www.youtube.com/watch?v=v1'}
+        code, events = self.run_cli(CHANNEL, 'https://unsupported.example/')
+        self.assertEqual(code, cli.EXIT_FAILED)
+        self.assertIn({'event': 'fetch_error', 'url': 'https://unsupported.example/', 'error': 'Unsupported URL'},
+                      events)
+        done = events[-1]
+        self.assertEqual(done['fetch_errors'], 1)
+        self.assertEqual(done['failed'], [{'url': 'https://www.youtube.com/watch?v=v1', 'error': 'HTTP Error 403'}])
+
+    def test_usage_error(self):
+        with patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit) as raised:
+            cli.main([])
+        self.assertEqual(raised.exception.code, cli.EXIT_USAGE)
+
+    def test_sync_records_all_but_failed_entries(self):
+        state = SyncState()
+        _FakeEngine.fail = {'https://www.youtube.com/watch?v=v2'}
+        with patch('extractors.open_sync_state', return_value=state):
+            self.run_cli('--sync', CHANNEL)
+            self.assertEqual(state.known_ids(CHANNEL), {'v1'})
+            _FakeEngine.fail = set()
+            _, events = self.run_cli('--sync', CHANNEL)
+        self.assertEqual(events[1]['entries'], 1)
+        self.assertEqual(state.known_ids(CHANNEL), {'v1', 'v2'})
+
+    def test_sync_point_stays_behind_failed_middle_entry(self):
+        _FakeExtractor.listings[CHANNEL].insert(0, {'id': 'v3', 'url': 'https://www.youtube.com/watch?v=v3'})
+        state = SyncState()
+        _FakeEngine.fail = {'https://www.youtube.com/watch?v=v2'}
+        with patch('extractors.open_sync_state', return_value=state):
+            self.run_cli('--sync', CHANNEL)
+            self.assertEqual(state.known_ids(CHANNEL), {'v1'})
+            _FakeEngine.fail = set()
+            _, events = self.run_cli('--sync', CHANNEL)
+        self.assertEqual(events[1]['entries'], 2)
+        self.assertEqual(state.known_ids(CHANNEL), {'v1', 'v2', 'v3'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Tests for browser cookies shared in memory (extractors.cookie_jars).
+
+Covers:
+- BrowserCookieJars: one load per browser, also under concurrent first use
+- invalidate: reload on next use, min_age throttle, clear all
+- youtube_dl: browser option removed, shared jar attached, no-cookie passthrough
+- Fetches reuse one jar; the engine drops it after an auth failure
+- is_auth_error
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so extractor tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.engine import DownloadEngine
+from extractors.cookie_jars import BrowserCookieJars, is_auth_error
+from extractors.generic import GenericExtractor
+
+
+class _CountingLoader:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+
+    def __call__(self, spec):
+        time.sleep(self.delay)
+        self.calls.append(spec)
+        return {'jar': len(self.calls)}
+
+
+class FakeYoutubeDL:
+    def __init__(self, params):
+        self.params = params
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=True, ie_key=None, process=True):
+        return {'id': 'abc', 'title': 'Video', 'webpage_url': url}
+
+
+class TestBrowserCookieJars(unittest.TestCase):
+    def test_loads_once_under_concurrent_first_use(self):
+        loader = _CountingLoader(delay=0.05)
+        jars = BrowserCookieJars(loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(jars.jar(('firefox',)))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(loader.calls, [('firefox',)])
+        self.assertTrue(all(jar is results[0] for jar in results))
+        self.assertIs(jars.jar('firefox'), results[0])
+
+    def test_invalidate_reloads_on_next_use(self):
+        loader = _CountingLoader()
+        jars = BrowserCookieJars(loader)
+        first = jars.jar('brave')
+        jars.invalidate('brave', min_age=60)
+        self.assertIs(jars.jar('brave'), first)
+        jars.invalidate('brave')
+        self.assertEqual(jars.jar('brave'), {'jar': 2})
+        jars.jar('firefox')
+        jars.invalidate()
+        jars.jar('firefox')
+        self.assertEqual(len(loader.calls), 4)
+
+    def test_youtube_dl_attaches_shared_jar(self):
+        jars = BrowserCookieJars(_CountingLoader())
+        ydl = jars.youtube_dl(FakeYoutubeDL, {'quiet': True, 'cookiesfrombrowser': ('firefox',)})
+        self.assertEqual(ydl.params, {'quiet': True})
+        self.assertIs(ydl.cookiejar, jars.jar('firefox'))
+        plain = jars.youtube_dl(FakeYoutubeDL, {'quiet': True})
+        self.assertFalse(hasattr(plain, 'cookiejar'))
+
+    def test_fetches_share_one_load(self):
+        loader = _CountingLoader()
+        jars = BrowserCookieJars(loader)
+        fake = types.SimpleNamespace(YoutubeDL=FakeYoutubeDL)
+        with patch('extractors.base.yt_dlp', fake), patch('extractors.base.shared_cookie_jars', jars):
+            for _ in range(3):
+                GenericExtractor('https://example.com/v', cookies_from_browser='firefox').extract_info()
+        self.assertEqual(loader.calls, [('firefox',)])
+
+
+class TestAuthRefresh(unittest.TestCase):
+    def test_auth_error_markers(self):
+        self.assertTrue(is_auth_error("ERROR: Sign in to confirm you're not a bot"))
+        self.assertTrue(is_auth_error('This video is members only'))
+        self.assertFalse(is_auth_error('HTTP Error 404: Not Found'))
+
+    def test_engine_drops_jar_after_auth_failure(self):
+        engine = DownloadEngine(['https://example.com/v'], '/out', 'video', cookies_from_browser='firefox')
+        job = {'idx': 1, 'url': 'https://example.com/v', 'job_id': None}
+        with patch('downloader.engine.shared_cookie_jars') as jars:
+            engine._on_stage_event('extract', job, Exception('HTTP Error 404'))
+            jars.invalidate.assert_not_called()
+            engine._on_stage_event('extract', job, Exception('Sign in to confirm your age'))
+        jars.invalidate.assert_called_once()
+        self.assertEqual(jars.invalidate.call_args.args, ('firefox',))
+
+
+if __name__ == '__main__':
+    unittest.main()
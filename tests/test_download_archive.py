@@ -0,0 +1,81 @@
+"""
+Tests for downloader.archive — the yt-dlp-compatible download archive.
+
+Covers:
+- archive_id: yt-dlp ``make_archive_id`` line format
+- Loading an existing archive file, including a large one
+- contains / contains_info lookups and appending new entries
+"""
+
+import os
+import sys
+import tempfile
+import time
+import types
+import unittest
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.archive import DownloadArchive, archive_id
+
+
+class TestDownloadArchive(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, 'archive.txt')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_archive_id_matches_ytdlp_format(self):
+        self.assertEqual(archive_id('Youtube', 'dQw4w9WgXcQ'), 'youtube dQw4w9WgXcQ')
+
+    def test_missing_file_is_empty(self):
+        archive = DownloadArchive(self.path).start_loading()
+        self.assertEqual(len(archive), 0)
+        self.assertFalse(archive.contains('Youtube', 'abc'))
+
+    def test_existing_entries_are_loaded(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('youtube abc\n\nodysee xyz\n')
+        archive = DownloadArchive(self.path).start_loading()
+        self.assertTrue(archive.contains('Youtube', 'abc'))
+        self.assertTrue(archive.contains_info({'extractor_key': 'Odysee', 'id': 'xyz'}))
+        self.assertFalse(archive.contains('Youtube', 'xyz'))
+
+    def test_add_appends_once(self):
+        archive = DownloadArchive(self.path)
+        archive.add('Youtube', 'abc')
+        archive.add('Youtube', 'abc')
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'youtube abc\n')
+        self.assertTrue(DownloadArchive(self.path).contains('Youtube', 'abc'))
+
+    def test_missing_key_or_id_is_never_archived(self):
+        archive = DownloadArchive(self.path)
+        archive.add(None, 'abc')
+        self.assertFalse(archive.contains(None, 'abc'))
+        self.assertFalse(archive.contains_info({'id': 'abc'}))
+
+    def test_large_archive_loads_in_background(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.writelines(f'youtube id{n:07d}\n' for n in range(300_000))
+        start = time.perf_counter()
+        archive = DownloadArchive(self.path).start_loading()
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertTrue(archive.contains('Youtube', 'id0299999'))
+        self.assertEqual(len(archive), 300_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
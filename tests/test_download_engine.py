@@ -0,0 +1,392 @@
+"""
+Tests for the batch download engine with a fake yt-dlp backend.
+
+Covers:
+- Output filename de-duplication across items sharing a filename template
+- YoutubeDL session reuse across items with identical options
+- Success / failure accounting
+- Cancellation before items start
+- Reuse of fetch-phase metadata, with re-extraction when media URLs expired
+- Post-processing the requested download with its video's metadata
+- Job journalling: batch cleanup, resume onto recorded output paths
+- Download archive: skipping archived items and recording finished ones
+- Lyrics lookups running in the background until the end of the batch
+- Fragment concurrency applied per transfer; back-off on throttling of fragmented transfers only
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+# ---- Stub yt_dlp so engine tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.archive import DownloadArchive
+from downloader.engine import DownloadEngine
+from downloader.fragments import INITIAL_CONCURRENCY, FragmentTuner
+from downloader.job_store import JobStore
+from downloader.progress import JOB_INDEX_KEY
+from extractors.info_cache import InfoCache
+
+
+class FakeYoutubeDL:
+    """Minimal YoutubeDL stand-in that records the options each instance was built with."""
+
+    instances = []
+    titles = {}
+    failing = set()
+    forbidden = set()
+    throttled = set()
+    protocols = {}
+    extracted = []
+
+    def __init__(self, opts):
+        self.params = opts
+        self.processed = []
+        self.post_processed = []
+        self.post_infos = []
+        self.fragments_seen = []
+        self.closed = False
+        FakeYoutubeDL.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        self.closed = True
+
+    @staticmethod
+    def sanitize_info(info, remove_private_keys=False):
+        return dict(info)
+
+    def extract_info(self, url, download=True, ie_key=None):
+        FakeYoutubeDL.extracted.append((url, ie_key))
+        if url in FakeYoutubeDL.failing:
+            raise Exception(f'unavailable: {url}')
+        return {'id': url, 'extractor_key': 'Fake', 'title': FakeYoutubeDL.titles.get(url, url), 'ext': 'webm',
+                'protocol': FakeYoutubeDL.protocols.get(url, 'https')}
+
+    def prepare_filename(self, info):
+        return os.path.join('/out', f"{info['title']}.{info['ext']}")
+
+    def process_ie_result(self, info, download=True):
+        if info.get('id') in FakeYoutubeDL.forbidden:
+            raise Exception('ERROR: unable to download video data: HTTP Error 403: Forbidden')
+        if info.get('id') in FakeYoutubeDL.throttled:
+            raise Exception('ERROR: fragment 3 not found: HTTP Error 429: Too Many Requests')
+        self.processed.append(info)
+        self.fragments_seen.append(self.params.get('concurrent_fragment_downloads'))
+        filepath = self.prepare_filename(info)
+        return {**info, 'requested_downloads': [{**info, 'filepath': filepath}]}
+
+    def post_process(self, filename, info, files_to_move=None):
+        self.post_processed.append(filename)
+        self.post_infos.append(info)
+        return {**info, 'filepath': os.path.splitext(filename)[0] + '.mp3'}
+
+
+def _make_engine(urls, format_type='video', **kwargs):
+    extractor = MagicMock()
+    extractor.get_download_opts.return_value = {'outtmpl': '/out/%(title)s.%(ext)s'}
+    engine = DownloadEngine(urls, '/out', format_type, max_workers=1, per_host_limit=1, **kwargs)
+    return engine, extractor
+
+
+class TestDownloadEngine(unittest.TestCase):
+    def setUp(self):
+        FakeYoutubeDL.instances = []
+        FakeYoutubeDL.titles = {}
+        FakeYoutubeDL.failing = set()
+        FakeYoutubeDL.forbidden = set()
+        FakeYoutubeDL.throttled = set()
+        FakeYoutubeDL.protocols = {}
+        FakeYoutubeDL.extracted = []
+        self.info_cache = InfoCache()
+
+    def _run(self, engine, extractor):
+        with patch('downloader.engine.get_extractor', return_value=extractor), \
+                patch('downloader.engine.shared_info_cache', self.info_cache), \
+                patch('downloader.sessions.yt_dlp.YoutubeDL', FakeYoutubeDL):
+            return engine.run()
+
+    def test_duplicate_titles_get_distinct_output_templates(self):
+        urls = ['https://a.example/1', 'https://a.example/2']
+        FakeYoutubeDL.titles = {url: 'Same' for url in urls}
+        engine, extractor = _make_engine(urls)
+        successful, failed = self._run(engine, extractor)
+
+        self.assertEqual((successful, failed), (2, []))
+        outtmpls = [ydl.params['outtmpl'] for ydl in FakeYoutubeDL.instances if ydl.processed]
+        self.assertEqual(outtmpls, ['/out/%(title)s.%(ext)s', '/out/Same (2).%(ext)s'])
+
+    def test_items_with_same_options_share_sessions(self):
+        """At most one instance per concurrently busy stage (extract + transfer)."""
+        urls = [f'https://a.example/{n}' for n in range(5)]
+        engine, extractor = _make_engine(urls)
+        self._run(engine, extractor)
+        self.assertLessEqual(len(FakeYoutubeDL.instances), 2)
+        self.assertEqual(sum(len(ydl.processed) for ydl in FakeYoutubeDL.instances), 5)
+        self.assertTrue(all(ydl.closed for ydl in FakeYoutubeDL.instances))
+
+    def test_failed_item_does_not_return_its_session(self):
+        urls = ['https://a.example/1', 'https://a.example/2']
+        FakeYoutubeDL.failing = {'https://a.example/1'}
+        engine, extractor = _make_engine(urls)
+        self._run(engine, extractor)
+        self.assertEqual(len(FakeYoutubeDL.instances), 2)
+        self.assertTrue(FakeYoutubeDL.instances[0].closed)
+
+    def test_percent_in_title_is_escaped_in_override_template(self):
+        urls = ['https://a.example/1', 'https://a.example/2']
+        FakeYoutubeDL.titles = {url: '100% Hits' for url in urls}
+        engine, extractor = _make_engine(urls)
+        self._run(engine, extractor)
+        self.assertEqual(FakeYoutubeDL.instances[-1].params['outtmpl'], '/out/100%% Hits (2).%(ext)s')
+
+    def test_failures_are_collected_and_batch_continues(self):
+        urls = ['https://a.example/1', 'https://a.example/2', 'https://a.example/3']
+        FakeYoutubeDL.failing = {'https://a.example/2'}
+        engine, extractor = _make_engine(urls)
+        successful, failed = self._run(engine, extractor)
+        self.assertEqual(successful, 2)
+        self.assertEqual([url for url, _ in failed], ['https://a.example/2'])
+
+    def test_cancelled_batch_starts_nothing(self):
+        engine, extractor = _make_engine(['https://a.example/1'], should_stop=lambda: True)
+        successful, failed = self._run(engine, extractor)
+        self.assertEqual((successful, failed), (0, []))
+        self.assertEqual(FakeYoutubeDL.instances, [])
+
+    def test_fresh_fetch_info_skips_extraction(self):
+        url = 'https://a.example/1'
+        self.info_cache.remember(url, {'id': 'cached', 'title': 'Cached', 'ext': 'webm', 'formats': [{'url': 'x'}]})
+        engine, extractor = _make_engine([url])
+        successful, _ = self._run(engine, extractor)
+        self.assertEqual(successful, 1)
+        self.assertEqual(FakeYoutubeDL.extracted, [])
+        self.assertEqual(FakeYoutubeDL.instances[0].processed[0]['id'], 'cached')
+
+    def test_flat_entry_handle_is_passed_as_ie_key(self):
+        url = 'https://a.example/1'
+        self.info_cache.remember(url, {'id': 'x', 'ie_key': 'Generic'})
+        engine, extractor = _make_engine([url])
+        self._run(engine, extractor)
+        self.assertEqual(FakeYoutubeDL.extracted, [(url, 'Generic')])
+
+    def test_expired_media_urls_fall_back_to_extraction(self):
+        url = 'https://a.example/1'
+        self.info_cache.remember(url, {'id': 'stale', 'title': 'T', 'ext': 'webm', 'formats': [{'url': 'x'}]})
+        FakeYoutubeDL.forbidden = {'stale'}
+        engine, extractor = _make_engine([url])
+        successful, failed = self._run(engine, extractor)
+        self.assertEqual((successful, failed), (1, []))
+        self.assertEqual(FakeYoutubeDL.extracted, [(url, None)])
+
+    def _job_store(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = JobStore(os.path.join(tmp.name, 'jobs.sqlite3'))
+        self.addCleanup(store.close)
+        return store
+
+    def test_completed_batch_is_removed_from_journal(self):
+        store = self._job_store()
+        engine, extractor = _make_engine(['https://a.example/1'], job_store=store)
+        self._run(engine, extractor)
+        self.assertEqual(store.unfinished_batches(), [])
+
+    def test_resume_reuses_recorded_output_path_and_skips_done_jobs(self):
+        store = self._job_store()
+        urls = ['https://a.example/1', 'https://a.example/2']
+        batch_id, (done_id, partial_id) = store.create_batch(urls, {})
+        store.mark_done(done_id, '/out/One.webm')
+        store.mark_running(partial_id, '/out/Old Title.webm')
+
+        engine, extractor = _make_engine(urls, job_store=store, batch_id=batch_id)
+        successful, _ = self._run(engine, extractor)
+
+        self.assertEqual(successful, 1)
+        self.assertEqual(FakeYoutubeDL.extracted, [('https://a.example/2', None)])
+        self.assertEqual(FakeYoutubeDL.instances[-1].params['outtmpl'], '/out/Old Title.%(ext)s')
+        self.assertEqual(store.unfinished_batches(), [])
+
+    def test_interrupted_batch_stays_journalled(self):
+        store = self._job_store()
+        engine, extractor = _make_engine(['https://a.example/1'], job_store=store, should_stop=lambda: True)
+        self._run(engine, extractor)
+        batches = store.unfinished_batches()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0]['settings']['format_type'], 'video')
+
+    def test_progress_hook_records_bytes_for_tagged_job(self):
+        store = self._job_store()
+        batch_id, (job_id,) = store.create_batch(['https://a.example/1'], {})
+        engine, _ = _make_engine([], job_store=store)
+        engine.progress_hook({
+            'status': 'downloading', 'downloaded_bytes': 2048, 'total_bytes': 4096,
+            'info_dict': {'_avms_job_id': job_id},
+        })
+        self.assertEqual(store.pending_jobs(batch_id)[0]['bytes_done'], 2048)
+
+    def test_postprocessors_run_in_separate_stage(self):
+        url = 'https://a.example/1'
+        FakeYoutubeDL.titles = {url: 'Song'}
+        events = []
+        engine, extractor = _make_engine([url], on_stage_done=lambda *event: events.append(event))
+        extractor.get_download_opts.return_value = {
+            'outtmpl': '/out/%(title)s.%(ext)s',
+            'postprocessors': [{'key': 'FFmpegExtractAudio'}],
+        }
+        self._run(engine, extractor)
+
+        transfer = next(ydl for ydl in FakeYoutubeDL.instances if ydl.processed)
+        self.assertNotIn('postprocessors', transfer.params)
+        post = next(ydl for ydl in FakeYoutubeDL.instances if ydl.post_processed)
+        self.assertEqual(post.post_processed, ['/out/Song.webm'])
+        self.assertEqual(
+            events,
+            [('extract', 1, url), ('transfer', 1, url), ('postprocess', 1, url)],
+        )
+
+    def test_postprocess_sees_video_metadata_without_transfer_internals(self):
+        url = 'https://a.example/1'
+        engine, extractor = _make_engine([url])
+        extractor.get_download_opts.return_value = {
+            'outtmpl': '/out/%(title)s.%(ext)s',
+            'postprocessors': [{'key': 'FFmpegMetadata'}, {'key': 'EmbedThumbnail'}],
+        }
+
+        def process_ie_result(ydl, info, download=True):
+            # Shaped like yt-dlp's process_video_result after a merged
+            # download: fields shared with the video are stripped from the
+            # requested download, which keeps the merger's private keys.
+            ydl.processed.append(info)
+            return {
+                **info, 'title': 'Clip', 'artist': 'Band', 'ext': 'mp4',
+                'thumbnails': [{'url': 'https://i.example/1.jpg', 'filepath': '/out/Clip.jpg'}],
+                'chapters': [{'start_time': 0, 'end_time': 5, 'title': 'Intro'}],
+                'requested_downloads': [{
+                    'format_id': '137+140', 'ext': 'mp4', 'filepath': '/out/Clip.mp4',
+                    '__postprocessors': ['FFmpegMergerPP'], '__files_to_merge': ['/out/Clip.f137.mp4'],
+                    '__files_to_move': {},
+                }],
+            }
+
+        with patch.object(FakeYoutubeDL, 'process_ie_result', process_ie_result):
+            self._run(engine, extractor)
+
+        post = next(ydl for ydl in FakeYoutubeDL.instances if ydl.post_processed)
+        self.assertEqual(post.post_processed, ['/out/Clip.mp4'])
+        pp_info = post.post_infos[0]
+        self.assertEqual((pp_info['title'], pp_info['artist'], pp_info['format_id']), ('Clip', 'Band', '137+140'))
+        self.assertEqual(pp_info['thumbnails'][0]['filepath'], '/out/Clip.jpg')
+        self.assertEqual(pp_info['chapters'][0]['title'], 'Intro')
+        for key in ('__postprocessors', '__files_to_merge', '__files_to_move', 'requested_downloads'):
+            self.assertNotIn(key, pp_info)
+        self.assertEqual(engine.successful, 1)
+
+    def test_lyrics_run_in_background_until_batch_end(self):
+        urls = ['https://a.example/1', 'https://a.example/2']
+        release = threading.Event()
+        order = []
+
+        def slow_lyrics(info, path, save_lrc, cache=None):
+            release.wait(timeout=2)
+            order.append(('lyrics', path))
+
+        engine, extractor = _make_engine(urls, format_type='audio', fetch_lyrics_flag=True)
+        engine.on_stage_done = lambda stage, idx, url: stage == 'postprocess' and order.append(('done', idx))
+        threading.Timer(0.1, release.set).start()
+        with patch('downloader.lyrics_step.handle_lyrics', side_effect=slow_lyrics):
+            successful, _ = self._run(engine, extractor)
+
+        self.assertEqual(successful, 2)
+        self.assertEqual(order[:2], [('done', 1), ('done', 2)])
+        self.assertEqual(len([event for event in order if event[0] == 'lyrics']), 2)
+
+    def test_fragment_tuner_sets_concurrency_for_transfer(self):
+        tuner = FragmentTuner()
+        engine, extractor = _make_engine(['https://a.example/1'], fragment_tuner=tuner)
+        self._run(engine, extractor)
+        transfer = next(ydl for ydl in FakeYoutubeDL.instances if ydl.processed)
+        self.assertEqual(transfer.fragments_seen, [INITIAL_CONCURRENCY])
+        self.assertEqual(transfer.processed[0]['_avms_fragments'], INITIAL_CONCURRENCY)
+        self.assertNotIn('concurrent_fragment_downloads', transfer.params)
+
+    def test_throttled_transfer_backs_off_fragment_concurrency(self):
+        tuner = MagicMock()
+        tuner.concurrency.return_value = 8
+        FakeYoutubeDL.throttled = {'https://a.example/1'}
+        FakeYoutubeDL.protocols = {'https://a.example/1': 'm3u8_native+https'}
+        engine, extractor = _make_engine(['https://a.example/1'], fragment_tuner=tuner)
+        self._run(engine, extractor)
+        tuner.back_off.assert_called_once_with('a.example')
+
+    def test_throttled_progressive_transfer_keeps_fragment_level(self):
+        tuner = MagicMock()
+        tuner.concurrency.return_value = 8
+        FakeYoutubeDL.throttled = {'https://a.example/1'}
+        engine, extractor = _make_engine(['https://a.example/1'], fragment_tuner=tuner)
+        self._run(engine, extractor)
+        tuner.back_off.assert_not_called()
+
+    def test_fragment_progress_marks_transfer_fragmented(self):
+        engine, _ = _make_engine(['https://a.example/1'], fragment_tuner=FragmentTuner())
+        job = {'idx': 1, 'info': {'protocol': 'https'}}
+        self.assertFalse(engine._was_fragmented(job))
+        engine.progress_hook({'status': 'downloading', 'fragment_index': 1, 'fragment_count': 9,
+                              'info_dict': {JOB_INDEX_KEY: 1}})
+        self.assertTrue(engine._was_fragmented(job))
+
+    def _archive(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        return DownloadArchive(os.path.join(tmp.name, 'archive.txt'))
+
+    def test_archived_flat_entry_is_skipped_without_extraction(self):
+        archive = self._archive()
+        archive.add('Youtube', 'abc')
+        self.info_cache.remember('https://a.example/1', {'id': 'abc', 'ie_key': 'Youtube'})
+        engine, extractor = _make_engine(['https://a.example/1'], archive=archive)
+        successful, failed = self._run(engine, extractor)
+        self.assertEqual((successful, failed, engine.skipped), (0, [], 1))
+        self.assertEqual(FakeYoutubeDL.extracted, [])
+
+    def test_item_archived_under_extracted_id_is_skipped(self):
+        archive = self._archive()
+        archive.add('Fake', 'https://a.example/1')
+        engine, extractor = _make_engine(['https://a.example/1'], archive=archive)
+        self._run(engine, extractor)
+        self.assertEqual(engine.skipped, 1)
+        self.assertFalse(any(ydl.processed for ydl in FakeYoutubeDL.instances))
+
+    def test_finished_items_are_added_to_archive(self):
+        archive = self._archive()
+        engine, extractor = _make_engine(['https://a.example/1'], archive=archive)
+        self._run(engine, extractor)
+        self.assertTrue(archive.contains('Fake', 'https://a.example/1'))
+
+    def test_progress_hook_raises_when_cancelled(self):
+        engine, _ = _make_engine([], should_stop=lambda: True)
+        with self.assertRaises(Exception):
+            engine.progress_hook({'status': 'downloading'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests for downloader.pipeline — staged worker pools with bounded queues.
+
+Covers:
+- Items flow through every stage in order, with per-item completion events
+- Stages overlap: a later stage works on one item while an earlier stage
+  works on the next
+- Bounded queues apply back-pressure to upstream stages
+- Worker errors end an item at that stage; cancellation stops feeding
+- Per-host caps, with other hosts' items filling spare workers
+"""
+
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.pipeline import Pipeline, Stage
+
+
+class _Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+
+    def __call__(self, stage, item, error):
+        with self.lock:
+            self.events.append((stage, item, error))
+
+
+class TestPipeline(unittest.TestCase):
+    def test_items_pass_through_all_stages(self):
+        recorder = _Recorder()
+        Pipeline(
+            [Stage('double', lambda x: x * 2), Stage('inc', lambda x: x + 1)],
+            on_event=recorder,
+        ).run([1, 2, 3])
+        self.assertEqual(
+            sorted(recorder.events),
+            sorted([('double', n, None) for n in (1, 2, 3)] + [('inc', n, None) for n in (2, 4, 6)]),
+        )
+
+    def test_stages_overlap_across_items(self):
+        """While item 1 post-processes, item 2 must already be transferring."""
+        second_transfer_started = threading.Event()
+        overlapped = []
+
+        def transfer(item):
+            if item == 2:
+                second_transfer_started.set()
+            return item
+
+        def postprocess(item):
+            if item == 1:
+                overlapped.append(second_transfer_started.wait(timeout=2))
+
+        Pipeline([Stage('transfer', transfer), Stage('post', postprocess)]).run([1, 2])
+        self.assertEqual(overlapped, [True])
+
+    def test_bounded_queue_limits_run_ahead(self):
+        lock = threading.Lock()
+        produced = []
+        max_lead = []
+
+        def fast(item):
+            with lock:
+                produced.append(item)
+            return item
+
+        def slow(item):
+            time.sleep(0.01)
+            with lock:
+                max_lead.append(len(produced) - item)
+
+        Pipeline([Stage('fast', fast), Stage('slow', slow, capacity=1)]).run(range(10))
+        # Producer may run ahead by the queue capacity plus the item in hand.
+        self.assertLessEqual(max(max_lead), 3)
+
+    def test_error_ends_item_at_that_stage(self):
+        recorder = _Recorder()
+
+        def fail_on_two(item):
+            if item == 2:
+                raise ValueError('bad item')
+            return item
+
+        Pipeline([Stage('a', fail_on_two), Stage('b', lambda x: None)], on_event=recorder).run([1, 2, 3])
+        errors = [(stage, item) for stage, item, error in recorder.events if error is not None]
+        self.assertEqual(errors, [('a', 2)])
+        self.assertEqual(sorted(item for stage, item, _ in recorder.events if stage == 'b'), [1, 3])
+
+    def test_none_result_skips_later_stages(self):
+        recorder = _Recorder()
+        Pipeline([Stage('a', lambda x: None), Stage('b', lambda x: x)], on_event=recorder).run([1])
+        self.assertEqual(recorder.events, [('a', 1, None)])
+
+    def _peak_per_host(self, items, workers, per_host_limit):
+        lock = threading.Lock()
+        active, peaks = {}, {}
+
+        def work(item):
+            host = item[0]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                active['*'] = active.get('*', 0) + 1
+                for key in (host, '*'):
+                    peaks[key] = max(peaks.get(key, 0), active[key])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+                active['*'] -= 1
+
+        stage = Stage('a', work, workers=workers, host_of=lambda item: item[0], per_host_limit=per_host_limit)
+        Pipeline([stage]).run(items)
+        return peaks
+
+    def test_per_host_cap_is_respected(self):
+        peaks = self._peak_per_host([('youtube', i) for i in range(8)], workers=6, per_host_limit=2)
+        self.assertEqual(peaks['youtube'], 2)
+
+    def test_other_hosts_fill_spare_workers(self):
+        items = [('youtube', i) for i in range(6)] + [('odysee', i) for i in range(6)]
+        peaks = self._peak_per_host(items, workers=4, per_host_limit=2)
+        self.assertEqual(peaks['*'], 4)
+        self.assertLessEqual(peaks['youtube'], 2)
+        self.assertLessEqual(peaks['odysee'], 2)
+
+    def test_should_stop_stops_feeding(self):
+        started = []
+        Pipeline([Stage('a', started.append)], should_stop=lambda: len(started) >= 2).run(iter(range(100)))
+        self.assertLess(len(started), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
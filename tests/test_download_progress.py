@@ -0,0 +1,178 @@
+"""
+Tests for downloader.progress — throttled, structured per-job progress.
+
+Covers:
+- ProgressThrottle: per-key rate limit, final updates always pass
+- progress_snapshot: bytes/total/speed/ETA/fragment numbers and percent
+- describe_progress: one-line summaries
+- BatchProgress: one percent for parallel jobs
+- DownloadEngine.progress_hook: coalesced per job, tagged with the job index
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest.mock import MagicMock
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.engine import DownloadEngine
+from downloader.progress import (
+    JOB_INDEX_KEY,
+    BatchProgress,
+    ProgressThrottle,
+    describe_progress,
+    progress_snapshot,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressThrottle(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.throttle = ProgressThrottle(rate_hz=10, clock=self.clock)
+
+    def test_updates_within_interval_are_dropped(self):
+        self.assertTrue(self.throttle.should_emit(1))
+        self.clock.now = 0.05
+        self.assertFalse(self.throttle.should_emit(1))
+        self.clock.now = 0.1
+        self.assertTrue(self.throttle.should_emit(1))
+
+    def test_keys_are_limited_independently(self):
+        self.assertTrue(self.throttle.should_emit(1))
+        self.assertTrue(self.throttle.should_emit(2))
+        self.assertFalse(self.throttle.should_emit(1))
+
+    def test_final_update_always_passes(self):
+        self.throttle.should_emit(1)
+        self.assertTrue(self.throttle.should_emit(1, final=True))
+
+    def test_zero_rate_disables_throttling(self):
+        throttle = ProgressThrottle(rate_hz=0, clock=self.clock)
+        self.assertTrue(throttle.should_emit(1))
+        self.assertTrue(throttle.should_emit(1))
+
+
+class TestProgressSnapshot(unittest.TestCase):
+    def test_byte_counts_and_rates(self):
+        p = progress_snapshot({
+            'status': 'downloading', 'filename': '/out/a.mp4',
+            'downloaded_bytes': 250, 'total_bytes': 1000, 'speed': 50.0, 'eta': 15,
+        }, 2, 'transfer')
+        self.assertEqual(p['index'], 2)
+        self.assertEqual(p['stage'], 'transfer')
+        self.assertEqual((p['downloaded_bytes'], p['total_bytes'], p['percent']), (250, 1000, 25))
+        self.assertEqual((p['speed'], p['eta']), (50.0, 15))
+
+    def test_estimated_total_is_used(self):
+        p = progress_snapshot(
+            {'status': 'downloading', 'downloaded_bytes': 50, 'total_bytes_estimate': 200.0}, 1, 'transfer',
+        )
+        self.assertEqual((p['total_bytes'], p['percent']), (200, 25))
+
+    def test_fragment_position_gives_percent_without_total(self):
+        p = progress_snapshot({'status': 'downloading', 'fragment_index': 3, 'fragment_count': 12}, 1, 'transfer')
+        self.assertEqual((p['fragment_index'], p['fragment_count'], p['percent']), (3, 12, 25))
+
+    def test_finished_is_complete(self):
+        p = progress_snapshot({'status': 'finished', 'downloaded_bytes': 10}, 1, 'postprocess')
+        self.assertEqual(p['percent'], 100)
+
+    def test_missing_numbers_are_none(self):
+        p = progress_snapshot({'status': 'downloading', 'speed': None}, 1, 'transfer')
+        self.assertEqual((p['downloaded_bytes'], p['total_bytes'], p['speed'], p['eta']), (0, None, None, None))
+
+
+class TestDescribeProgress(unittest.TestCase):
+    def test_full_summary(self):
+        p = progress_snapshot({
+            'status': 'downloading', 'filename': '/out/Song.m4a',
+            'downloaded_bytes': 3 * 1024 * 1024, 'total_bytes': 12 * 1024 * 1024,
+            'speed': 1024 * 1024, 'eta': 75, 'fragment_index': 4, 'fragment_count': 16,
+        }, 1, 'transfer')
+        self.assertEqual(
+            describe_progress(p),
+            'Song.m4a: 3.0 MiB / 12.0 MiB, 1.0 MiB/s, ETA 1:15, fragment 4/16',
+        )
+
+    def test_finished_summary(self):
+        p = progress_snapshot({'status': 'finished', 'filename': '/out/Song.m4a'}, 1, 'transfer')
+        self.assertEqual(describe_progress(p), 'Song.m4a: downloaded')
+
+
+class TestBatchProgress(unittest.TestCase):
+    def _snapshot(self, index, percent):
+        return {'index': index, 'percent': percent}
+
+    def test_parallel_jobs_share_one_bar(self):
+        batch = BatchProgress(4)
+        self.assertEqual(batch.update(self._snapshot(1, 80)), 20)
+        self.assertEqual(batch.update(self._snapshot(2, 40)), 30)
+        self.assertEqual(batch.update(self._snapshot(1, 100)), 35)
+
+    def test_completed_job_counts_in_full(self):
+        batch = BatchProgress(2)
+        batch.update(self._snapshot(1, 100))
+        self.assertEqual(batch.complete(1), 50)
+        # A later file of a completed job does not pull the bar back.
+        self.assertEqual(batch.update(self._snapshot(1, 0)), 50)
+        self.assertEqual(batch.complete(2), 100)
+
+
+class TestEngineProgressHook(unittest.TestCase):
+    def setUp(self):
+        self.updates = []
+        self.engine = DownloadEngine([], '/out', 'video', on_job_progress=self.updates.append)
+        self.clock = FakeClock()
+        self.engine._progress_throttle = ProgressThrottle(10, clock=self.clock)
+
+    def _hook(self, index, status='downloading', **fields):
+        self.engine.progress_hook({'status': status, 'info_dict': {JOB_INDEX_KEY: index}, **fields})
+
+    def test_burst_of_callbacks_is_coalesced_per_job(self):
+        for n in range(100):
+            self._hook(1, downloaded_bytes=n, total_bytes=100)
+            self._hook(2, downloaded_bytes=n, total_bytes=100)
+        self.assertEqual([p['index'] for p in self.updates], [1, 2])
+        self.clock.now = 0.2
+        self._hook(1, downloaded_bytes=100, total_bytes=100)
+        self.assertEqual(self.updates[-1]['downloaded_bytes'], 100)
+
+    def test_finished_update_is_never_dropped(self):
+        self._hook(1, downloaded_bytes=1)
+        self._hook(1, status='finished', downloaded_bytes=2)
+        self.assertEqual([p['status'] for p in self.updates], ['downloading', 'finished'])
+        self.assertEqual(self.updates[-1]['stage'], 'transfer')
+
+    def test_transfer_tags_info_with_job_index(self):
+        tagged = DownloadEngine._tag({'job_id': 7, 'idx': 3}, {'id': 'x'})
+        self.assertEqual(tagged[JOB_INDEX_KEY], 3)
+
+    def test_no_callback_no_work(self):
+        engine = DownloadEngine([], '/out', 'video')
+        engine._progress_throttle = MagicMock()
+        engine.progress_hook({'status': 'downloading'})
+        engine._progress_throttle.should_emit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests for per-host keys and output filename reservation.
+
+Covers:
+- host_key: hostname grouping for per-host limits
+- FilenameReservations: collision-free output stems across workers
+"""
+
+import os
+import sys
+import threading
+import types
+import unittest
+
+# ---- Stub yt_dlp so scheduler tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.scheduler import FilenameReservations, host_key
+
+
+class TestHostKey(unittest.TestCase):
+    def test_youtube_hostnames_share_one_key(self):
+        keys = {
+            host_key('https://www.youtube.com/watch?v=a'),
+            host_key('https://youtu.be/a'),
+            host_key('https://m.youtube.com/watch?v=a'),
+            host_key('https://music.youtube.com/watch?v=a'),
+        }
+        self.assertEqual(keys, {'youtube.com'})
+
+    def test_www_prefix_is_stripped(self):
+        self.assertEqual(host_key('https://www.odysee.com/@c/v'), 'odysee.com')
+
+    def test_distinct_hosts_have_distinct_keys(self):
+        self.assertNotEqual(
+            host_key('https://odysee.com/@c/v'),
+            host_key('https://traffic.libsyn.com/show/ep.mp3'),
+        )
+
+
+class TestFilenameReservations(unittest.TestCase):
+    def test_first_reservation_keeps_stem(self):
+        reservations = FilenameReservations()
+        self.assertEqual(reservations.reserve('/out/Song.webm'), '/out/Song')
+
+    def test_collision_gets_numbered_suffix(self):
+        reservations = FilenameReservations()
+        reservations.reserve('/out/Song.webm')
+        self.assertEqual(reservations.reserve('/out/Song.webm'), '/out/Song (2)')
+        self.assertEqual(reservations.reserve('/out/Song.webm'), '/out/Song (3)')
+
+    def test_different_extension_same_stem_collides(self):
+        """Post-processing can map both to Song.mp3, so the stem is what matters."""
+        reservations = FilenameReservations()
+        reservations.reserve('/out/Song.webm')
+        self.assertEqual(reservations.reserve('/out/Song.m4a'), '/out/Song (2)')
+
+    def test_concurrent_reservations_are_unique(self):
+        reservations = FilenameReservations()
+        results = []
+        lock = threading.Lock()
+
+        def claim():
+            stem = reservations.reserve('/out/Same.mp4')
+            with lock:
+                results.append(stem)
+
+        threads = [threading.Thread(target=claim) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(results)), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
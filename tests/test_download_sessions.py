@@ -0,0 +1,107 @@
+"""
+Tests for the YoutubeDL session pool.
+
+Covers:
+- options_key: stable keys for option dicts containing callables
+- YoutubeDLSessionPool: reuse, exclusivity, eviction, close
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so pool tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.sessions import YoutubeDLSessionPool, options_key
+
+
+class FakeYoutubeDL:
+    def __init__(self, opts):
+        self.params = opts
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestOptionsKey(unittest.TestCase):
+    def test_key_ignores_dict_order(self):
+        self.assertEqual(options_key({'a': 1, 'b': 2}), options_key({'b': 2, 'a': 1}))
+
+    def test_same_callable_gives_same_key(self):
+        hook = print
+        self.assertEqual(
+            options_key({'progress_hooks': [hook]}),
+            options_key({'progress_hooks': [hook]}),
+        )
+
+    def test_different_values_give_different_keys(self):
+        self.assertNotEqual(options_key({'format': 'best'}), options_key({'format': 'worst'}))
+
+
+@patch('downloader.sessions.yt_dlp.YoutubeDL', FakeYoutubeDL)
+class TestYoutubeDLSessionPool(unittest.TestCase):
+    def test_sequential_checkouts_reuse_instance(self):
+        pool = YoutubeDLSessionPool()
+        with pool.session({'format': 'best'}) as first:
+            pass
+        with pool.session({'format': 'best'}) as second:
+            pass
+        self.assertIs(first, second)
+
+    def test_concurrent_checkouts_are_exclusive(self):
+        pool = YoutubeDLSessionPool()
+        with pool.session({'format': 'best'}) as first:
+            with pool.session({'format': 'best'}) as second:
+                self.assertIsNot(first, second)
+
+    def test_different_options_get_different_instances(self):
+        pool = YoutubeDLSessionPool()
+        with pool.session({'format': 'best'}) as first:
+            pass
+        with pool.session({'format': 'bestaudio'}) as second:
+            pass
+        self.assertIsNot(first, second)
+
+    def test_instance_closed_after_exception(self):
+        pool = YoutubeDLSessionPool()
+        with self.assertRaises(RuntimeError):
+            with pool.session({'format': 'best'}) as ydl:
+                raise RuntimeError('download failed')
+        self.assertTrue(ydl.closed)
+        with pool.session({'format': 'best'}) as replacement:
+            self.assertIsNot(replacement, ydl)
+
+    def test_idle_instances_are_bounded(self):
+        pool = YoutubeDLSessionPool(max_idle=1)
+        with pool.session({'n': 1}) as first:
+            pass
+        with pool.session({'n': 2}):
+            pass
+        self.assertTrue(first.closed)
+
+    def test_close_closes_idle_and_late_checkins(self):
+        pool = YoutubeDLSessionPool()
+        with pool.session({'n': 1}) as idle:
+            pass
+        with pool.session({'n': 2}) as busy:
+            pool.close()
+            self.assertTrue(idle.closed)
+            self.assertFalse(busy.closed)
+        self.assertTrue(busy.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
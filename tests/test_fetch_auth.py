@@ -7,6 +7,7 @@ so that tests are runnable without the full downloader stack installed.
 
 import os
 import sys
+import time
 import types
 import unittest
 from unittest.mock import MagicMock, patch
@@ -23,11 +24,11 @@ for _cn in ['QApplication', 'QMainWindow', 'QWidget', 'QVBoxLayout',
             'QHBoxLayout', 'QPushButton', 'QLineEdit', 'QLabel',
             'QComboBox', 'QProgressBar', 'QCheckBox', 'QScrollArea',
             'QGroupBox', 'QMessageBox', 'QFileDialog', 'QSplashScreen',
-            'QGridLayout', 'QDialog']:
+            'QGridLayout', 'QDialog', 'QListView', 'QStyledItemDelegate']:
     setattr(_qtwidgets, _cn, _fake_qt_class(_cn))
 
 _qtcore = types.ModuleType('PyQt5.QtCore')
-for _cn in ['QThread', 'QTimer', 'QSettings']:
+for _cn in ['QThread', 'QTimer', 'QSettings', 'QAbstractListModel', 'QModelIndex', 'QEvent']:
     setattr(_qtcore, _cn, _fake_qt_class(_cn))
 _qtcore.pyqtSignal = lambda *a, **kw: MagicMock()
 _qtcore.Qt = MagicMock()
@@ -55,6 +56,9 @@ sys.modules['yt_dlp.utils'] = _yt_dlp_utils
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import main as _main  # noqa: E402  (must come after stubs)
+from constants import HOST_AUTH_RECHECK_INTERVAL  # noqa: E402
+from settings import load_host_auth, save_host_auth  # noqa: E402
+from threads import URLScraperThread  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -72,9 +76,28 @@ def _make_app_stub(tags, format_text='Video'):
 # build_filename_template
 # ---------------------------------------------------------------------------
 
+class _FakeSettingsStore:
+    """In-memory stand-in for QSettings value()/setValue()."""
+
+    def __init__(self):
+        self.values = {}
+
+    def value(self, key, default=None):
+        return self.values.get(key, default)
+
+    def setValue(self, key, value):
+        self.values[key] = value
+
+
 class TestFetchVideosAuthPolicy(unittest.TestCase):
     """fetch_videos must pass cookies only when the mode or retry requires it."""
 
+    def setUp(self):
+        self.store = _FakeSettingsStore()
+        patcher = patch('settings._settings', return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def _make_app(self, browser_pref='auto'):
         """Return a minimal MediaDownloaderApp-shaped stub."""
         app = _main.MediaDownloaderApp.__new__(_main.MediaDownloaderApp)
@@ -94,15 +117,50 @@ class TestFetchVideosAuthPolicy(unittest.TestCase):
         app.url_input.text.return_value = url
 
         class FakeThread:
-            def __init__(self_t, url, cookies_from_browser=None):
+            def __init__(self_t, url, cookies_from_browser=None, **kwargs):
                 captured['cookies'] = cookies_from_browser
+                captured['kwargs'] = kwargs
 
+            batch = MagicMock()
             finished = MagicMock()
             error = MagicMock()
             start = MagicMock()
 
         with patch('app_mixins.fetch_auth.URLScraperThread', FakeThread):
-            app.fetch_videos()
+            if captured.pop('refresh', False):
+                app.refresh_videos()
+            else:
+                app.fetch_videos()
+
+    # Fetch goes through the app's fetch cache; Refresh bypasses it
+    def test_fetch_uses_cache_and_refresh_bypasses_it(self):
+        app = self._make_app(browser_pref='none')
+        app.fetch_cache = MagicMock()
+        captured = {}
+        self._run_fetch(app, 'https://example.com/playlist', captured)
+        self.assertIs(captured['kwargs']['cache'], app.fetch_cache)
+        self.assertFalse(captured['kwargs']['refresh'])
+
+        app.scraper_thread = None
+        captured = {'refresh': True}
+        self._run_fetch(app, 'https://example.com/playlist', captured)
+        self.assertTrue(captured['kwargs']['refresh'])
+
+    # "New uploads only" hands the sync state to the thread
+    def test_sync_mode_passes_sync_state(self):
+        app = self._make_app(browser_pref='none')
+        app.sync_state = MagicMock()
+        app.sync_checkbox = MagicMock()
+        app.sync_checkbox.isChecked.return_value = True
+        captured = {}
+        self._run_fetch(app, 'https://www.youtube.com/@channel/videos', captured)
+        self.assertIs(captured['kwargs']['sync_state'], app.sync_state)
+
+        app.scraper_thread = None
+        app.sync_checkbox.isChecked.return_value = False
+        captured = {}
+        self._run_fetch(app, 'https://www.youtube.com/@channel/videos', captured)
+        self.assertIsNone(captured['kwargs']['sync_state'])
 
     # Auto mode — first attempt should be cookieless for YouTube
     def test_auto_mode_youtube_first_attempt_is_cookieless(self):
@@ -142,9 +200,10 @@ class TestFetchVideosAuthPolicy(unittest.TestCase):
         app.url_input.text.return_value = 'https://youtube.com@evil.example/watch?v=abc'
 
         class FakeThread:
-            def __init__(self_t, url, cookies_from_browser=None):
+            def __init__(self_t, url, cookies_from_browser=None, **kwargs):
                 captured['cookies'] = cookies_from_browser
 
+            batch = MagicMock()
             finished = MagicMock()
             error = MagicMock()
             start = MagicMock()
@@ -169,9 +228,126 @@ class TestFetchVideosAuthPolicy(unittest.TestCase):
             self._run_fetch(app, 'https://www.youtube.com/watch?v=abc', captured)
             mock_yt_cookies.assert_not_called()
 
+    # A login failure with cookies drops the shared jar so the next fetch reloads it
+    def test_auth_error_reloads_cookies_used(self):
+        app = self._make_app(browser_pref='firefox')
+        app.url_input.text.return_value = 'https://example.com/members'
+        app._fetch_cookies_used = 'firefox'
+        with patch('app_mixins.fetch_auth.shared_cookie_jars') as jars, \
+                patch('app_mixins.fetch_auth._critical_plain'):
+            app.on_fetch_error('ERROR: HTTP Error 404: Not Found')
+            jars.invalidate.assert_not_called()
+            app.on_fetch_error('ERROR: Login required to view this video')
+        jars.invalidate.assert_called_once_with('firefox')
+
     # fetch stores the auth decision for start_download to mirror
     def test_fetch_stores_cookies_used_on_app(self):
         app = self._make_app(browser_pref='brave')
         captured = {}
         self._run_fetch(app, 'https://www.youtube.com/watch?v=abc', captured)
         self.assertEqual(app._fetch_cookies_used, captured['cookies'])
+
+    # A host remembered as needing a login is fetched with that browser first
+    def test_auto_mode_uses_remembered_browser_until_recheck(self):
+        url = 'https://www.youtube.com/watch?v=abc'
+        save_host_auth('youtube.com', browser='brave', auth_at=time.time())
+        app = self._make_app(browser_pref='auto')
+        captured = {}
+        self._run_fetch(app, url, captured)
+        self.assertEqual(captured['cookies'], 'brave')
+
+        save_host_auth('youtube.com', auth_at=time.time() - HOST_AUTH_RECHECK_INTERVAL - 1)
+        app.scraper_thread = None
+        captured = {}
+        self._run_fetch(app, url, captured)
+        self.assertIsNone(captured['cookies'])
+
+    # A failed recheck retries with the remembered browser without prompting
+    def test_failed_recheck_retries_with_remembered_browser(self):
+        url = 'https://www.youtube.com/watch?v=abc'
+        save_host_auth('youtube.com', browser='firefox', auth_at=time.time() - HOST_AUTH_RECHECK_INTERVAL - 1)
+        app = self._make_app(browser_pref='auto')
+        app.url_input.text.return_value = url
+        app._fetch_cookies_used = None
+        app.fetch_videos = MagicMock()
+        with patch('app_mixins.fetch_auth.get_browsers_with_youtube_cookies') as probe, \
+                patch('app_mixins.fetch_auth.QMessageBox') as box:
+            app.on_fetch_error("ERROR: Sign in to confirm you're not a bot")
+        probe.assert_not_called()
+        box.question.assert_not_called()
+        app.fetch_videos.assert_called_once_with(refresh=True, _auth_retry=True, _resume=None)
+        self.assertEqual(app.browser_preference, 'auto')
+        self.assertGreater(load_host_auth('youtube.com')['auth_at'], time.time() - 60)
+
+    # Success records the working browser; a cookieless success forgets the host
+    def test_successful_fetch_updates_host_memory(self):
+        url = 'https://www.youtube.com/watch?v=abc'
+        app = self._make_app(browser_pref='auto')
+        app.scraper_thread = MagicMock(url=url, from_cache=False)
+        app._fetch_cookies_used = 'chrome'
+        app.remember_fetch_auth()
+        self.assertIsNone(load_host_auth('youtube.com'), 'hosts that never asked for a login are not stored')
+
+        save_host_auth('youtube.com', auth_at=time.time())
+        app.remember_fetch_auth()
+        self.assertEqual(load_host_auth('youtube.com')['browser'], 'chrome')
+
+        app._fetch_cookies_used = None
+        app.scraper_thread.from_cache = True
+        app.remember_fetch_auth()
+        self.assertIsNotNone(load_host_auth('youtube.com'))
+        app.scraper_thread.from_cache = False
+        app.remember_fetch_auth()
+        self.assertIsNone(load_host_auth('youtube.com'))
+
+
+def _video(n):
+    return {'id': f'v{n}', 'url': f'https://www.youtube.com/watch?v=v{n}', 'title': f'Video {n}'}
+
+
+class TestFetchResume(unittest.TestCase):
+    """An auth retry continues a part-listed playlist instead of starting over."""
+
+    def test_scraper_continues_after_checkpoint(self):
+        thread = URLScraperThread('https://www.youtube.com/@channel', resume=[_video(1), _video(2)])
+        thread.isInterruptionRequested = lambda: False
+        thread.batch = MagicMock()
+        extractor = MagicMock()
+        # A new upload shifted the listing: v2 comes back once more.
+        extractor.iter_video_batches.return_value = iter([[_video(2), _video(3)], [_video(4)]])
+        with patch('threads.get_extractor', return_value=extractor):
+            videos = thread._extract()
+        self.assertEqual(extractor.iter_video_batches.call_args.kwargs['start'], 2)
+        self.assertEqual([v['id'] for v in videos], ['v1', 'v2', 'v3', 'v4'])
+        self.assertEqual([[v['id'] for v in c.args[0]] for c in thread.batch.emit.call_args_list], [['v3'], ['v4']])
+
+    def test_auth_retry_resumes_from_listed_entries(self):
+        url = 'https://www.youtube.com/@channel/videos'
+        app = _main.MediaDownloaderApp.__new__(_main.MediaDownloaderApp)
+        app.browser_preference = 'auto'
+        app.url_input = MagicMock()
+        app.url_input.text.return_value = url
+        app.status_label = MagicMock()
+        app.scraper_thread = MagicMock(url=url, videos=[_video(1), _video(2)])
+        app.fetch_videos = MagicMock()
+        with patch('app_mixins.fetch_auth.shared_cookie_jars'):
+            app._retry_fetch_with_browser('firefox')
+        app.fetch_videos.assert_called_once_with(refresh=True, _auth_retry=True, _resume=[_video(1), _video(2)])
+
+        app.fetch_videos.reset_mock()
+        app.url_input.text.return_value = 'https://www.youtube.com/@other/videos'
+        with patch('app_mixins.fetch_auth.shared_cookie_jars'):
+            app._retry_fetch_with_browser('firefox')
+        self.assertIsNone(app.fetch_videos.call_args.kwargs['_resume'])
+
+    def test_resumed_fetch_keeps_listed_rows(self):
+        app = _main.MediaDownloaderApp.__new__(_main.MediaDownloaderApp)
+        app.browser_preference = 'firefox'
+        for name in ('url_input', 'status_label', 'fetch_btn', 'download_btn', 'clear_videos_list'):
+            setattr(app, name, MagicMock())
+        app.statusBar = MagicMock(return_value=MagicMock())
+        app.url_input.text.return_value = 'https://example.com/playlist'
+        with patch('app_mixins.fetch_auth.URLScraperThread') as thread:
+            app.fetch_videos(refresh=True, _auth_retry=True, _resume=[_video(1)])
+        app.clear_videos_list.assert_not_called()
+        self.assertEqual(thread.call_args.kwargs['resume'], [_video(1)])
@@ -0,0 +1,175 @@
+"""
+Tests for extractors.fetch_cache — reuse of recent fetch results.
+
+Covers:
+- Keying by URL and cookie browser; TTL expiry; invalidation
+- Persistence to SQLite across instances, with info-cache handles restored
+- FetchCache.fetch: cache hits, refresh bypass, in-flight coalescing, errors not cached
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest.mock import MagicMock
+
+# ---- Stub yt_dlp so the extractors package imports without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractors.fetch_cache import FetchCache, open_fetch_cache
+from extractors.info_cache import InfoCache
+
+URL = 'https://www.youtube.com/@channel/videos'
+VIDEOS = [
+    {'url': 'https://www.youtube.com/watch?v=a', 'title': 'A', 'duration': 10, 'uploader': 'U'},
+    {'url': 'https://www.youtube.com/watch?v=b', 'title': 'B', 'duration': 20, 'uploader': 'U'},
+]
+
+
+class TestFetchCacheStore(unittest.TestCase):
+    def setUp(self):
+        self.info_cache = InfoCache()
+        self.cache = FetchCache(ttl=100, info_cache=self.info_cache)
+
+    def test_miss_then_hit(self):
+        self.assertIsNone(self.cache.get(URL))
+        self.cache.put(URL, None, VIDEOS, now=1000)
+        self.assertEqual(self.cache.get(URL, now=1050), VIDEOS)
+
+    def test_url_whitespace_is_ignored(self):
+        self.cache.put(URL, None, VIDEOS, now=1000)
+        self.assertEqual(self.cache.get(f'  {URL} ', now=1000), VIDEOS)
+
+    def test_keyed_by_cookie_browser(self):
+        self.cache.put(URL, 'firefox', VIDEOS, now=1000)
+        self.assertIsNone(self.cache.get(URL, None, now=1000))
+        self.assertIsNone(self.cache.get(URL, 'chrome', now=1000))
+        self.assertEqual(self.cache.get(URL, 'firefox', now=1000), VIDEOS)
+
+    def test_expires_after_ttl(self):
+        self.cache.put(URL, None, VIDEOS, now=1000)
+        self.assertIsNone(self.cache.get(URL, now=1100))
+
+    def test_invalidate(self):
+        self.cache.put(URL, None, VIDEOS, now=1000)
+        self.cache.invalidate(URL)
+        self.assertIsNone(self.cache.get(URL, now=1000))
+
+    def test_returned_lists_are_copies(self):
+        self.cache.put(URL, None, VIDEOS, now=1000)
+        self.cache.get(URL, now=1000)[0]['title'] = 'changed'
+        self.assertEqual(self.cache.get(URL, now=1000)[0]['title'], 'A')
+
+
+class TestFetchCachePersistence(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, 'fetch.sqlite3')
+
+    def test_survives_reopen_and_restores_handles(self):
+        writer_info = InfoCache()
+        writer_info.remember(VIDEOS[0]['url'], {'ie_key': 'Youtube', 'id': 'a'})
+        writer = FetchCache(self.path, info_cache=writer_info)
+        writer.put(URL, None, VIDEOS)
+        writer.close()
+
+        reader_info = InfoCache()
+        reader = FetchCache(self.path, info_cache=reader_info)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.get(URL), VIDEOS)
+        self.assertEqual(reader_info.handle(VIDEOS[0]['url']), ('Youtube', 'a'))
+        self.assertEqual(reader_info.handle(VIDEOS[1]['url']), (None, None))
+
+    def test_open_falls_back_to_memory_only(self):
+        cache = open_fetch_cache(os.path.join(self._tmp.name, 'missing', 'fetch.sqlite3'))
+        self.assertIsNone(cache._conn)
+        cache.put(URL, None, VIDEOS)
+        self.assertEqual(cache.get(URL), VIDEOS)
+
+
+class TestCoalescedFetch(unittest.TestCase):
+    def setUp(self):
+        self.cache = FetchCache(info_cache=InfoCache())
+
+    def test_second_fetch_is_served_from_cache(self):
+        fetch = MagicMock(return_value=VIDEOS)
+        self.assertEqual(self.cache.fetch(URL, None, fetch), (VIDEOS, False))
+        self.assertEqual(self.cache.fetch(URL, None, fetch), (VIDEOS, True))
+        fetch.assert_called_once()
+
+    def test_refresh_bypasses_and_replaces_entry(self):
+        self.cache.fetch(URL, None, MagicMock(return_value=VIDEOS))
+        fresh = VIDEOS[:1]
+        self.assertEqual(self.cache.fetch(URL, None, MagicMock(return_value=fresh), refresh=True), (fresh, False))
+        self.assertEqual(self.cache.get(URL), fresh)
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaises(RuntimeError):
+            self.cache.fetch(URL, None, MagicMock(side_effect=RuntimeError('boom')))
+        self.assertIsNone(self.cache.get(URL))
+        self.assertEqual(self.cache.fetch(URL, None, MagicMock(return_value=VIDEOS)), (VIDEOS, False))
+
+    def test_concurrent_identical_fetches_run_once(self):
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return VIDEOS
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(self.cache.fetch(URL, None, slow_fetch, refresh=True)))
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=lambda: results.append(self.cache.fetch(URL, None, slow_fetch)))
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([videos for videos, _ in results], [VIDEOS, VIDEOS])
+
+    def test_waiters_share_the_error(self):
+        started, release = threading.Event(), threading.Event()
+
+        def failing_fetch():
+            started.set()
+            release.wait(5)
+            raise RuntimeError('boom')
+
+        errors = []
+
+        def run():
+            try:
+                self.cache.fetch(URL, None, failing_fetch)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        first = threading.Thread(target=run)
+        first.start()
+        started.wait(5)
+        second = threading.Thread(target=run)
+        second.start()
+        release.set()
+        first.join(5)
+        second.join(5)
+        self.assertEqual(errors, ['boom', 'boom'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+"""
+Tests for downloader.fragments.FragmentTuner — adaptive fragment concurrency.
+
+Covers:
+- Ramp-up while throughput improves, settling when it stops improving
+- Back-off on throttling errors and stalls, including transfers gone silent
+- Re-probing after clean downloads, and settled levels expiring on load
+- Learned levels persisted across instances
+- observe(): yt-dlp hook dicts for fragmented and plain downloads
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.fragments import (
+    FRAGMENTS_KEY,
+    INITIAL_CONCURRENCY,
+    MAX_CONCURRENCY,
+    REPROBE_AFTER,
+    SETTLED_TTL,
+    STALL_SECONDS,
+    FragmentTuner,
+    is_fragmented,
+    is_throttling_error,
+    open_fragment_tuner,
+)
+from downloader.progress import JOB_INDEX_KEY
+
+HOST = 'vod.example'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFragmentTuner(unittest.TestCase):
+    def setUp(self):
+        self.tuner = FragmentTuner()
+
+    def _finish(self, rate):
+        self.tuner.report(HOST, self.tuner.concurrency(HOST), rate * 10, 10)
+
+    def test_starts_small(self):
+        self.assertEqual(self.tuner.concurrency(HOST), INITIAL_CONCURRENCY)
+
+    def test_ramps_up_while_throughput_improves(self):
+        self._finish(1000)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        self._finish(1800)
+        self.assertEqual(self.tuner.concurrency(HOST), 8)
+
+    def test_settles_on_best_level_when_gain_stops(self):
+        self._finish(1000)
+        self._finish(1800)
+        self._finish(1850)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        self._finish(5000)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+
+    def test_never_exceeds_ceiling(self):
+        for n in range(10):
+            self._finish(1000 * 2 ** n)
+        self.assertEqual(self.tuner.concurrency(HOST), MAX_CONCURRENCY)
+
+    def test_reports_from_an_older_level_are_ignored(self):
+        self._finish(1000)
+        self.tuner.report(HOST, INITIAL_CONCURRENCY, 1, 10)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+
+    def test_back_off_halves_and_settles(self):
+        self._finish(1000)
+        self.tuner.back_off(HOST)
+        self.assertEqual(self.tuner.concurrency(HOST), 2)
+        self._finish(10_000)
+        self.assertEqual(self.tuner.concurrency(HOST), 2)
+
+    def test_level_recovers_after_throttling(self):
+        self._finish(1000)
+        self._finish(1800)
+        self.assertEqual(self.tuner.concurrency(HOST), 8)
+        self.tuner.back_off(HOST)  # one transient 429
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        for _ in range(REPROBE_AFTER):
+            self._finish(1800)
+        self.assertEqual(self.tuner.concurrency(HOST), 8)  # probing one level up
+        self._finish(3000)
+        self.assertEqual(self.tuner.concurrency(HOST), 8)
+        self._finish(4000)
+        self.assertEqual(self.tuner.concurrency(HOST), 16)
+
+    def test_failed_probe_returns_to_settled_level(self):
+        self._finish(1000)
+        self.tuner.back_off(HOST)
+        for _ in range(REPROBE_AFTER):
+            self._finish(1000)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        self._finish(1050)
+        self.assertEqual(self.tuner.concurrency(HOST), 2)
+        for _ in range(REPROBE_AFTER):
+            self._finish(1000)
+        self.tuner.back_off(HOST)  # throttled while probing
+        self.assertEqual(self.tuner.concurrency(HOST), 2)
+
+    def test_old_back_off_expires_on_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'fragments.json')
+            wall = FakeClock()
+            tuner = FragmentTuner(path, wall_clock=wall)
+            tuner.back_off(HOST)
+            self.assertEqual(tuner.concurrency(HOST), 1)
+            recent = FragmentTuner(path, wall_clock=wall)
+            recent.report(HOST, 1, 1000, 1)
+            self.assertEqual(recent.concurrency(HOST), 1)
+            wall.now = SETTLED_TTL + 1
+            later = FragmentTuner(path, wall_clock=wall)
+            later.report(HOST, 1, 1000, 1)
+            self.assertEqual(later.concurrency(HOST), 2)
+
+    def test_hosts_are_independent(self):
+        self._finish(1000)
+        self.assertEqual(self.tuner.concurrency('other.example'), INITIAL_CONCURRENCY)
+
+    def test_learned_levels_persist(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'fragments.json')
+            tuner = open_fragment_tuner(path)
+            tuner.report(HOST, INITIAL_CONCURRENCY, 1000, 1)
+            self.assertEqual(FragmentTuner(path).concurrency(HOST), 4)
+
+    def test_corrupt_file_starts_fresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'fragments.json')
+            with open(path, 'w') as f:
+                f.write('{broken')
+            self.assertEqual(FragmentTuner(path).concurrency(HOST), INITIAL_CONCURRENCY)
+
+    def test_throttling_errors(self):
+        self.assertTrue(is_throttling_error(Exception('HTTP Error 429: Too Many Requests')))
+        self.assertTrue(is_throttling_error(Exception('HTTP Error 503: Service Unavailable')))
+        self.assertFalse(is_throttling_error(Exception('HTTP Error 403: Forbidden')))
+
+    def test_fragmented_protocols(self):
+        self.assertTrue(is_fragmented({'protocol': 'http_dash_segments+https'}))
+        self.assertTrue(is_fragmented({'protocol': 'm3u8_native'}))
+        self.assertFalse(is_fragmented({'protocol': 'https'}))
+        self.assertFalse(is_fragmented(None))
+
+
+class TestObserve(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tuner = FragmentTuner(clock=self.clock)
+        self.info = {JOB_INDEX_KEY: 1, FRAGMENTS_KEY: INITIAL_CONCURRENCY}
+
+    def _hook(self, status, **fields):
+        self.tuner.observe(HOST, {'status': status, 'filename': '/out/a.mp4', 'info_dict': self.info, **fields})
+
+    def test_finished_fragmented_download_is_reported(self):
+        self._hook('downloading', fragment_index=1, fragment_count=10, downloaded_bytes=100)
+        self._hook('finished', downloaded_bytes=10_000, elapsed=2.0)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        self.assertEqual(self.tuner._transfers, {})
+
+    def test_plain_download_is_not_reported(self):
+        self._hook('downloading', downloaded_bytes=100)
+        self._hook('finished', downloaded_bytes=10_000, elapsed=2.0)
+        self.assertEqual(self.tuner.concurrency(HOST), INITIAL_CONCURRENCY)
+
+    def test_stall_backs_off(self):
+        self.info[FRAGMENTS_KEY] = 8
+        self.tuner._state(HOST)['concurrency'] = 8
+        self._hook('downloading', fragment_index=1, fragment_count=10)
+        self.clock.now = STALL_SECONDS + 1
+        self._hook('downloading', fragment_index=2, fragment_count=10)
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+
+    def test_silent_transfer_is_backed_off_by_stall_check(self):
+        self.info[FRAGMENTS_KEY] = 8
+        self.tuner._state(HOST)['concurrency'] = 8
+        self._hook('downloading', fragment_index=1, fragment_count=10)
+        self.tuner.check_stalls()
+        self.assertEqual(self.tuner.concurrency(HOST), 8)
+        self.clock.now = STALL_SECONDS + 1
+        self.tuner.check_stalls()
+        self.tuner.check_stalls()
+        self.assertEqual(self.tuner.concurrency(HOST), 4)
+        self.assertEqual(self.tuner._transfers, {})
+
+    def test_watching_checks_stalls_until_block_ends(self):
+        checked = threading.Event()
+        with patch.object(self.tuner, 'check_stalls', side_effect=checked.set):
+            with self.tuner.watching(interval=0.01):
+                self.assertTrue(checked.wait(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Tests for single-pass audio post-processing (extractors.fused_audio).
+
+Covers:
+- build_audio_opts: one FusedAudio entry carrying codec, filters and artwork
+- fused_audio_args: mapping, cover art, chapters, filters, codec and tags
+- split_fused_audio / install_fused_audio: entry kept from yt-dlp, postprocessor added
+- YoutubeDLSessionPool installs the fused postprocessor on new sessions
+- FusedAudioPP's FFmpeg arguments for an engine-merged info dict (needs yt-dlp)
+"""
+
+import contextlib
+import importlib
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest.mock import MagicMock, patch
+
+# ---- Stub yt_dlp so extractor tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.engine import _postprocess_info
+from downloader.sessions import YoutubeDLSessionPool
+from extractors.ffmpeg_filters import AUDIO_DENOISE_FILTER, AUDIO_LOUDNORM_FILTER
+from extractors.fused_audio import FUSED_AUDIO_KEY, fused_audio_args, install_fused_audio, split_fused_audio
+from extractors.ytdlp_format_opts import build_audio_opts
+
+
+def _ytdlp_modules():
+    return [name for name in sys.modules if name == 'yt_dlp' or name.startswith('yt_dlp.')]
+
+
+@contextlib.contextmanager
+def _real_ytdlp():
+    """Swap the installed yt-dlp in for the stubs other test modules set up; yield it, or None.
+
+    yt-dlp imports some of its own modules lazily, so the swap lasts as long
+    as the code under test runs.
+    """
+    stubs = {name: sys.modules.pop(name) for name in _ytdlp_modules()}
+    sys.modules.update(_real_ytdlp.modules)
+    try:
+        try:
+            module = importlib.import_module('yt_dlp')
+            importlib.import_module('yt_dlp.postprocessor')
+        except ImportError:
+            module = None
+        yield module
+    finally:
+        _real_ytdlp.modules = {name: sys.modules.pop(name) for name in _ytdlp_modules()}
+        sys.modules.update(stubs)
+
+
+_real_ytdlp.modules = {}
+
+
+class FakeYoutubeDL:
+    def __init__(self, params):
+        self.params = params
+        self.added = []
+
+    def add_post_processor(self, pp, when='post_process'):
+        self.added.append((pp, when))
+
+    def close(self):
+        pass
+
+
+class TestBuildAudioOpts(unittest.TestCase):
+    def test_single_fused_postprocessor(self):
+        opts = build_audio_opts('MP3', '192', embed_thumbnail=True, normalize_audio=True,
+                                denoise_audio=True, dynamic_normalization=False)
+        self.assertEqual(opts['postprocessors'], [{
+            'key': FUSED_AUDIO_KEY,
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+            'filters': [AUDIO_DENOISE_FILTER, AUDIO_LOUDNORM_FILTER],
+            'embed_thumbnail': True,
+        }])
+        self.assertTrue(opts['writethumbnail'])
+        self.assertNotIn('postprocessor_args', opts)
+
+    def test_no_thumbnail_written_without_artwork(self):
+        opts = build_audio_opts('flac', '0', False, False, False, False)
+        self.assertNotIn('writethumbnail', opts)
+        self.assertEqual(opts['postprocessors'][0]['filters'], [])
+
+
+class TestFusedAudioArgs(unittest.TestCase):
+    def test_filters_codec_and_tags_in_one_pass(self):
+        args = fused_audio_args('libmp3lame', ['-b:a', '192k'], ['afftdn', 'loudnorm'],
+                                ['-metadata', 'title=Song'])
+        self.assertEqual(args, ['-map', '0:a', '-af', 'afftdn,loudnorm', '-acodec', 'libmp3lame',
+                                '-b:a', '192k', '-metadata', 'title=Song'])
+
+    def test_cover_art_and_chapters(self):
+        args = fused_audio_args('copy', cover=(1, 'jpg'), chapters_input=2)
+        self.assertEqual(args[:6], ['-map', '0:a', '-map', '1:v', '-c:v', 'copy'])
+        self.assertIn('title=Album cover', args)
+        self.assertEqual(args[args.index('-map_metadata') + 1], '2')
+        self.assertNotIn('-af', args)
+
+    def test_webp_cover_is_reencoded(self):
+        args = fused_audio_args('copy', cover=(1, 'webp'))
+        self.assertEqual(args[args.index('-c:v') + 1], 'png')
+
+    def test_default_encoder_passes_no_codec(self):
+        self.assertEqual(fused_audio_args(None, ['-f', 'wav']), ['-map', '0:a', '-f', 'wav'])
+
+
+class TestInstall(unittest.TestCase):
+    def test_split_removes_fused_entry(self):
+        opts = {'format': 'bestaudio/best', 'postprocessors': [
+            {'key': FUSED_AUDIO_KEY, 'preferredcodec': 'mp3', 'filters': []},
+            {'key': 'FFmpegMetadata'},
+        ]}
+        ydl_opts, specs = split_fused_audio(opts)
+        self.assertEqual(ydl_opts['postprocessors'], [{'key': 'FFmpegMetadata'}])
+        self.assertEqual(specs, [{'preferredcodec': 'mp3', 'filters': []}])
+        self.assertEqual(len(opts['postprocessors']), 2)
+
+    def test_split_leaves_other_opts_untouched(self):
+        opts = {'postprocessors': [{'key': 'FFmpegVideoConvertor'}]}
+        self.assertEqual(split_fused_audio(opts), (opts, []))
+        self.assertEqual(split_fused_audio({}), ({}, []))
+
+    def test_install_adds_postprocessor(self):
+        ydl = FakeYoutubeDL({})
+        fake_module = types.SimpleNamespace(FusedAudioPP=MagicMock(return_value='pp'))
+        with patch('extractors.fused_audio.fused_audio_pp', fake_module):
+            install_fused_audio(ydl, [{'preferredcodec': 'mp3'}])
+        fake_module.FusedAudioPP.assert_called_once_with(ydl, preferredcodec='mp3')
+        self.assertEqual(ydl.added, [('pp', 'post_process')])
+
+    @patch('downloader.sessions.yt_dlp.YoutubeDL', FakeYoutubeDL)
+    def test_session_pool_installs_fused_postprocessor(self):
+        opts = build_audio_opts('mp3', '192', False, False, False, False)
+        fake_module = types.SimpleNamespace(FusedAudioPP=MagicMock(return_value='pp'))
+        pool = YoutubeDLSessionPool()
+        with patch('extractors.fused_audio.fused_audio_pp', fake_module):
+            with pool.session(opts) as ydl:
+                pass
+            with pool.session(opts) as again:
+                pass
+        self.assertIs(again, ydl)
+        self.assertEqual(ydl.params['postprocessors'], [])
+        self.assertEqual(ydl.added, [('pp', 'post_process')])
+
+
+class TestFusedAudioPP(unittest.TestCase):
+    """FusedAudioPP's FFmpeg arguments for a download as yt-dlp and the engine hand it over."""
+
+    def setUp(self):
+        swap = _real_ytdlp()
+        self.yt_dlp = swap.__enter__()
+        self.addCleanup(swap.__exit__, None, None, None)
+        if self.yt_dlp is None:
+            self.skipTest('yt-dlp is not installed')
+        sys.modules.pop('extractors.fused_audio_pp', None)
+        self.addCleanup(sys.modules.pop, 'extractors.fused_audio_pp', None)
+        self.FusedAudioPP = importlib.import_module('extractors.fused_audio_pp').FusedAudioPP
+
+    def _info(self, tmp):
+        audio = os.path.join(tmp, 'Clip.webm')
+        cover = os.path.join(tmp, 'Clip.jpg')
+        with open(audio, 'wb') as f:
+            f.write(b'\x1aE\xdf\xa3')
+        with open(cover, 'wb') as f:
+            f.write(b'\xff\xd8\xff\xe0' + bytes(16))
+        # What process_ie_result returns: the requested download keeps only
+        # the fields that differ from the video's.
+        return {
+            'id': 'abc', 'title': 'Clip', 'artist': 'Band', 'ext': 'webm',
+            'webpage_url': 'https://www.youtube.com/watch?v=abc',
+            'thumbnails': [{'id': '0', 'url': 'https://i.ytimg.com/vi/abc/hq.jpg', 'filepath': cover}],
+            'requested_downloads': [{
+                'format_id': '251', 'filepath': audio, '__files_to_move': {cover: cover},
+                '__postprocessors': [], '__real_download': True,
+            }],
+        }
+
+    def test_ffmpeg_args_carry_tags_and_attached_cover(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            info = self._info(tmp)
+            pp_info = {**_postprocess_info(info, info['requested_downloads'][0]), '__files_to_move': {}}
+            pp = self.FusedAudioPP(self.yt_dlp.YoutubeDL({'quiet': True}), 'mp3', '192', embed_thumbnail=True)
+            pp._info = pp_info
+            audio, cover = pp_info['filepath'], pp_info['thumbnails'][0]['filepath']
+            with patch.object(pp, 'run_ffmpeg_multiple_files') as run:
+                pp.run_ffmpeg(audio, os.path.join(tmp, 'Clip.mp3'), 'libmp3lame', ['-b:a', '192k'])
+
+            inputs, _, args = run.call_args.args
+            self.assertEqual(inputs, [audio, cover])
+            self.assertEqual(args[:4], ['-map', '0:a', '-map', '1:v'])
+            self.assertIn('title=Clip', args)
+            self.assertIn('artist=Band', args)
+            self.assertTrue(pp._cover_attached)
+            self.assertFalse(os.path.exists(cover))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests for extractors.info_cache — reuse of fetch-phase metadata.
+
+Covers:
+- is_info_fresh: signed-URL expiry and TTL fallback
+- InfoCache: full infos vs flat-entry handles, cookie keying, eviction, forget
+"""
+
+import os
+import sys
+import types
+import unittest
+
+# ---- Stub yt_dlp so the extractors package imports without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractors.info_cache import InfoCache, is_info_fresh
+
+NOW = 1_800_000_000
+
+
+def _info(expire=None, **extra):
+    url = 'https://rr1.googlevideo.com/videoplayback?itag=18'
+    if expire is not None:
+        url += f'&expire={expire}'
+    return {'id': 'v', 'extractor_key': 'Youtube', 'formats': [{'url': url}], **extra}
+
+
+class TestIsInfoFresh(unittest.TestCase):
+    def test_signed_urls_with_time_left_are_fresh(self):
+        self.assertTrue(is_info_fresh(_info(expire=NOW + 6 * 3600), stored_at=NOW - 3600, now=NOW))
+
+    def test_signed_urls_about_to_expire_are_stale(self):
+        self.assertFalse(is_info_fresh(_info(expire=NOW + 60), stored_at=NOW, now=NOW))
+
+    def test_unsigned_urls_use_ttl(self):
+        self.assertTrue(is_info_fresh(_info(), stored_at=NOW - 60, now=NOW))
+        self.assertFalse(is_info_fresh(_info(), stored_at=NOW - 3600, now=NOW))
+
+    def test_info_without_formats_is_never_fresh(self):
+        self.assertFalse(is_info_fresh({'id': 'v'}, stored_at=NOW, now=NOW))
+
+
+class TestInfoCache(unittest.TestCase):
+    def test_full_info_round_trip(self):
+        cache = InfoCache()
+        info = _info(expire=NOW + 6 * 3600)
+        cache.remember('https://y/1', info, now=NOW)
+        self.assertIs(cache.lookup('https://y/1', now=NOW), info)
+        self.assertEqual(cache.ie_key('https://y/1'), 'Youtube')
+
+    def test_flat_entry_stores_only_handle(self):
+        cache = InfoCache()
+        cache.remember('https://y/1', {'id': 'v', 'ie_key': 'Youtube', 'url': 'https://y/1'})
+        self.assertIsNone(cache.lookup('https://y/1'))
+        self.assertEqual(cache.ie_key('https://y/1'), 'Youtube')
+
+    def test_lookup_is_keyed_by_cookie_source(self):
+        cache = InfoCache()
+        cache.remember('https://y/1', _info(expire=NOW + 6 * 3600), cookies_from_browser='firefox', now=NOW)
+        self.assertIsNone(cache.lookup('https://y/1', now=NOW))
+        self.assertIsNotNone(cache.lookup('https://y/1', cookies_from_browser='firefox', now=NOW))
+
+    def test_stale_info_is_dropped_on_lookup(self):
+        cache = InfoCache()
+        cache.remember('https://y/1', _info(), now=NOW)
+        self.assertIsNone(cache.lookup('https://y/1', now=NOW + 3600))
+        self.assertIsNone(cache.lookup('https://y/1', now=NOW))
+
+    def test_least_recently_used_info_is_evicted(self):
+        cache = InfoCache(max_infos=2)
+        for n in range(3):
+            cache.remember(f'https://y/{n}', _info(), now=NOW)
+        self.assertIsNone(cache.lookup('https://y/0', now=NOW))
+        self.assertIsNotNone(cache.lookup('https://y/2', now=NOW))
+
+    def test_forget_drops_every_cookie_variant(self):
+        cache = InfoCache()
+        cache.remember('https://y/1', _info(), now=NOW)
+        cache.remember('https://y/1', _info(), cookies_from_browser='chrome', now=NOW)
+        cache.forget('https://y/1')
+        self.assertIsNone(cache.lookup('https://y/1', now=NOW))
+        self.assertIsNone(cache.lookup('https://y/1', cookies_from_browser='chrome', now=NOW))
+
+
+if __name__ == '__main__':
+    unittest.main()
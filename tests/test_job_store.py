@@ -0,0 +1,89 @@
+"""
+Tests for downloader.job_store — the crash-safe SQLite job journal.
+
+Covers:
+- Batch creation with settings snapshot and URL order
+- Pending / unfinished batch queries across state transitions
+- Persistence across reopen (simulated restart)
+- open_job_store fallback when the database cannot be opened
+"""
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.job_store import JobStore, open_job_store
+
+SETTINGS = {'output_path': '/out', 'format_type': 'audio', 'audio_codec': 'mp3'}
+
+
+class TestJobStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, 'jobs.sqlite3')
+        self.store = JobStore(self.db_path)
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_new_batch_is_pending_in_url_order(self):
+        batch_id, job_ids = self.store.create_batch(['u1', 'u2', 'u3'], SETTINGS)
+        self.assertEqual(len(job_ids), 3)
+        self.assertEqual([job['url'] for job in self.store.pending_jobs(batch_id)], ['u1', 'u2', 'u3'])
+
+    def test_finished_jobs_are_not_pending(self):
+        batch_id, (j1, j2, j3) = self.store.create_batch(['u1', 'u2', 'u3'], SETTINGS)
+        self.store.mark_done(j1, '/out/a.mp3')
+        self.store.mark_failed(j2, 'boom')
+        self.store.mark_running(j3, '/out/c.webm')
+        pending = self.store.pending_jobs(batch_id)
+        self.assertEqual([job['id'] for job in pending], [j3])
+        self.assertEqual(pending[0]['output_path'], '/out/c.webm')
+
+    def test_unfinished_batches_survive_reopen(self):
+        batch_id, (j1, _) = self.store.create_batch(['u1', 'u2'], SETTINGS)
+        self.store.mark_running(j1, '/out/a.webm')
+        self.store.record_progress(j1, 4096, 10_000)
+        self.store.close()
+
+        self.store = JobStore(self.db_path)
+        batches = self.store.unfinished_batches()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0]['batch_id'], batch_id)
+        self.assertEqual(batches[0]['settings'], SETTINGS)
+        self.assertEqual(batches[0]['jobs'][0]['bytes_done'], 4096)
+
+    def test_fully_finished_batch_is_not_offered(self):
+        _, (j1,) = self.store.create_batch(['u1'], SETTINGS)
+        self.store.mark_done(j1)
+        self.assertEqual(self.store.unfinished_batches(), [])
+
+    def test_discard_batch_removes_it(self):
+        batch_id, _ = self.store.create_batch(['u1'], SETTINGS)
+        self.store.discard_batch(batch_id)
+        self.assertEqual(self.store.unfinished_batches(), [])
+
+
+class TestOpenJobStore(unittest.TestCase):
+    def test_unopenable_path_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(open_job_store(os.path.join(tmp, 'missing', 'jobs.sqlite3')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for deferred heavy imports (lazy_imports).
+
+Covers:
+- LazyModule: imports on first attribute access, forwards writes and deletes
+- mock.patch through a LazyModule restores the real module's attribute
+- warm_up: background import, import errors swallowed
+- Startup: importing the GUI's non-Qt dependencies does not import yt-dlp
+"""
+
+import os
+import subprocess
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from lazy_imports import LazyModule, warm_up
+
+FAKE_NAME = '_avms_lazy_fake'
+
+
+class TestLazyModule(unittest.TestCase):
+    def setUp(self):
+        module = types.ModuleType(FAKE_NAME)
+        module.value = 1
+        sys.modules[FAKE_NAME] = module
+        self.addCleanup(sys.modules.pop, FAKE_NAME, None)
+        self.module = module
+
+    def test_not_imported_until_used(self):
+        del sys.modules[FAKE_NAME]
+        lazy = LazyModule(FAKE_NAME)
+        self.assertNotIn(FAKE_NAME, sys.modules)
+        sys.modules[FAKE_NAME] = self.module
+        self.assertEqual(lazy.value, 1)
+
+    def test_writes_and_deletes_reach_the_module(self):
+        lazy = LazyModule(FAKE_NAME)
+        lazy.extra = 'x'
+        self.assertEqual(self.module.extra, 'x')
+        del lazy.extra
+        self.assertFalse(hasattr(self.module, 'extra'))
+
+    def test_patch_through_lazy_module(self):
+        holder = types.SimpleNamespace(mod=LazyModule(FAKE_NAME))
+        with patch.object(holder.mod, 'value', 2):
+            self.assertEqual(self.module.value, 2)
+        self.assertEqual(self.module.value, 1)
+
+    def test_missing_module_raises_on_use(self):
+        with self.assertRaises(ImportError):
+            LazyModule('_avms_no_such_module').anything
+
+
+class TestWarmUp(unittest.TestCase):
+    def test_imports_in_background(self):
+        sys.modules.pop('colorsys', None)
+        warm_up('_avms_no_such_module', 'colorsys').join(5)
+        self.assertIn('colorsys', sys.modules)
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_core_packages_do_not_import_ytdlp(self):
+        code = (
+            'import sys, downloader, extractors, lyrics; '
+            "print('yt_dlp' in sys.modules, 'mutagen' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        self.assertEqual(result.stdout.strip(), 'False False')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Tests for lyrics.cache.LyricsCache and its use by fetch_lyrics.
+
+Covers:
+- Key normalisation (case, whitespace, Unicode forms, rounded duration)
+- Separate TTLs for found lyrics and cached misses
+- Least-recently-used eviction past max_entries
+- fetch_lyrics: cached tracks reach no provider; transient failures are not cached
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import urllib.error
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lyrics.cache import LyricsCache, lyrics_key, open_lyrics_cache
+from lyrics.fetcher import _get, _LookupFailed, fetch_lyrics
+
+
+class _CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = LyricsCache(os.path.join(self._tmp.name, 'lyrics.sqlite3'), found_ttl=100, miss_ttl=10)
+        self.addCleanup(self.cache.close)
+
+
+class TestLyricsKey(unittest.TestCase):
+    def test_case_and_whitespace_are_ignored(self):
+        self.assertEqual(lyrics_key('Hello  World ', 'ARTIST'), lyrics_key('hello world', 'artist'))
+
+    def test_unicode_forms_are_folded(self):
+        self.assertEqual(lyrics_key('Café', 'A'), lyrics_key('Café', 'a'))
+
+    def test_duration_is_rounded(self):
+        self.assertEqual(lyrics_key('T', 'A', 'B', 200.4), lyrics_key('T', 'A', 'B', 200))
+        self.assertNotEqual(lyrics_key('T', 'A', 'B', 200), lyrics_key('T', 'A', 'B', 203))
+
+    def test_album_is_part_of_the_key(self):
+        self.assertNotEqual(lyrics_key('T', 'A', 'Live'), lyrics_key('T', 'A', 'Studio'))
+
+
+class TestLyricsCache(_CacheTestCase):
+    def test_unknown_track_returns_none(self):
+        self.assertIsNone(self.cache.get('Track', 'Artist'))
+
+    def test_found_lyrics_round_trip(self):
+        self.cache.put('Track', 'Artist', 'Album', 180, '[00:01.00] Hi\n', 'Hi', now=0)
+        self.assertEqual(self.cache.get('track', 'artist', 'album', 180.2, now=50), ('[00:01.00] Hi\n', 'Hi'))
+
+    def test_miss_is_cached_as_none_pair(self):
+        self.cache.put('Track', 'Artist', now=0)
+        self.assertEqual(self.cache.get('Track', 'Artist', now=5), (None, None))
+
+    def test_miss_expires_before_found_lyrics(self):
+        self.cache.put('Missing', 'Artist', now=0)
+        self.cache.put('Found', 'Artist', plain='Words', now=0)
+        self.assertIsNone(self.cache.get('Missing', 'Artist', now=10))
+        self.assertEqual(self.cache.get('Found', 'Artist', now=10), (None, 'Words'))
+        self.assertIsNone(self.cache.get('Found', 'Artist', now=100))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.max_entries = 2
+        self.cache.put('One', 'A', plain='1', now=1)
+        self.cache.put('Two', 'A', plain='2', now=2)
+        self.cache.get('One', 'A', now=3)
+        self.cache.put('Three', 'A', plain='3', now=4)
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('Two', 'A', now=5))
+        self.assertEqual(self.cache.get('One', 'A', now=5), (None, '1'))
+
+    def test_entries_persist_across_instances(self):
+        self.cache.put('Track', 'Artist', plain='Words')
+        reopened = open_lyrics_cache(self.cache.db_path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get('Track', 'Artist'), (None, 'Words'))
+
+
+class TestFetchLyricsWithCache(_CacheTestCase):
+    def test_cached_lyrics_skip_every_provider(self):
+        self.cache.put('Track', 'Artist', plain='Words')
+        with patch('lyrics.fetcher._fetch_lrclib') as lrclib, patch('lyrics.fetcher._fetch_syncedlyrics') as fallback:
+            self.assertEqual(fetch_lyrics('Track', 'Artist', cache=self.cache), (None, 'Words'))
+        lrclib.assert_not_called()
+        fallback.assert_not_called()
+
+    def test_miss_is_remembered(self):
+        with patch('lyrics.fetcher._fetch_lrclib', return_value=(None, None)) as lrclib, \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=(None, None)) as fallback:
+            fetch_lyrics('Track', 'Artist', cache=self.cache)
+            self.assertEqual(fetch_lyrics('Track', 'Artist', cache=self.cache), (None, None))
+        self.assertEqual(lrclib.call_count, 1)
+        self.assertEqual(fallback.call_count, 1)
+
+    def test_fallback_result_is_cached(self):
+        with patch('lyrics.fetcher._fetch_lrclib', return_value=(None, None)), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=(None, 'Plain')):
+            fetch_lyrics('Track', 'Artist', cache=self.cache)
+        self.assertEqual(self.cache.get('Track', 'Artist'), (None, 'Plain'))
+
+    def test_transient_failure_is_not_cached(self):
+        with patch('lyrics.fetcher._fetch_lrclib', side_effect=_LookupFailed('timed out')), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=(None, None)):
+            self.assertEqual(fetch_lyrics('Track', 'Artist', cache=self.cache), (None, None))
+        self.assertIsNone(self.cache.get('Track', 'Artist'))
+
+
+class TestLrclibGet(unittest.TestCase):
+    def _http_error(self, code):
+        return urllib.error.HTTPError('https://lrclib.net/api/get', code, 'error', {}, None)
+
+    def test_not_found_is_a_definitive_miss(self):
+        with patch('urllib.request.urlopen', side_effect=self._http_error(404)):
+            self.assertIsNone(_get('/get', {}))
+
+    def test_server_error_raises_lookup_failed(self):
+        with patch('urllib.request.urlopen', side_effect=self._http_error(503)):
+            with self.assertRaises(_LookupFailed):
+                _get('/get', {})
+
+    def test_network_error_raises_lookup_failed(self):
+        with patch('urllib.request.urlopen', side_effect=urllib.error.URLError('offline')):
+            with self.assertRaises(_LookupFailed):
+                _get('/get', {})
+
+
+if __name__ == '__main__':
+    unittest.main()
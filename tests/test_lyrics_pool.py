@@ -0,0 +1,91 @@
+"""
+Tests for downloader.lyrics_step.LyricsPool — background lyrics work.
+
+Covers:
+- submit() returns immediately; wait() blocks until jobs finish
+- Failures are collected, never raised
+- wait(cancel=True) drops jobs that have not started
+- Every job is handed the pool's lyrics cache
+"""
+
+import os
+import sys
+import threading
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so the downloader package imports without yt-dlp installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from downloader.lyrics_step import LyricsPool
+
+
+class TestLyricsPool(unittest.TestCase):
+    def test_submit_does_not_block_and_wait_does(self):
+        release = threading.Event()
+        done = []
+
+        def slow(info, path, save_lrc, cache=None):
+            release.wait(timeout=2)
+            done.append(path)
+
+        pool = LyricsPool(max_workers=2)
+        with patch('downloader.lyrics_step.handle_lyrics', side_effect=slow):
+            pool.submit({}, '/out/a.mp3')
+            pool.submit({}, '/out/b.mp3')
+            self.assertEqual(done, [])
+            self.assertEqual(pool.pending(), 2)
+            release.set()
+            pool.wait()
+        self.assertEqual(sorted(done), ['/out/a.mp3', '/out/b.mp3'])
+
+    def test_failures_are_collected(self):
+        pool = LyricsPool()
+        with patch('downloader.lyrics_step.handle_lyrics', side_effect=OSError('tag write failed')):
+            pool.submit({}, '/out/a.mp3')
+            pool.wait()
+        self.assertEqual(pool.errors, [('/out/a.mp3', 'tag write failed')])
+
+    def test_cancel_drops_unstarted_jobs(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def blocking(info, path, save_lrc, cache=None):
+            calls.append(path)
+            started.set()
+            release.wait(timeout=2)
+
+        pool = LyricsPool(max_workers=1)
+        with patch('downloader.lyrics_step.handle_lyrics', side_effect=blocking):
+            pool.submit({}, '/out/a.mp3')
+            pool.submit({}, '/out/b.mp3')
+            started.wait(timeout=2)
+            threading.Timer(0.05, release.set).start()
+            pool.wait(cancel=True)
+        self.assertEqual(calls, ['/out/a.mp3'])
+
+    def test_jobs_share_the_pool_cache(self):
+        cache = object()
+        pool = LyricsPool(cache=cache)
+        with patch('downloader.lyrics_step.handle_lyrics') as handle:
+            pool.submit({}, '/out/a.mp3')
+            pool.wait()
+        handle.assert_called_once_with({}, '/out/a.mp3', False, cache=cache)
+
+    def test_wait_without_jobs_is_a_no_op(self):
+        LyricsPool().wait()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for lyrics.race.race_lookups and fetch_lyrics(race=True).
+
+Covers:
+- Priority: synced from an earlier source > synced from a later one > plain
+- The race ends as soon as nothing still running can win
+- One overall deadline bounds the whole lookup
+- Definitive misses vs. failed or unfinished authoritative lookups
+- Abandoned lookups never block interpreter exit (daemon threads)
+- Sequential lookup: a failed LRCLIB /get still falls back to /search
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lyrics.fetcher import _LookupFailed, fetch_lyrics
+from lyrics.race import Lookup, race_lookups
+
+SYNCED = '[00:01.00] Hello\n'
+
+
+def _after(seconds, result, release=None):
+    def run():
+        if release is not None:
+            release.wait(timeout=seconds)
+        else:
+            time.sleep(seconds)
+        return result
+    return run
+
+
+class TestRaceLookups(unittest.TestCase):
+    def test_synced_beats_plain_from_higher_priority_source(self):
+        synced, plain, _ = race_lookups([
+            Lookup(lambda: (None, 'plain first'), authoritative=True),
+            Lookup(lambda: (SYNCED, 'Hello')),
+        ], deadline=2)
+        self.assertEqual((synced, plain), (SYNCED, 'Hello'))
+
+    def test_earlier_source_wins_between_synced_results(self):
+        synced, _, _ = race_lookups([
+            Lookup(_after(0.05, ('[00:01.00] lrclib\n', None))),
+            Lookup(lambda: ('[00:01.00] other\n', None)),
+        ], deadline=2)
+        self.assertEqual(synced, '[00:01.00] lrclib\n')
+
+    def test_top_result_ends_race_without_waiting_for_losers(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        started = time.monotonic()
+        synced, _, _ = race_lookups([
+            Lookup(lambda: (SYNCED, None), authoritative=True),
+            Lookup(_after(5, (None, 'slow plain'), release)),
+        ], deadline=5)
+        self.assertEqual(synced, SYNCED)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_deadline_bounds_total_latency(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        started = time.monotonic()
+        synced, plain, definitive = race_lookups([
+            Lookup(_after(5, (SYNCED, None), release), authoritative=True),
+            Lookup(_after(5, (SYNCED, None), release)),
+        ], deadline=0.1)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual((synced, plain), (None, None))
+        self.assertFalse(definitive)
+
+    def test_plain_result_returned_at_deadline(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        _, plain, _ = race_lookups([
+            Lookup(_after(5, (SYNCED, None), release)),
+            Lookup(lambda: (None, 'plain')),
+        ], deadline=0.1)
+        self.assertEqual(plain, 'plain')
+
+    def test_miss_from_every_authoritative_source_is_definitive(self):
+        _, _, definitive = race_lookups([
+            Lookup(lambda: (None, None), authoritative=True),
+            Lookup(lambda: (None, None)),
+        ], deadline=2)
+        self.assertTrue(definitive)
+
+    def test_failed_authoritative_lookup_is_not_definitive(self):
+        def fail():
+            raise _LookupFailed('offline')
+
+        synced, plain, definitive = race_lookups([
+            Lookup(fail, authoritative=True),
+            Lookup(lambda: (None, None)),
+        ], deadline=2)
+        self.assertEqual((synced, plain), (None, None))
+        self.assertFalse(definitive)
+
+
+class TestFetchLyricsRace(unittest.TestCase):
+    def test_all_sources_are_queried_concurrently(self):
+        barrier = threading.Barrier(6, timeout=2)
+
+        def provider_lookup(track, artist, providers):
+            barrier.wait()
+            return (None, 'plain') if providers == ['NetEase'] else (None, None)
+
+        def lrclib(*args):
+            barrier.wait()
+            return None
+
+        with patch('lyrics.fetcher._lrclib_get', side_effect=lrclib), \
+                patch('lyrics.fetcher._lrclib_search', side_effect=lrclib), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', side_effect=provider_lookup):
+            self.assertEqual(fetch_lyrics('Track', 'Artist', 'Album', 200, race=True), (None, 'plain'))
+
+    def test_synced_lrclib_result_wins(self):
+        with patch('lyrics.fetcher._lrclib_search', return_value={'syncedLyrics': SYNCED, 'plainLyrics': 'Hello'}), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=('[00:02.00] other\n', 'other')):
+            self.assertEqual(fetch_lyrics('Track', 'Artist', race=True), (SYNCED, 'Hello'))
+
+    def test_abandoned_lookups_run_on_daemon_threads(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        daemons = []
+
+        def slow():
+            daemons.append(threading.current_thread().daemon)
+            release.wait(timeout=5)
+            return None, None
+
+        self.assertEqual(race_lookups([Lookup(slow)], 0.05), (None, None, True))
+        self.assertEqual(daemons, [True])
+
+    def test_get_is_skipped_without_album_and_duration(self):
+        with patch('lyrics.fetcher._lrclib_get') as get, \
+                patch('lyrics.fetcher._lrclib_search', return_value=None), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=(None, None)):
+            fetch_lyrics('Track', 'Artist', race=True)
+        get.assert_not_called()
+
+
+class TestFetchLyricsSequential(unittest.TestCase):
+    def test_failed_get_falls_back_to_search(self):
+        with patch('lyrics.fetcher._lrclib_get', side_effect=_LookupFailed('timed out')), \
+                patch('lyrics.fetcher._lrclib_search', return_value={'syncedLyrics': SYNCED, 'plainLyrics': 'Hello'}), \
+                patch('lyrics.fetcher._fetch_syncedlyrics') as providers:
+            self.assertEqual(fetch_lyrics('Track', 'Artist', 'Album', 200), (SYNCED, 'Hello'))
+        providers.assert_not_called()
+
+    def test_failed_get_and_search_miss_is_not_definitive(self):
+        cache = MagicMock()
+        cache.get.return_value = None
+        with patch('lyrics.fetcher._lrclib_get', side_effect=_LookupFailed('timed out')), \
+                patch('lyrics.fetcher._lrclib_search', return_value=None), \
+                patch('lyrics.fetcher._fetch_syncedlyrics', return_value=(None, None)):
+            self.assertEqual(fetch_lyrics('Track', 'Artist', 'Album', 200, cache=cache), (None, None))
+        cache.put.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
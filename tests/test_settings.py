@@ -20,12 +20,25 @@ sys.modules['PyQt5.QtCore'] = _qtcore
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from settings import (
+    forget_host_auth,
+    load_bandwidth_host_limits,
+    load_bandwidth_limit_kib,
+    load_bandwidth_schedule,
     load_browser_preference,
+    load_host_auth,
+    load_max_parallel_downloads,
     load_output_path,
+    load_per_host_limit,
     load_theme,
+    load_use_download_archive,
+    save_bandwidth_limit_kib,
     save_browser_preference,
+    save_host_auth,
+    save_max_parallel_downloads,
     save_output_path,
+    save_per_host_limit,
     save_theme,
+    save_use_download_archive,
 )
 
 
@@ -72,6 +85,91 @@ class TestSettings(unittest.TestCase):
         save_output_path('/tmp/downloads')
         self.mock_settings.setValue.assert_called_with('output_path', '/tmp/downloads')
 
+    def test_load_max_parallel_downloads_from_string(self):
+        self.mock_settings.value.return_value = '4'
+        self.assertEqual(load_max_parallel_downloads(), 4)
+
+    def test_load_max_parallel_downloads_out_of_range_falls_back(self):
+        self.mock_settings.value.return_value = 99
+        self.assertEqual(load_max_parallel_downloads(), 3)
+
+    def test_load_per_host_limit_garbage_falls_back(self):
+        self.mock_settings.value.return_value = 'lots'
+        self.assertEqual(load_per_host_limit(), 2)
+
+    def test_save_max_parallel_downloads(self):
+        save_max_parallel_downloads(5)
+        self.mock_settings.setValue.assert_called_with('max_parallel_downloads', 5)
+
+    def test_save_per_host_limit_invalid_ignored(self):
+        save_per_host_limit(0)
+        self.mock_settings.setValue.assert_not_called()
+
+    def test_load_use_download_archive_from_string(self):
+        self.mock_settings.value.return_value = 'false'
+        self.assertFalse(load_use_download_archive())
+        self.mock_settings.value.return_value = 'true'
+        self.assertTrue(load_use_download_archive())
+
+    def test_save_use_download_archive(self):
+        save_use_download_archive(False)
+        self.mock_settings.setValue.assert_called_with('use_download_archive', False)
+
+    def test_load_bandwidth_limit_rejects_unknown_values(self):
+        self.mock_settings.value.return_value = '1024'
+        self.assertEqual(load_bandwidth_limit_kib(), 1024)
+        self.mock_settings.value.return_value = '1000'
+        self.assertEqual(load_bandwidth_limit_kib(), 0)
+
+    def test_save_bandwidth_limit(self):
+        save_bandwidth_limit_kib(512)
+        self.mock_settings.setValue.assert_called_with('bandwidth_limit_kib', 512)
+        self.mock_settings.setValue.reset_mock()
+        save_bandwidth_limit_kib(3)
+        self.mock_settings.setValue.assert_not_called()
+
+    def test_load_bandwidth_host_limits_converts_to_bytes(self):
+        self.mock_settings.value.return_value = '{"YouTube.com": 2, "cdn.example": -1, "bad": "x"}'
+        self.assertEqual(load_bandwidth_host_limits(), {'youtube.com': 2048})
+
+    def test_load_bandwidth_host_limits_invalid_json(self):
+        self.mock_settings.value.return_value = '{not json'
+        self.assertEqual(load_bandwidth_host_limits(), {})
+
+    def test_load_bandwidth_schedule(self):
+        self.mock_settings.value.return_value = (
+            '[{"start": "09:00", "end": "18:00", "limit_kib": 512}, {"start": "22:00", "end": "06:00"}, 7]'
+        )
+        self.assertEqual(load_bandwidth_schedule(), [
+            {'start': '09:00', 'end': '18:00', 'limit': 512 * 1024},
+            {'start': '22:00', 'end': '06:00', 'limit': 0},
+        ])
+
+
+    def test_load_host_auth_validates_entries(self):
+        self.mock_settings.value.return_value = (
+            '{"a.example": {"browser": "brave", "auth_at": 5}, "b.example": {"browser": "evil", "auth_at": 5},'
+            ' "c.example": {"browser": "firefox"}}'
+        )
+        self.assertEqual(load_host_auth('a.example'), {'browser': 'brave', 'auth_at': 5.0})
+        self.assertEqual(load_host_auth('b.example'), {'browser': None, 'auth_at': 5.0})
+        self.assertIsNone(load_host_auth('c.example'))
+        self.assertIsNone(load_host_auth('missing.example'))
+
+    def test_save_host_auth_keeps_unchanged_fields(self):
+        self.mock_settings.value.return_value = '{"a.example": {"browser": "brave", "auth_at": 5}}'
+        save_host_auth('a.example', auth_at=9)
+        self.mock_settings.setValue.assert_called_with(
+            'host_auth', '{"a.example": {"auth_at": 9, "browser": "brave"}}'
+        )
+
+    def test_forget_host_auth(self):
+        self.mock_settings.value.return_value = '{"a.example": {"browser": "brave", "auth_at": 5}}'
+        forget_host_auth('b.example')
+        self.mock_settings.setValue.assert_not_called()
+        forget_host_auth('a.example')
+        self.mock_settings.setValue.assert_called_with('host_auth', '{}')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,165 @@
+"""
+Tests for streaming fetches (BaseExtractor.iter_video_batches).
+
+Covers:
+- Playlist entries are read lazily and yielded in batches before paging finishes
+- URL results are followed for 'in_playlist' extraction and kept flat otherwise
+- Single videos, non-flat extractors and errors
+- start: a resumed fetch skips the entries already listed
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+# ---- Stub yt_dlp so extractor tests run without the downloader installed ----
+if 'yt_dlp' not in sys.modules:
+    _yt_dlp = types.ModuleType('yt_dlp')
+    _yt_dlp.YoutubeDL = type('YoutubeDL', (object,), {'__init__': lambda self, *a, **kw: None})
+    _yt_dlp_utils = types.ModuleType('yt_dlp.utils')
+    _yt_dlp_utils.DownloadError = Exception
+    _yt_dlp.utils = _yt_dlp_utils
+    sys.modules['yt_dlp'] = _yt_dlp
+    sys.modules['yt_dlp.utils'] = _yt_dlp_utils
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractors.generic import GenericExtractor
+from extractors.rss import RSSExtractor
+from extractors.youtube_ytdlp import YouTubeExtractor
+
+
+def _entry(n):
+    return {'_type': 'url', 'ie_key': 'Youtube', 'id': f'v{n}', 'url': f'https://www.youtube.com/watch?v=v{n}',
+            'title': f'Video {n}', 'duration': n}
+
+
+class _PlaylistEntries:
+    def __init__(self, ydl, info):
+        self.ydl = ydl
+        self.info = info
+
+    def get_requested_items(self):
+        start = self.ydl.params.get('playliststart', 1)
+        for i, entry in enumerate(self.info['entries'], 1):
+            if i >= start:
+                yield i, entry
+
+
+def _fake_yt_dlp(results):
+    """Return a yt_dlp stand-in whose extract_info serves *results* by URL."""
+    calls = []
+
+    class FakeYoutubeDL:
+        def __init__(self, params):
+            self.params = params
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def extract_info(self, url, download=True, ie_key=None, process=True):
+            calls.append((url, process))
+            result = results[url]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        def process_ie_result(self, info, download=True):
+            return dict(info, processed=True)
+
+    download_error = type('DownloadError', (Exception,), {})
+    utils = types.SimpleNamespace(PlaylistEntries=_PlaylistEntries, DownloadError=download_error)
+    module = types.SimpleNamespace(YoutubeDL=FakeYoutubeDL, utils=utils)
+    return module, calls
+
+
+class TestIterVideoBatches(unittest.TestCase):
+    def _run(self, extractor, results, batch_size=2):
+        fake, calls = _fake_yt_dlp(results)
+        with patch('extractors.base.yt_dlp', fake), patch('extractors.youtube_ytdlp.yt_dlp', fake):
+            return list(extractor.iter_video_batches(batch_size)), calls
+
+    def test_entries_arrive_in_batches_before_paging_finishes(self):
+        pulled = []
+
+        def pages():
+            for n in range(1, 6):
+                pulled.append(n)
+                yield _entry(n)
+
+        url = 'https://www.youtube.com/playlist?list=PL1'
+        fake, _ = _fake_yt_dlp({url: {'_type': 'playlist', 'entries': pages()}})
+        with patch('extractors.base.yt_dlp', fake):
+            batches = YouTubeExtractor(url).iter_video_batches(2)
+            first = next(batches)
+            self.assertEqual([v['title'] for v in first], ['Video 1', 'Video 2'])
+            self.assertEqual(pulled, [1, 2])
+            rest = list(batches)
+        self.assertEqual([len(b) for b in rest], [2, 1])
+
+    def test_playlist_is_not_processed(self):
+        url = 'https://www.youtube.com/playlist?list=PL1'
+        _, calls = self._run(YouTubeExtractor(url), {url: {'_type': 'playlist', 'entries': [_entry(1)]}})
+        self.assertEqual(calls, [(url, False)])
+
+    def test_none_entries_are_skipped(self):
+        url = 'https://www.youtube.com/playlist?list=PL1'
+        batches, _ = self._run(YouTubeExtractor(url), {url: {'_type': 'playlist', 'entries': [None, _entry(1)]}})
+        self.assertEqual([[v['title'] for v in b] for b in batches], [['Video 1']])
+
+    def test_in_playlist_follows_url_results(self):
+        url = 'https://www.youtube.com/@channel'
+        tab = 'https://www.youtube.com/@channel/videos'
+        results = {
+            url: {'_type': 'url', 'url': tab, 'ie_key': 'YoutubeTab'},
+            tab: {'_type': 'playlist', 'entries': [_entry(1), _entry(2), _entry(3)]},
+        }
+        batches, calls = self._run(YouTubeExtractor(url), results)
+        self.assertEqual(calls, [(url, False), (tab, False)])
+        self.assertEqual(sum(len(b) for b in batches), 3)
+
+    def test_flat_extraction_keeps_url_result_as_single_video(self):
+        url = 'https://example.com/page'
+        results = {url: {'_type': 'url', 'url': 'https://example.com/other', 'title': 'Other'}}
+        batches, calls = self._run(GenericExtractor(url), results)
+        self.assertEqual(calls, [(url, False)])
+        self.assertEqual([v['title'] for v in batches[0]], ['Other'])
+
+    def test_single_video_is_processed(self):
+        url = 'https://www.youtube.com/watch?v=abc'
+        batches, _ = self._run(YouTubeExtractor(url), {url: {'id': 'abc', 'title': 'One', 'webpage_url': url}})
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0]['title'], 'One')
+
+    def test_non_flat_extractor_yields_one_batch(self):
+        extractor = RSSExtractor('https://example.com/feed.rss')
+        with patch.object(RSSExtractor, 'extract_info', return_value=[{'url': 'u'}]) as extract:
+            self.assertEqual(list(extractor.iter_video_batches(2)), [[{'url': 'u'}]])
+        extract.assert_called_once()
+
+    def test_start_skips_listed_entries(self):
+        url = 'https://www.youtube.com/playlist?list=PL1'
+        fake, _ = _fake_yt_dlp({url: {'_type': 'playlist', 'entries': [_entry(n) for n in range(1, 6)]}})
+        with patch('extractors.base.yt_dlp', fake):
+            batches = list(YouTubeExtractor(url).iter_video_batches(2, start=3))
+        self.assertEqual([[v['title'] for v in b] for b in batches], [['Video 4', 'Video 5']])
+
+        extractor = RSSExtractor('https://example.com/feed.rss')
+        with patch.object(RSSExtractor, 'extract_info', return_value=[{'url': 'a'}, {'url': 'b'}]):
+            self.assertEqual(list(extractor.iter_video_batches(2, start=1)), [[{'url': 'b'}]])
+
+    def test_errors_use_extractor_message(self):
+        url = 'https://www.youtube.com/playlist?list=PL1'
+        fake, _ = _fake_yt_dlp({url: RuntimeError('boom')})
+        with patch('extractors.base.yt_dlp', fake), patch('extractors.youtube_ytdlp.yt_dlp', fake):
+            with self.assertRaisesRegex(Exception, 'Failed to extract YouTube info: boom'):
+                list(YouTubeExtractor(url).iter_video_batches(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
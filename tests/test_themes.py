@@ -23,11 +23,11 @@ for _cn in ['QApplication', 'QMainWindow', 'QWidget', 'QVBoxLayout',
             'QHBoxLayout', 'QPushButton', 'QLineEdit', 'QLabel',
             'QComboBox', 'QProgressBar', 'QCheckBox', 'QScrollArea',
             'QGroupBox', 'QMessageBox', 'QFileDialog', 'QSplashScreen',
-            'QGridLayout', 'QDialog']:
+            'QGridLayout', 'QDialog', 'QListView', 'QStyledItemDelegate']:
     setattr(_qtwidgets, _cn, _fake_qt_class(_cn))
 
 _qtcore = types.ModuleType('PyQt5.QtCore')
-for _cn in ['QThread', 'QTimer', 'QSettings']:
+for _cn in ['QThread', 'QTimer', 'QSettings', 'QAbstractListModel', 'QModelIndex', 'QEvent']:
     setattr(_qtcore, _cn, _fake_qt_class(_cn))
 _qtcore.pyqtSignal = lambda *a, **kw: MagicMock()
 _qtcore.Qt = MagicMock()
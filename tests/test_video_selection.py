@@ -0,0 +1,98 @@
+"""
+Tests for video_selection — storage behind the virtualized video list.
+
+Covers:
+- Row text: archived marker, uploader and duration formatting
+- Check states: new rows checked, archived rows unchecked, per-row toggles
+- Select all / none as constant-time resets, including rows appended afterwards
+- checked_videos order and checked_count
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from video_selection import VideoSelection, format_duration, format_video_row
+
+
+def _videos(count, start=0):
+    return [{'url': f'https://example.com/{n}', 'title': f'Video {n}', 'uploader': 'U', 'duration': n}
+            for n in range(start, start + count)]
+
+
+class TestFormatting(unittest.TestCase):
+    def test_duration(self):
+        self.assertEqual(format_duration(3725), '01:02:05')
+        self.assertEqual(format_duration(61.7), '00:01:01')
+        self.assertEqual(format_duration(0), 'N/A')
+        self.assertEqual(format_duration(None), 'N/A')
+
+    def test_row_text(self):
+        video = {'title': 'Song', 'uploader': 'Artist', 'duration': 90}
+        self.assertEqual(format_video_row(video), 'Song\nUploader: Artist | Duration: 00:01:30')
+
+    def test_archived_row_is_marked(self):
+        text = format_video_row({'title': 'Song'}, archived=True)
+        self.assertIn('Song (already downloaded)', text)
+        self.assertIn('Uploader: Unknown | Duration: N/A', text)
+
+
+class TestVideoSelection(unittest.TestCase):
+    def setUp(self):
+        self.selection = VideoSelection()
+
+    def test_new_rows_are_checked_and_archived_rows_are_not(self):
+        self.selection.append(_videos(3), archived=[False, True, False])
+        self.assertEqual([self.selection.is_checked(row) for row in range(3)], [True, False, True])
+        self.assertTrue(self.selection.is_archived(1))
+        self.assertEqual(self.selection.archived_count, 1)
+        self.assertEqual(self.selection.checked_count, 2)
+
+    def test_toggle_single_rows(self):
+        self.selection.append(_videos(3))
+        self.selection.set_checked(0, False)
+        self.selection.set_checked(0, True)
+        self.selection.set_checked(2, False)
+        self.assertEqual([v['title'] for v in self.selection.checked_videos()], ['Video 0', 'Video 1'])
+
+    def test_select_none_then_pick_rows(self):
+        self.selection.append(_videos(5))
+        self.selection.set_all(False)
+        self.assertEqual(self.selection.checked_count, 0)
+        self.selection.set_checked(3, True)
+        self.selection.set_checked(1, True)
+        self.assertEqual([v['title'] for v in self.selection.checked_videos()], ['Video 1', 'Video 3'])
+
+    def test_select_all_checks_archived_rows(self):
+        self.selection.append(_videos(2), archived=[True, True])
+        self.selection.set_all(True)
+        self.assertEqual(self.selection.checked_count, 2)
+
+    def test_select_all_does_not_touch_rows(self):
+        self.selection.append(_videos(50_000))
+        for row in range(0, 50_000, 2):
+            self.selection.set_checked(row, False)
+        self.selection.set_all(True)
+        self.assertEqual(len(self.selection._flipped), 0)
+        self.assertEqual(self.selection.checked_count, 50_000)
+
+    def test_rows_appended_after_select_none_start_checked(self):
+        self.selection.append(_videos(2))
+        self.selection.set_all(False)
+        self.selection.append(_videos(2, start=2), archived=[False, True])
+        self.assertEqual([self.selection.is_checked(row) for row in range(4)], [False, False, True, False])
+
+    def test_clear(self):
+        self.selection.append(_videos(2), archived=[True, False])
+        self.selection.set_all(False)
+        self.selection.clear()
+        self.assertEqual(len(self.selection), 0)
+        self.assertEqual(self.selection.archived_count, 0)
+        self.selection.append(_videos(1))
+        self.assertTrue(self.selection.is_checked(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,40 +1,65 @@
 """Background worker threads for metadata fetching and downloads."""
 
-import os
-from pathlib import Path
-
-import yt_dlp
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from extractors import get_extractor
-from lyrics import embed_lyrics, fetch_lyrics, is_music_track, save_lrc_file
+from constants import (
+    DEFAULT_MAX_PARALLEL_DOWNLOADS,
+    DEFAULT_PER_HOST_DOWNLOADS,
+    DEFAULT_PROGRESS_RATE_HZ,
+    FETCH_BATCH_SIZE,
+)
+from downloader import DownloadEngine
+from extractors import get_extractor, video_id
+
+
+class _FetchInterrupted(Exception):
+    """Raised inside a fetch that was stopped part-way, so the partial list is never cached."""
 
 
 class URLScraperThread(QThread):
-    """Thread for scraping video URLs from a page using platform-specific extractors."""
+    """Thread for scraping video URLs from a page using platform-specific extractors.
+
+    Playlist entries are emitted through ``batch`` as yt-dlp pages through
+    them; ``finished`` then carries the complete list (which is all a cache
+    hit emits).
+    """
 
+    batch = pyqtSignal(list)
     finished = pyqtSignal(list)
     error = pyqtSignal(str)
 
-    def __init__(self, url, cookies_from_browser=None):
+    def __init__(self, url, cookies_from_browser=None, cache=None, refresh=False, sync_state=None, resume=None):
         super().__init__()
         self.url = url
         self.cookies_from_browser = cookies_from_browser
+        # Optional extractors.FetchCache; refresh=True bypasses it
+        self.cache = cache
+        self.refresh = refresh
+        self.from_cache = False
+        # Optional extractors.SyncState: list only entries newer than the
+        # last sync.  sync_ids holds the new entries' IDs, newest first, for
+        # the caller to record once they are queued.
+        self.sync_state = sync_state
+        self.sync_ids = []
+        # Checkpoint: the entries listed so far.  A fetch that failed part-way
+        # (e.g. on a bot check) hands them to its retry as *resume*, which
+        # lists only what follows them instead of starting over.
+        self.videos = list(resume or [])
 
     def run(self):
         try:
             if self.isInterruptionRequested():
                 return
 
-            extractor = get_extractor(
-                self.url,
-                cookies_from_browser=self.cookies_from_browser,
-            )
-
-            if self.isInterruptionRequested():
-                return
-
-            videos = extractor.extract_info()
+            if self.sync_state is not None:
+                videos = self._extract(self.sync_state.known_ids(self.url))
+                self.sync_ids = [video_id(video) for video in videos]
+            elif self.cache is not None:
+                videos, self.from_cache = self.cache.fetch(
+                    self.url, self.cookies_from_browser, self._extract, refresh=self.refresh,
+                )
+            else:
+                videos = self._extract()
 
             if not self.isInterruptionRequested():
                 self.finished.emit(videos)
@@ -43,11 +68,39 @@ class URLScraperThread(QThread):
             if not self.isInterruptionRequested():
                 self.error.emit(f"Error scraping URL: {str(e)}")
 
+    def _extract(self, stop_at=None):
+        extractor = get_extractor(
+            self.url,
+            cookies_from_browser=self.cookies_from_browser,
+        )
+        videos = self.videos
+        # The listing may have shifted since the checkpoint (a new upload
+        # pushes everything down one place): drop entries already listed.
+        seen = {video_id(video) for video in videos}
+        for batch in extractor.iter_video_batches(FETCH_BATCH_SIZE, stop_at=stop_at, start=len(videos)):
+            if self.isInterruptionRequested():
+                raise _FetchInterrupted()
+            batch = [video for video in batch if video_id(video) not in seen]
+            if batch:
+                videos.extend(batch)
+                self.batch.emit(batch)
+        return list(videos)
+
 
 class DownloadThread(QThread):
-    """Thread for downloading videos/audio using platform-specific extractors."""
+    """Thread for downloading videos/audio using platform-specific extractors.
+
+    The per-item work and worker-pool scheduling live in
+    :class:`downloader.DownloadEngine`; this class adapts its callbacks to Qt
+    signals and cooperative interruption.
+    """
 
     progress = pyqtSignal(str, int)
+    # Structured per-job progress (see downloader.progress.progress_snapshot),
+    # coalesced to at most progress_rate_hz updates per job
+    job_progress = pyqtSignal(dict)
+    # (stage, item index): an item finished 'extract', 'transfer' or 'postprocess'
+    stage_done = pyqtSignal(str, int)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
@@ -74,185 +127,58 @@ class DownloadThread(QThread):
         denoise_video_audio=False,
         fetch_lyrics_flag=False,
         save_lrc=False,
+        max_workers=DEFAULT_MAX_PARALLEL_DOWNLOADS,
+        per_host_limit=DEFAULT_PER_HOST_DOWNLOADS,
+        job_store=None,
+        batch_id=None,
+        archive=None,
+        lyrics_cache=None,
+        progress_rate_hz=DEFAULT_PROGRESS_RATE_HZ,
+        governor=None,
+        fragment_tuner=None,
     ):
         super().__init__()
         self.urls = urls
-        self.output_path = output_path
-        self.format_type = format_type
-        self.video_quality = video_quality
-        self.video_container = video_container
-        self.audio_codec = audio_codec
-        self.audio_quality = audio_quality
-        self.download_subs = download_subs
-        self.embed_thumbnail = embed_thumbnail
-        self.normalize_audio = normalize_audio
-        self.denoise_audio = denoise_audio
-        self.dynamic_normalization = dynamic_normalization
-        self.filename_template = filename_template or '%(title)s.%(ext)s'
-        self.cookies_from_browser = cookies_from_browser
-        self.denoise_video = denoise_video
-        self.stabilize_video = stabilize_video
-        self.sharpen_video = sharpen_video
-        self.normalize_video_audio = normalize_video_audio
-        self.denoise_video_audio = denoise_video_audio
-        self.fetch_lyrics_flag = fetch_lyrics_flag
-        self.save_lrc = save_lrc
-
-    def progress_hook(self, d):
-        if self.isInterruptionRequested():
-            raise Exception("Download cancelled")
-
-        if d['status'] == 'downloading':
-            percent = 0
-
-            if '_percent_str' in d:
-                try:
-                    percent_str = d['_percent_str'].strip().replace('%', '')
-                    percent = float(percent_str)
-                except (ValueError, AttributeError):
-                    pass
-
-            if percent == 0 and 'downloaded_bytes' in d and 'total_bytes' in d and d['total_bytes']:
-                try:
-                    percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                except (ZeroDivisionError, TypeError):
-                    pass
-
-            if percent == 0 and 'downloaded_bytes' in d and 'total_bytes_estimate' in d and d['total_bytes_estimate']:
-                try:
-                    percent = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
-                except (ZeroDivisionError, TypeError):
-                    pass
-
-            filename = d.get('filename', d.get('_filename', 'Downloading...'))
-            if filename and len(filename) > 50:
-                filename = '...' + filename[-47:]
-
-            self.progress.emit(filename, max(0, min(100, int(percent))))
-
-        elif d['status'] == 'finished':
-            self.progress.emit('Post-processing...', 100)
-
-    def _get_filepath(self, info: dict) -> str | None:
-        """Return the final post-processed file path from a yt-dlp info dict."""
-        requested = info.get('requested_downloads') or []
-        if requested:
-            return requested[0].get('filepath')
-        return info.get('filepath') or info.get('_filename')
-
-    def _find_lrc_sidecar(self, audio_filepath: str) -> str | None:
-        """Return the path of a .lrc file written alongside *audio_filepath*, if any.
-
-        yt-dlp names subtitle files as ``{stem}.{lang}.lrc``; we scan the
-        parent directory for any ``.lrc`` file whose stem starts with the
-        audio file stem to handle language-code suffixes robustly.
-        """
-        audio_path = Path(audio_filepath)
-        stem = audio_path.stem
-        parent = audio_path.parent
-        try:
-            for candidate in parent.iterdir():
-                if candidate.suffix == '.lrc' and candidate.stem.startswith(stem):
-                    return str(candidate)
-        except OSError:
-            pass
-        return None
-
-    def _handle_lyrics(self, url: str, info: dict, audio_filepath: str) -> None:
-        """Fetch and embed lyrics for a completed audio download."""
-        if not self.fetch_lyrics_flag:
-            return
-        if not is_music_track(info):
-            return
-
-        synced: str | None = None
-        plain: str | None = None
-
-        # Phase 1 — use the .lrc sidecar that yt-dlp wrote for YouTube Music.
-        lrc_path = self._find_lrc_sidecar(audio_filepath)
-        if lrc_path:
-            try:
-                synced = Path(lrc_path).read_text(encoding='utf-8')
-                if not self.save_lrc:
-                    os.remove(lrc_path)
-            except OSError:
-                synced = None
-
-        # Phase 2 — LRCLIB API for all other platforms (or as a fallback).
-        if not synced and not plain:
-            track = info.get('track') or info.get('title') or ''
-            artist = (
-                info.get('artist')
-                or info.get('creator')
-                or info.get('uploader')
-                or ''
-            )
-            album = info.get('album') or ''
-            duration = info.get('duration')
-            synced, plain = fetch_lyrics(track, artist, album, duration)
-
-        if not synced and not plain:
-            return
-
-        embed_lyrics(audio_filepath, synced_lrc=synced, plain_text=plain)
-
-        if self.save_lrc and synced and not lrc_path:
-            save_lrc_file(audio_filepath, synced)
+        self.engine = DownloadEngine(
+            urls,
+            output_path,
+            format_type,
+            video_quality=video_quality,
+            audio_codec=audio_codec,
+            audio_quality=audio_quality,
+            download_subs=download_subs,
+            embed_thumbnail=embed_thumbnail,
+            normalize_audio=normalize_audio,
+            denoise_audio=denoise_audio,
+            dynamic_normalization=dynamic_normalization,
+            filename_template=filename_template,
+            cookies_from_browser=cookies_from_browser,
+            video_container=video_container,
+            denoise_video=denoise_video,
+            stabilize_video=stabilize_video,
+            sharpen_video=sharpen_video,
+            normalize_video_audio=normalize_video_audio,
+            denoise_video_audio=denoise_video_audio,
+            fetch_lyrics_flag=fetch_lyrics_flag,
+            save_lrc=save_lrc,
+            max_workers=max_workers,
+            per_host_limit=per_host_limit,
+            on_progress=self.progress.emit,
+            on_job_progress=self.job_progress.emit,
+            progress_rate_hz=progress_rate_hz,
+            governor=governor,
+            fragment_tuner=fragment_tuner,
+            should_stop=self.isInterruptionRequested,
+            on_stage_done=lambda stage, idx, _url: self.stage_done.emit(stage, idx),
+            job_store=job_store,
+            batch_id=batch_id,
+            archive=archive,
+            lyrics_cache=lyrics_cache,
+        )
 
     def run(self):
-        successful = 0
-        failed = 0
-        failed_urls = []
-
-        for idx, url in enumerate(self.urls, 1):
-            if self.isInterruptionRequested():
-                break
-            try:
-                extractor = get_extractor(url, cookies_from_browser=self.cookies_from_browser)
-
-                ydl_opts = extractor.get_download_opts(
-                    self.output_path,
-                    self.filename_template,
-                    self.format_type,
-                    self.video_quality,
-                    self.audio_codec,
-                    self.audio_quality,
-                    self.download_subs,
-                    self.embed_thumbnail,
-                    self.normalize_audio,
-                    self.denoise_audio,
-                    self.dynamic_normalization,
-                    self.video_container,
-                    self.denoise_video,
-                    self.stabilize_video,
-                    self.sharpen_video,
-                    self.normalize_video_audio,
-                    self.denoise_video_audio,
-                    fetch_lyrics=self.fetch_lyrics_flag,
-                )
-
-                ydl_opts['progress_hooks'] = [self.progress_hook]
-
-                self.progress.emit(f'Downloading {idx}/{len(self.urls)}...', 0)
-
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=True)
-
-                if self.format_type == 'audio' and info:
-                    filepath = self._get_filepath(info)
-                    if filepath:
-                        self.progress.emit('Fetching lyrics...', 100)
-                        self._handle_lyrics(url, info, filepath)
-
-                successful += 1
-
-            except Exception as e:
-                if self.isInterruptionRequested():
-                    break
-                failed += 1
-                failed_urls.append((url, str(e)))
-                self.progress.emit(f'Failed {idx}/{len(self.urls)}, continuing...', 0)
-                continue
+        successful, failed_urls = self.engine.run()
+        failed = len(failed_urls)
 
         if self.isInterruptionRequested():
             self.finished.emit(
@@ -262,8 +188,14 @@ class DownloadThread(QThread):
             )
             return
 
-        if failed == 0:
-            self.finished.emit(f"All {successful} downloads completed successfully!")
+        skipped = self.engine.skipped
+        if failed == 0 and successful == 0 and skipped:
+            self.finished.emit(f"All {skipped} item(s) were already downloaded; nothing to do.")
+        elif failed == 0:
+            message = f"All {successful} downloads completed successfully!"
+            if skipped:
+                message += f"\n{skipped} already-downloaded item(s) skipped."
+            self.finished.emit(message + self._lyrics_note())
         elif successful == 0:
             error_msg = f"All {failed} downloads failed.\n\nErrors:\n"
             for url, err in failed_urls[:3]:
@@ -273,4 +205,8 @@ class DownloadThread(QThread):
             message = f"Completed with mixed results:\n✓ {successful} succeeded\n✗ {failed} failed"
             if failed_urls:
                 message += f"\n\nFirst error: {failed_urls[0][1][:150]}"
-            self.finished.emit(message)
+            self.finished.emit(message + self._lyrics_note())
+
+    def _lyrics_note(self):
+        failed = len(self.engine.lyrics_errors)
+        return f"\n\nLyrics could not be added to {failed} file(s)." if failed else ""
@@ -1,8 +1,10 @@
 """Reusable PyQt5 widgets and pixmap helpers."""
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QAbstractListModel, QEvent, QModelIndex, Qt
 from PyQt5.QtGui import QPainter, QPainterPath, QPixmap
-from PyQt5.QtWidgets import QCheckBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+from PyQt5.QtWidgets import QHBoxLayout, QStyledItemDelegate, QVBoxLayout
+
+from video_selection import VideoSelection, format_video_row
 
 
 class FlowLayout(QVBoxLayout):
@@ -42,33 +44,77 @@ class FlowLayout(QVBoxLayout):
         self.rows = []
 
 
-class VideoCheckbox(QWidget):
-    """Checkbox with a word-wrapping label."""
+class VideoListModel(QAbstractListModel):
+    """Checkable list model over a :class:`video_selection.VideoSelection`.
+
+    Rows are rendered by the view's delegate from the video dicts on demand;
+    nothing is stored per row beyond what VideoSelection keeps.
+    """
 
-    def __init__(self, text, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 5, 0, 5)
-        layout.setSpacing(8)
+        self.selection = VideoSelection()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.selection)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return format_video_row(self.selection.videos[row], self.selection.is_archived(row))
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self.selection.is_checked(row) else Qt.Unchecked
+        if role == Qt.ToolTipRole:
+            return self.selection.videos[row].get('url')
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid():
+            return False
+        self.selection.set_checked(index.row(), value == Qt.Checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def toggle(self, row):
+        index = self.index(row)
+        self.setData(index, Qt.Unchecked if self.selection.is_checked(row) else Qt.Checked, Qt.CheckStateRole)
+
+    def append_videos(self, videos, archived=None):
+        """Insert a batch of rows with a single insert notification."""
+        if not videos:
+            return
+        start = len(self.selection)
+        self.beginInsertRows(QModelIndex(), start, start + len(videos) - 1)
+        self.selection.append(videos, archived)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.selection.clear()
+        self.endResetModel()
 
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(True)
-        layout.addWidget(self.checkbox, 0, Qt.AlignTop)
+    def set_all_checked(self, checked):
+        self.selection.set_all(checked)
+        if len(self.selection):
+            self.dataChanged.emit(self.index(0), self.index(len(self.selection) - 1), [Qt.CheckStateRole])
 
-        self.label = QLabel(text)
-        self.label.setWordWrap(True)
-        self.label.setCursor(Qt.PointingHandCursor)
-        self.label.mousePressEvent = self._on_label_click
-        layout.addWidget(self.label, 1)
+    def checked_videos(self):
+        return self.selection.checked_videos()
 
-    def _on_label_click(self, event):
-        self.checkbox.setChecked(not self.checkbox.isChecked())
 
-    def isChecked(self):
-        return self.checkbox.isChecked()
+class VideoItemDelegate(QStyledItemDelegate):
+    """Draws video rows and toggles a row's check box on a click anywhere in the row."""
 
-    def setChecked(self, checked):
-        self.checkbox.setChecked(checked)
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            model.toggle(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 def make_circular_pixmap(pixmap):
@@ -0,0 +1,88 @@
+"""Qt-free storage for the fetched-videos list and its check states.
+
+A channel can list tens of thousands of entries, so per-row cost is kept
+constant: the video dicts the extractor returned, one archived flag byte,
+and no per-row widgets or strings.  Check states are stored as a default
+plus the set of rows that differ from it, which makes Select All / Select
+None O(1) regardless of list length.
+"""
+
+from constants import SYMBOL_CHECK
+
+
+def format_duration(seconds) -> str:
+    if not seconds:
+        return "N/A"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def format_video_row(video, archived=False) -> str:
+    """Return the two-line text shown for *video* in the list."""
+    title = f"{SYMBOL_CHECK} {video['title']} (already downloaded)" if archived else video['title']
+    return f"{title}\nUploader: {video.get('uploader', 'Unknown')} | Duration: {format_duration(video.get('duration'))}"
+
+
+class VideoSelection:
+    """Fetched videos in display order, with a check state per row."""
+
+    def __init__(self):
+        self.videos = []
+        self._archived = bytearray()
+        self._archived_count = 0
+        self._default = True
+        # Rows whose check state is the opposite of _default
+        self._flipped = set()
+
+    def __len__(self):
+        return len(self.videos)
+
+    def append(self, videos, archived=None):
+        """Add *videos*; new rows start checked unless flagged in *archived*."""
+        start = len(self.videos)
+        archived = list(archived) if archived is not None else [False] * len(videos)
+        self.videos.extend(videos)
+        self._archived.extend(1 if flag else 0 for flag in archived)
+        self._archived_count += sum(1 for flag in archived if flag)
+        for row, flag in enumerate(archived, start):
+            if self._default == bool(flag):
+                self._flipped.add(row)
+
+    def clear(self):
+        self.videos = []
+        self._archived = bytearray()
+        self._archived_count = 0
+        self._default = True
+        self._flipped = set()
+
+    @property
+    def archived_count(self) -> int:
+        return self._archived_count
+
+    def is_archived(self, row) -> bool:
+        return bool(self._archived[row])
+
+    def is_checked(self, row) -> bool:
+        return (row in self._flipped) != self._default
+
+    def set_checked(self, row, checked):
+        if bool(checked) == self._default:
+            self._flipped.discard(row)
+        else:
+            self._flipped.add(row)
+
+    def set_all(self, checked):
+        self._default = bool(checked)
+        self._flipped = set()
+
+    @property
+    def checked_count(self) -> int:
+        return len(self.videos) - len(self._flipped) if self._default else len(self._flipped)
+
+    def checked_videos(self):
+        """Return the checked videos in display order."""
+        if self._default:
+            return [video for row, video in enumerate(self.videos) if row not in self._flipped]
+        return [self.videos[row] for row in sorted(self._flipped)]